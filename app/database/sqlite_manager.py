@@ -1,6 +1,7 @@
 import sqlite3
 import logging
-from typing import List, Tuple, Optional, Dict, Any
+import threading
+from typing import List, Tuple, Optional, Dict, Any, Iterator, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -8,18 +9,48 @@ class SQLiteManager:
     def __init__(self, db_name: str):
         self.db_name = db_name
         self.conn = None
+        # Set by _create_search_index when the SQLite build ships FTS5
+        self.fts_enabled = False
+        # The connection is shared across threads; serialize statements on it
+        self._lock = threading.RLock()
         self._connect()
         self._create_tables()
+        self._analyze()
 
     def _connect(self):
         try:
             self.conn = sqlite3.connect(self.db_name, check_same_thread=False)
             self.conn.row_factory = self._dict_factory
+            self._configure_connection()
             logger.info(f"Successfully connected to SQLite database: {self.db_name}")
         except sqlite3.Error as e:
             logger.error(f"Error connecting to SQLite database: {e}")
             raise
 
+    def _configure_connection(self):
+        """Use WAL so reads don't block behind writes, and relax fsyncs to once per checkpoint."""
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+
+    def _analyze(self):
+        """Refresh planner statistics at startup; analysis_limit keeps ANALYZE cheap on large tables."""
+        try:
+            self.conn.execute("PRAGMA analysis_limit=400")
+            self.conn.execute("ANALYZE")
+        except sqlite3.Error as e:
+            logger.error(f"Error analyzing database: {e}")
+
+    def optimize(self):
+        """Run PRAGMA optimize, which re-analyzes only the tables whose statistics have gone stale."""
+        try:
+            with self._lock:
+                self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.error(f"Error optimizing database: {e}")
+
     def _dict_factory(self, cursor, row):
         d = {}
         for idx, col in enumerate(cursor.description):
@@ -70,11 +101,131 @@ class SQLiteManager:
                 self._add_column_if_not_exists('articles', 'display_id', 'TEXT')
                 self._add_column_if_not_exists('articles', 'published_at', 'TIMESTAMP')
                 self._add_column_if_not_exists('articles', 'status', 'TEXT', "DEFAULT 'pulled'")
+                # Lower-cased text the non-FTS search fallback matches with a single LIKE
+                self._add_column_if_not_exists(
+                    'articles', 'search_blob', 'TEXT',
+                    "GENERATED ALWAYS AS (lower(title) || ' ' || coalesce(lower(description), '') || ' ' || coalesce(lower(ai_summary), '')) VIRTUAL"
+                )
+                
+                # Assign the user-facing display_id as part of the INSERT itself
+                self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_articles_display_id
+                AFTER INSERT ON articles
+                WHEN NEW.display_id IS NULL
+                BEGIN
+                    UPDATE articles SET display_id = 'st-n-' || NEW.id WHERE id = NEW.id;
+                END;
+                """)
+                
+                # Indexes for the list view, filters and dashboard stats
+                # (url and content_hash are already indexed by their UNIQUE constraints)
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at DESC)")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_status_created ON articles(status, created_at DESC)")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at) WHERE status = 'published'")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_activity_logs_timestamp ON activity_logs(timestamp DESC)")
+                
+                self._create_stats_counters()
+                self._create_search_index()
                 
                 logger.info("Tables and columns are up to date.")
         except sqlite3.Error as e:
             logger.error(f"Error creating/updating tables: {e}")
 
+    def _create_stats_counters(self):
+        """Maintain article totals and per-status counts with triggers so stats don't need COUNT(*) scans."""
+        counters_exist = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_counters'"
+        ).fetchone()
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        );
+        """)
+        if not counters_exist:
+            # Backfill from the existing rows before the triggers take over
+            self.conn.execute("INSERT INTO stats_counters (name, value) SELECT 'total', COUNT(*) FROM articles")
+            self.conn.execute("""
+            INSERT INTO stats_counters (name, value)
+            SELECT 'status:' || COALESCE(status, ''), COUNT(*) FROM articles GROUP BY 1
+            """)
+        
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_count_insert
+        AFTER INSERT ON articles
+        BEGIN
+            UPDATE stats_counters SET value = value + 1 WHERE name = 'total';
+            INSERT INTO stats_counters (name, value) VALUES ('status:' || COALESCE(NEW.status, ''), 1)
+                ON CONFLICT(name) DO UPDATE SET value = value + 1;
+        END;
+        """)
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_count_delete
+        AFTER DELETE ON articles
+        BEGIN
+            UPDATE stats_counters SET value = value - 1 WHERE name = 'total';
+            UPDATE stats_counters SET value = value - 1 WHERE name = 'status:' || COALESCE(OLD.status, '');
+        END;
+        """)
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_count_status
+        AFTER UPDATE OF status ON articles
+        WHEN OLD.status IS NOT NEW.status
+        BEGIN
+            UPDATE stats_counters SET value = value - 1 WHERE name = 'status:' || COALESCE(OLD.status, '');
+            INSERT INTO stats_counters (name, value) VALUES ('status:' || COALESCE(NEW.status, ''), 1)
+                ON CONFLICT(name) DO UPDATE SET value = value + 1;
+        END;
+        """)
+
+    def _create_search_index(self):
+        """Full-text index over title, description and ai_summary, kept in sync with articles by triggers."""
+        index_exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        try:
+            self.conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, description, ai_summary,
+                content='articles', content_rowid='id', tokenize='porter unicode61'
+            );
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, article search will fall back to LIKE: {e}")
+            return
+        
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_insert
+        AFTER INSERT ON articles
+        BEGIN
+            INSERT INTO articles_fts (rowid, title, description, ai_summary)
+            VALUES (NEW.id, NEW.title, NEW.description, NEW.ai_summary);
+        END;
+        """)
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_delete
+        AFTER DELETE ON articles
+        BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title, description, ai_summary)
+            VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.ai_summary);
+        END;
+        """)
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_update
+        AFTER UPDATE OF title, description, ai_summary ON articles
+        BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, title, description, ai_summary)
+            VALUES ('delete', OLD.id, OLD.title, OLD.description, OLD.ai_summary);
+            INSERT INTO articles_fts (rowid, title, description, ai_summary)
+            VALUES (NEW.id, NEW.title, NEW.description, NEW.ai_summary);
+        END;
+        """)
+        if not index_exists:
+            # Index the rows that predate the FTS table
+            self.conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+
     def _add_column_if_not_exists(self, table_name: str, column_name: str, column_type: str, extras: str = ""):
         """Utility to add a column to a table if it's not already there."""
         try:
@@ -82,7 +233,8 @@ class SQLiteManager:
             self.conn.row_factory = None
             cursor = self.conn.cursor()
             
-            cursor.execute(f"PRAGMA table_info({table_name})")
+            # table_xinfo also lists generated columns
+            cursor.execute(f"PRAGMA table_xinfo({table_name})")
             columns = [info[1] for info in cursor.fetchall()]
             
             if column_name not in columns:
@@ -97,7 +249,7 @@ class SQLiteManager:
 
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         try:
-            with self.conn:
+            with self._lock, self.conn:
                 cursor = self.conn.cursor()
                 cursor.execute(query, params)
                 return cursor.fetchall()
@@ -105,9 +257,47 @@ class SQLiteManager:
             logger.error(f"Error executing query: {e}")
             return []
 
+    def execute_query_tuples(self, query: str, params: tuple = ()) -> List[tuple]:
+        """Like execute_query but returns plain tuples, e.g. to feed two-column results straight into dict()."""
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error executing query: {e}")
+            return []
+
+    def iter_query(self, query: str, params: tuple = (), arraysize: int = 512, row_factory: Optional[Callable] = None) -> Iterator[Any]:
+        """Yields rows in fetchmany batches instead of materializing the whole result.
+
+        row_factory, when given, replaces the dict factory for this cursor only.
+        """
+        cursor = None
+        try:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.arraysize = arraysize
+                if row_factory is not None:
+                    cursor.row_factory = row_factory
+                cursor.execute(query, params)
+            while True:
+                # Only hold the lock per batch so other threads can interleave
+                with self._lock:
+                    rows = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            logger.error(f"Error iterating query: {e}")
+        finally:
+            if cursor is not None:
+                cursor.close()
+
     def execute_update(self, query: str, params: tuple = ()) -> Optional[int]:
         try:
-            with self.conn:
+            with self._lock, self.conn:
                 cursor = self.conn.cursor()
                 cursor.execute(query, params)
                 return cursor.lastrowid
@@ -115,6 +305,34 @@ class SQLiteManager:
             logger.error(f"Error executing update: {e}")
             return None
 
+    def execute_many(self, query: str, params_seq: List[tuple]) -> Optional[int]:
+        """Execute a statement for each parameter tuple in a single transaction."""
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.cursor()
+                cursor.executemany(query, params_seq)
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error executing batch update: {e}")
+            return None
+
+    def execute_many_returning(self, query: str, params_seq: List[tuple]) -> Optional[List[List[Dict[str, Any]]]]:
+        """Execute a RETURNING statement for each parameter tuple in a single transaction.
+
+        Returns the rows produced by each execution, aligned with params_seq.
+        """
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.cursor()
+                results = []
+                for params in params_seq:
+                    cursor.execute(query, params)
+                    results.append(cursor.fetchall())
+                return results
+        except sqlite3.Error as e:
+            logger.error(f"Error executing batch update: {e}")
+            return None
+
     def commit(self):
         """Commit the current transaction."""
         if self.conn:
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -31,6 +32,27 @@ from auth.login_page import show_login_page, show_logout_button
 
 logger = logging.getLogger(__name__)
 
+LOG_PAGE_SIZE = 20
+
+# Map common activity log column variations to display names
+LOG_COLUMN_MAPPING = {
+    'Time': ['Time', 'timestamp', 'created_at', 'date'],
+    'Source': ['scraper_name', 'source', 'name', 'scraper'],
+    'Status': ['status', 'state', 'result'],
+    'New Articles': ['new_articles', 'articles_count', 'count', 'articles'],
+    'Duration': ['duration', 'time_taken', 'elapsed']
+}
+LOG_QUERY_COLUMNS = sorted({col for cols in LOG_COLUMN_MAPPING.values() for col in cols})
+
+# Column configs for the activity log table, keyed by display name
+LOG_COLUMN_CONFIG = {
+    'Time': st.column_config.TextColumn('Time'),
+    'Source': st.column_config.TextColumn('Source'),
+    'Status': st.column_config.TextColumn('Status'),
+    'New Articles': st.column_config.NumberColumn('New Articles', format="%d"),
+    'Duration': st.column_config.NumberColumn('Duration', format="%.1fs")
+}
+
 # --- Page Configuration ---
 st.set_page_config(
     page_title="Startt AI News Management Dashboard",
@@ -55,6 +77,12 @@ if 'batch_queue' not in st.session_state:
     st.session_state.batch_queue = []
 if 'ui_logs' not in st.session_state:
     st.session_state.ui_logs = []
+if 'preview_article_id' not in st.session_state:
+    st.session_state.preview_article_id = None
+if 'source_article_id' not in st.session_state:
+    st.session_state.source_article_id = None
+if 'log_page' not in st.session_state:
+    st.session_state.log_page = 0
 
 # --- Enhanced CSS with Dark/Light Mode Support ---
 def get_css_theme():
@@ -616,17 +644,18 @@ def show_notifications():
 # --- Export Functions ---
 def export_to_csv(articles: List[Article]) -> str:
     """Export articles to CSV format"""
-    df = pd.DataFrame([{
-        'ID': article.display_id,
-        'Title': article.title,
-        'Source': article.source,
-        'Status': article.status.value,
-        'Quality Score': article.quality_score,
-        'Created': article.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-        'URL': article.url,
-        'Description': article.description,
-        'AI Summary': article.ai_summary
-    } for article in articles])
+    columns = Article.many_to_columnar(articles)
+    df = pd.DataFrame({
+        'ID': columns['display_id'],
+        'Title': columns['title'],
+        'Source': columns['source'],
+        'Status': columns['status'],
+        'Quality Score': columns['quality_score'],
+        'Created': pd.to_datetime(columns['created_at']).strftime('%Y-%m-%d %H:%M:%S'),
+        'URL': columns['url'],
+        'Description': columns['description'],
+        'AI Summary': columns['ai_summary']
+    })
     
     return df.to_csv(index=False)
 
@@ -729,7 +758,7 @@ def test_database_connection(db_manager: SQLiteManager):
 float_init()
 
 # --- Performance Tracking ---
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=30, show_spinner=False)
 def get_performance_metrics():
     """Get system performance metrics"""
     return {
@@ -740,6 +769,31 @@ def get_performance_metrics():
         'error_rate': 2.1
     }
 
+def format_perf_metric(metric: str, value: Any) -> str:
+    """Format a performance metric value with its unit"""
+    if metric in ('avg_processing_time', 'api_response_time'):
+        return f"{value}s"
+    if metric in ('success_rate', 'error_rate'):
+        return f"{value}%"
+    return str(value)
+
+@st.cache_resource
+def build_processing_trend_figure(dark_mode: bool):
+    """Build the 24h processing time trend chart (mock data)"""
+    hours = np.arange(24)
+    fig = px.line(
+        x=hours,
+        y=2.1 + 0.5 * (hours % 6),
+        labels={'x': 'Hour', 'y': 'Processing Time'},
+        title="24h Processing Time Trend"
+    )
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color="#ffffff" if dark_mode else "#1e293b"
+    )
+    return fig
+
 # --- Data Loading Functions ---
 @st.cache_data(ttl=60)
 def load_dashboard_data(_repository: ArticleRepository):
@@ -747,13 +801,17 @@ def load_dashboard_data(_repository: ArticleRepository):
 
 @st.cache_data(ttl=30)
 def load_articles(_repository: ArticleRepository, filters: Dict[str, Any]):
-    articles = _repository.get_articles(**filters)
+    articles = _repository.get_articles_list(**filters)
     # Convert Article objects to dictionaries for caching
     return [article.to_dict() for article in articles]
 
-@st.cache_data(ttl=300)
-def load_activity_logs(_repository: ArticleRepository, limit: int = 100):
-    return _repository.get_activity_logs(limit)
+@st.cache_data(ttl=30, show_spinner=False)
+def load_activity_logs(_repository: ArticleRepository, limit: int = 100, offset: int = 0, columns: Optional[List[str]] = None):
+    return _repository.get_activity_logs(limit, offset, columns)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def count_activity_logs(_repository: ArticleRepository):
+    return _repository.count_activity_logs()
 
 # --- Helper Functions ---
 def update_article_status(article_ids: List[int], status: ArticleStatus, _repository: ArticleRepository):
@@ -822,11 +880,13 @@ def show_bulk_edit_dialog(article_ids: List[int], _repository: ArticleRepository
         if st.button("✅ Apply Changes", type="primary", use_container_width=True):
             # Apply bulk changes
             changes_made = 0
+            status_change_ids = []
+            articles_by_id = _repository.get_articles_by_ids(article_ids)
             for article_id in article_ids:
-                article = _repository.get_article_by_id(article_id)
+                article = articles_by_id.get(article_id)
                 if article:
                     if new_status and new_status != article.status.value:
-                        _repository.update_article_status([article_id], ArticleStatus(new_status))
+                        status_change_ids.append(article_id)
                         changes_made += 1
                     
                     if quality_adjustment != 0:
@@ -838,6 +898,9 @@ def show_bulk_edit_dialog(article_ids: List[int], _repository: ArticleRepository
                         # Update summary (would need repository method)
                         changes_made += 1
             
+            if status_change_ids:
+                _repository.update_article_status(status_change_ids, ArticleStatus(new_status))
+            
             add_notification(f"Applied bulk changes to {changes_made} articles", "success")
             if 'dialog' in st.session_state:
                 del st.session_state.dialog
@@ -873,9 +936,10 @@ def enhance_articles_with_ai(article_ids: List[int], _repository: ArticleReposit
 
         total_articles = len(article_ids)
         enhanced_count = 0
+        articles_by_id = _repository.get_articles_by_ids(article_ids)
         
         for i, article_id in enumerate(article_ids):
-            article = _repository.get_article_by_id(article_id)
+            article = articles_by_id.get(article_id)
             if article:
                 status_text.markdown(f"<div style='text-align: center;'>✨ Enhancing: <strong>{article.title[:50]}...</strong> ({i+1}/{total_articles})</div>", unsafe_allow_html=True)
                 try:
@@ -965,6 +1029,15 @@ def publish_articles(article_ids: List[int], _repository: ArticleRepository, _pu
     time.sleep(1)
     st.cache_data.clear()
 
+# Confirmed bulk actions: (article_ids, repository, content_service, publisher)
+ACTION_DISPATCH = {
+    "Enhance": lambda ids, r, c, p: enhance_articles_with_ai(ids, r, c),
+    "Approve": lambda ids, r, c, p: update_article_status(ids, ArticleStatus.APPROVED, r),
+    "Publish": lambda ids, r, c, p: publish_articles(ids, r, p),
+    "Reject": lambda ids, r, c, p: update_article_status(ids, ArticleStatus.REJECTED, r),
+    "Reset": lambda ids, r, c, p: update_article_status(ids, ArticleStatus.PULLED, r)
+}
+
 def run_data_pull(scraper_manager: ScraperManager, selected: List[str]):
     progress_container = st.container()
     with progress_container:
@@ -974,20 +1047,16 @@ def run_data_pull(scraper_manager: ScraperManager, selected: List[str]):
             progress_bar = st.progress(0)
             status_text = st.empty()
     
-        results = []
         total_scrapers = len(selected)
+        progress_bar.progress(0.0)
+        status_text.markdown(f"<div style='text-align: center;'>🔄 Running <strong>{total_scrapers}</strong> scrapers...</div>", unsafe_allow_html=True)
         
-        for i, scraper_name in enumerate(selected):
-            progress = (i / total_scrapers)
-            progress_bar.progress(progress)
-            status_text.markdown(f"<div style='text-align: center;'>🔄 Running <strong>{scraper_name}</strong>... ({i+1}/{total_scrapers})</div>", unsafe_allow_html=True)
-            
-            result = scraper_manager.run_scraper(scraper_name)
-            results.append(result)
-            
-            progress = ((i + 1) / total_scrapers)
-            progress_bar.progress(progress)
-            time.sleep(0.2)
+        def on_complete(done: int, scraper_name: str):
+            progress_bar.progress(done / total_scrapers)
+            status_text.markdown(f"<div style='text-align: center;'>✅ Finished <strong>{scraper_name}</strong> ({done}/{total_scrapers})</div>", unsafe_allow_html=True)
+        
+        # Scripts run concurrently; each output is processed here as it finishes
+        results = scraper_manager.run_all(selected, on_complete)
         
     progress_bar.empty()
     status_text.empty()
@@ -1126,11 +1195,11 @@ def render_article_card(article, index, selected_articles):
     
     with col1:
         if article.url and st.button("🔗 Source", key=f"source_{article.id}"):
-            st.markdown(f'<meta http-equiv="refresh" content="0; url={article.url}">', unsafe_allow_html=True)
+            st.session_state.source_article_id = article.id
     
     with col2:
         if st.button("👁️ Preview", key=f"preview_{article.id}"):
-            st.session_state[f"show_preview_{article.id}"] = True
+            st.session_state.preview_article_id = article.id
     
     with col3:
         if st.button("📝 Edit", key=f"edit_{article.id}"):
@@ -1163,22 +1232,34 @@ def render_article_card(article, index, selected_articles):
                     st.session_state[f"edit_mode_{article.id}"] = False
                     st.rerun()
 
-    # Show preview if requested
-    if st.session_state.get(f"show_preview_{article.id}", False):
-        with st.expander("📖 Article Preview", expanded=True):
-            st.markdown(f"**Title:** {article.title}")
-            st.markdown(f"**Source:** {article.source}")
-            st.markdown(f"**Quality Score:** {article.quality_score}%")
-            st.markdown(f"**Status:** {article.status.value}")
-            if article.description:
-                st.markdown(f"**Description:** {article.description}")
-            if article.ai_summary:
-                st.markdown(f"**AI Summary:** {article.ai_summary}")
-            if st.button("❌ Close Preview", key=f"close_preview_{article.id}"):
-                st.session_state[f"show_preview_{article.id}"] = False
-
     return is_selected
 
+def render_article_preview(articles):
+    """Render the preview panel and source redirect for the selected article"""
+    articles_by_id = {article.id: article for article in articles}
+
+    source_article = articles_by_id.get(st.session_state.source_article_id)
+    if source_article:
+        st.session_state.source_article_id = None
+        st.markdown(f'<meta http-equiv="refresh" content="0; url={source_article.url}">', unsafe_allow_html=True)
+
+    article = articles_by_id.get(st.session_state.preview_article_id)
+    if not article:
+        return
+
+    with st.expander("📖 Article Preview", expanded=True):
+        st.markdown(f"**Title:** {article.title}")
+        st.markdown(f"**Source:** {article.source}")
+        st.markdown(f"**Quality Score:** {article.quality_score}%")
+        st.markdown(f"**Status:** {article.status.value}")
+        if article.description:
+            st.markdown(f"**Description:** {article.description}")
+        if article.ai_summary:
+            st.markdown(f"**AI Summary:** {article.ai_summary}")
+        if st.button("❌ Close Preview", key="close_preview"):
+            st.session_state.preview_article_id = None
+            st.rerun()
+
 def get_svg_with_height(svg_content: str, height: int):
     """Modify SVG to have a specific height."""
     import re
@@ -1212,6 +1293,605 @@ def render_svg(svg_file, height=30):
     except Exception as e:
         st.error(f"Error rendering SVG: {e}")
 
+@st.fragment
+def show_overview_tab(stats: Dict[str, Any]):
+    """Render the dashboard metrics and charts"""
+    # Dashboard customization
+    st.markdown("### Dashboard Layout")
+    layout_col1, layout_col2 = st.columns([3, 1])
+    
+    with layout_col2:
+        dashboard_layout = st.selectbox(
+            "Layout",
+            ["Default", "Compact", "Detailed"],
+            index=0
+        )
+    
+    # Metrics Row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    metrics_data = [
+        ("Total Articles", stats.get('total_articles', 0), "#6366f1", "#5558e3"),
+        ("New Today", stats.get('status_counts', {}).get('pulled', 0), "#f59e0b", "#dc2626"),
+        ("Approved", stats.get('status_counts', {}).get('approved', 0), "#8b5cf6", "#7c3aed"),
+        ("Published", stats.get('status_counts', {}).get('published', 0), "#10b981", "#059669")
+    ]
+    
+    for col, (label, value, color1, color2) in zip([col1, col2, col3, col4], metrics_data):
+        with col:
+            st.markdown(f'''
+            <div class="metric-card" style="background: linear-gradient(135deg, {color1} 0%, {color2} 100%);">
+                <div class="metric-label">{label}</div>
+                <div class="metric-value">{value:,}</div>
+            </div>
+            ''', unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Charts Row
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if stats.get('source_counts'):
+            st.subheader("📊 Content by Source")
+            source_df = pd.DataFrame(list(stats['source_counts'].items()), columns=['Source', 'Articles'])
+            fig = px.bar(
+                source_df.nlargest(10, 'Articles'), 
+                x='Articles', 
+                y='Source',
+                orientation='h',
+                color='Articles',
+                color_continuous_scale='Blues',
+                height=400
+            )
+            fig.update_layout(
+                showlegend=False,
+                xaxis_title="Number of Articles",
+                yaxis_title="",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        if stats.get('status_counts'):
+            st.subheader("📈 Article Pipeline")
+            status_df = pd.DataFrame(list(stats['status_counts'].items()), columns=['Status', 'Count'])
+            fig = px.funnel(
+                status_df,
+                y='Status',
+                x='Count',
+                color='Status',
+                color_discrete_map={
+                    'pulled': '#3b82f6', 
+                    'approved': '#8b5cf6',
+                    'published': '#10b981', 
+                    'rejected': '#ef4444'
+                },
+                height=400
+            )
+            fig.update_layout(
+                showlegend=False,
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Activity Timeline
+    st.subheader("📅 7-Day Activity Timeline")
+    activity_df = get_article_activity("news_database.db")
+    if not activity_df.empty:
+        fig = px.line(
+            activity_df,
+            x='date',
+            y='count',
+            color='activity',
+            markers=True,
+            height=300
+        )
+        fig.update_layout(
+            xaxis_title="",
+            yaxis_title="Articles",
+            legend_title="Activity Type",
+            hovermode='x unified',
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def show_analytics_tab(repository, stats: Dict[str, Any]):
+    """Render analytics, system performance and the activity log"""
+    st.subheader("📈 Analytics & Insights")
+    
+    # Performance Metrics Row
+    metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+    
+    with metric_col1:
+        approval_rate = (stats.get('status_counts', {}).get('approved', 0) / 
+                       max(stats.get('total_articles', 1), 1) * 100)
+        st.metric("Approval Rate", f"{approval_rate:.1f}%")
+    
+    with metric_col2:
+        publish_rate = (stats.get('status_counts', {}).get('published', 0) / 
+                      max(stats.get('status_counts', {}).get('approved', 1), 1) * 100)
+        st.metric("Publish Rate", f"{publish_rate:.1f}%")
+    
+    with metric_col3:
+        avg_quality = 75  # Calculate from actual data
+        st.metric("Avg Quality", f"{avg_quality}%")
+    
+    with metric_col4:
+        sources_active = len(stats.get('source_counts', {}))
+        st.metric("Active Sources", sources_active)
+    
+    # Enhanced Performance Metrics
+    st.subheader("🚀 System Performance")
+    perf_metrics = get_performance_metrics()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        md_lines = ["**Processing Metrics**"]
+        for metric, value in perf_metrics.items():
+            md_lines.append(f"**{metric.replace('_', ' ').title()}:** {format_perf_metric(metric, value)}")
+        st.markdown("\n\n".join(md_lines))
+    
+    with col2:
+        # Processing time trend (mock data)
+        st.plotly_chart(
+            build_processing_trend_figure(st.session_state.dark_mode),
+            use_container_width=True
+        )
+    
+    # Activity Logs
+    logs_header_col, logs_refresh_col = st.columns([5, 1])
+    with logs_header_col:
+        st.subheader("📋 Recent Activity")
+    with logs_refresh_col:
+        if st.button("🔄 Refresh", key="refresh_activity_logs", use_container_width=True):
+            load_activity_logs.clear()
+            count_activity_logs.clear()
+    
+    total_logs = count_activity_logs(repository)
+    last_page = max((total_logs - 1) // LOG_PAGE_SIZE, 0)
+    st.session_state.log_page = min(st.session_state.log_page, last_page)
+    logs = load_activity_logs(
+        repository,
+        limit=LOG_PAGE_SIZE,
+        offset=st.session_state.log_page * LOG_PAGE_SIZE,
+        columns=LOG_QUERY_COLUMNS
+    )
+    if logs:
+        # Convert to DataFrame for better display
+        logs_df = pd.DataFrame.from_records(logs).convert_dtypes(dtype_backend='pyarrow')
+        
+        # Debug: Show available columns
+        if st.checkbox("🐞 Debug: Show available columns", value=False):
+            st.write("Available columns:", list(logs_df.columns))
+            st.write("Sample data:", logs_df.head() if not logs_df.empty else "No data")
+        
+        if not logs_df.empty:
+            # Format timestamps if available
+            timestamp_cols = [col for col in logs_df.columns if 'time' in col.lower()]
+            if timestamp_cols:
+                time_col = timestamp_cols[0]
+                ts = pd.to_datetime(logs_df[time_col], errors='coerce', utc=True, cache=True)
+                logs_df['Time'] = (
+                    ts.dt.strftime('%b %d, %H:%M')
+                    .where(ts.notna(), logs_df[time_col].astype('string'))
+                    .astype('string[pyarrow]')
+                )
+            
+            # Determine which columns to show based on what's available
+            available_cols = list(logs_df.columns)
+            available_set = set(available_cols)
+            display_cols = []
+            column_config = {}
+            
+            for display_name, possible_cols in LOG_COLUMN_MAPPING.items():
+                col = next((c for c in possible_cols if c in available_set), None)
+                if col:
+                    display_cols.append(col)
+                    column_config[col] = LOG_COLUMN_CONFIG[display_name]
+            
+            # Display the table
+            if display_cols:
+                st.dataframe(
+                    logs_df[display_cols],
+                    column_config=column_config,
+                    column_order=display_cols,
+                    hide_index=True,
+                    use_container_width=True,
+                    height=400
+                )
+            else:
+                st.info("No suitable columns found for display")
+
+            # Pagination controls
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                if st.button("⬅ Prev", key="logs_prev", disabled=st.session_state.log_page == 0):
+                    st.session_state.log_page -= 1
+                    st.rerun(scope="fragment")
+            with page_col:
+                st.caption(f"Page {st.session_state.log_page + 1} of {last_page + 1} ({total_logs} entries)")
+            with next_col:
+                if st.button("Next ➡", key="logs_next", disabled=st.session_state.log_page >= last_page):
+                    st.session_state.log_page += 1
+                    st.rerun(scope="fragment")
+        else:
+            st.info("No activity logs available")
+    else:
+        st.info("📭 No recent activity to display. Try running some data pulls or performing bulk operations!")
+
+@st.fragment
+def show_settings_tab(config: Settings, stats: Dict[str, Any]):
+    """Render the settings panels"""
+    st.subheader("⚙️ System Configuration")
+    
+    # User Preferences
+    with st.expander("👤 User Preferences", expanded=True):
+        st.markdown("**Theme & Display**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            theme_mode = st.selectbox(
+                "Theme",
+                ["Dark Mode", "Light Mode", "Auto"],
+                index=0 if st.session_state.dark_mode else 1
+            )
+            # Theme CSS is injected at the top of the script, so this needs a full app rerun
+            if theme_mode == "Dark Mode" and not st.session_state.dark_mode:
+                st.session_state.dark_mode = True
+                st.rerun()
+            elif theme_mode == "Light Mode" and st.session_state.dark_mode:
+                st.session_state.dark_mode = False
+                st.rerun()
+        
+        with col2:
+            default_view = st.selectbox(
+                "Default Article View",
+                ["Card View", "Compact View", "Table View"],
+                index=0
+            )
+        
+        st.markdown("**Notifications**")
+        enable_notifications = st.checkbox(
+            "Enable System Notifications",
+            value=st.session_state.user_preferences['notifications_enabled']
+        )
+        
+        notification_types = st.multiselect(
+            "Notification Types",
+            ["New Articles", "Status Changes", "Errors", "Completions"],
+            default=["New Articles", "Errors"]
+        )
+    
+    # API Configuration
+    with st.expander("🔑 API Configuration"):
+        gemini_key = st.text_input(
+            "Gemini API Key", 
+            value=config.get('ai.gemini_api_key', ''), 
+            type="password",
+            help="Your Google Gemini API key for AI enhancements"
+        )
+        
+        api_endpoint = st.text_input(
+            "Publishing API Endpoint", 
+            value=config.get('publishing.custom_api.endpoint', ''),
+            help="Your custom API endpoint for publishing articles"
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            api_timeout = st.number_input(
+                "API Timeout (seconds)",
+                value=30,
+                min_value=5,
+                max_value=300
+            )
+        with col2:
+            retry_attempts = st.number_input(
+                "Retry Attempts",
+                value=3,
+                min_value=1,
+                max_value=10
+            )
+    
+    # AI Settings
+    with st.expander("🤖 AI Configuration"):
+        ai_model = st.selectbox(
+            "AI Model",
+            ["gemini-1.5-flash", "gemini-1.5-pro"],
+            index=0
+        )
+        
+        similarity_threshold = st.slider(
+            "Deduplication Threshold",
+            min_value=0.5,
+            max_value=1.0,
+            value=0.85,
+            step=0.05,
+            help="Higher values mean stricter deduplication"
+        )
+        
+        quality_threshold = st.slider(
+            "Quality Threshold",
+            min_value=0,
+            max_value=100,
+            value=60,
+            help="Minimum quality score for articles"
+        )
+        
+        # Article Templates
+        st.markdown("**Article Templates**")
+        template_name = st.selectbox(
+            "Publishing Template",
+            ["Standard", "Social Media", "Newsletter", "Blog Post"],
+            index=0
+        )
+        
+        if template_name == "Social Media":
+            st.text_area("Template", value="📰 {title}\n\n{summary}\n\n🔗 {url}", height=100)
+        elif template_name == "Newsletter":
+            st.text_area("Template", value="## {title}\n\n{summary}\n\n[Read More]({url})", height=100)
+    
+    # Database Settings
+    with st.expander("💾 Database"):
+        st.info("Database configuration is managed through the config file.")
+        st.code(f"""
+Database Type: {config.get('database.type', 'sqlite')}
+Database Name: news_database.db
+Status: Connected ✅
+Records: {stats.get('total_articles', 0)} articles
+        """)
+    
+    # Save Configuration
+    if st.button("💾 Save Configuration", type="primary", use_container_width=True):
+        # Update user preferences
+        st.session_state.user_preferences['notifications_enabled'] = enable_notifications
+        st.session_state.user_preferences['default_view'] = default_view
+        add_notification("Configuration saved successfully!", "success")
+
+def show_articles_tab(repository, article_filters: Dict[str, Any], quality_range):
+    """Render the article list, exports and bulk action panel"""
+    # Article Management Header
+    header_col1, header_col2, header_col3 = st.columns([2, 1, 1])
+    
+    with header_col1:
+        st.subheader("📰 Article Management")
+    
+    with header_col2:
+        view_mode = st.selectbox(
+            "View",
+            ["Card View", "Compact View", "Table View"],
+            index=0,
+            label_visibility="collapsed"
+        )
+    
+    with header_col3:
+        sort_by = st.selectbox(
+            "Sort by",
+            ["Newest First", "Oldest First", "Quality Score", "Source"],
+            index=0,
+            label_visibility="collapsed"
+        )
+    
+    # Load articles with enhanced filters
+    article_dicts = load_articles(repository, article_filters)
+    articles = Article.from_records(article_dicts)
+    
+    # Apply quality filter
+    articles = [a for a in articles if quality_range[0] <= a.quality_score <= quality_range[1]]
+
+    if not articles:
+        st.info("📭 No articles found. Try adjusting your filters or pulling fresh data!")
+    else:
+        # Export functionality
+        export_col1, export_col2, export_col3 = st.columns([1, 1, 2])
+        
+        with export_col1:
+            if st.button("📥 Export CSV"):
+                csv_data = export_to_csv(articles)
+                st.download_button(
+                    label="Download CSV",
+                    data=csv_data,
+                    file_name=f"articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv"
+                )
+        
+        with export_col2:
+            if st.button("📄 Export Selected"):
+                selected_articles = [a for a in articles if a.id in st.session_state.get('selected_articles', [])]
+                if selected_articles:
+                    csv_data = export_to_csv(selected_articles)
+                    st.download_button(
+                        label="Download Selected",
+                        data=csv_data,
+                        file_name=f"selected_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    add_notification("No articles selected for export", "warning")
+        
+        # Create layout with sticky action panel
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.write(f"Showing **{len(articles)}** articles")
+            
+            # Select all checkbox
+            select_all = st.checkbox("Select All", key="select_all_articles")
+            
+            # Initialize selected articles in session state
+            if 'selected_articles' not in st.session_state:
+                st.session_state.selected_articles = []
+            
+            selected_articles = st.session_state.selected_articles if not select_all else [article.id for article in articles]
+            
+            # Render articles based on view mode
+            if view_mode == "Table View":
+                # Table view
+                article_data = []
+                for article in articles:
+                    article_data.append({
+                        'Select': st.checkbox("", key=f"table_select_{article.id}", value=article.id in selected_articles),
+                        'Title': article.title[:50] + "..." if len(article.title) > 50 else article.title,
+                        'Source': article.source,
+                        'Status': article.status.value,
+                        'Quality': f"{article.quality_score}%",
+                        'Date': article.created_at.strftime('%m/%d/%Y')
+                    })
+                
+                if article_data:
+                    st.dataframe(
+                        pd.DataFrame(article_data),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+            else:
+                # Card/Compact view
+                for idx, article in enumerate(articles):
+                    with st.container():
+                        is_selected = render_article_card(article, idx, selected_articles)
+                        
+                        # Update selected articles list
+                        if is_selected and article.id not in st.session_state.selected_articles:
+                            st.session_state.selected_articles.append(article.id)
+                        elif not is_selected and article.id in st.session_state.selected_articles:
+                            st.session_state.selected_articles.remove(article.id)
+
+                render_article_preview(articles)
+
+        with col2:
+            # Enhanced action panel with better visibility
+            st.markdown(f'''
+            <div class="action-panel">
+                <h3>⚡ Bulk Actions</h3>
+            </div>
+            ''', unsafe_allow_html=True)
+            
+            selected_count = len(st.session_state.get('selected_articles', []))
+            
+            if selected_count > 0:
+                st.success(f"**{selected_count}** articles selected")
+            else:
+                st.info("Select articles to perform actions")
+            
+            st.markdown("---")
+            
+            # Bulk Edit Mode
+            if st.button(
+                "✏️ Bulk Edit Mode", 
+                disabled=not selected_count,
+                use_container_width=True,
+                help="Edit multiple articles at once"
+            ):
+                st.session_state.dialog = {
+                    "name": "bulk_edit",
+                    "props": {
+                        "article_ids": st.session_state.get('selected_articles', [])
+                    }
+                }
+                st.rerun()
+            
+            # AI Enhancement
+            if st.button(
+                "✨ Enhance with AI", 
+                disabled=not selected_count,
+                use_container_width=True,
+                help="Generate AI summaries and improve content"
+            ):
+                st.session_state.action = "Enhance"
+                st.session_state.dialog = {
+                    "name": "confirm",
+                    "props": {
+                        "action_name": "Enhance with AI",
+                        "item_count": selected_count
+                    }
+                }
+                st.rerun()
+            
+            # Status Actions
+            st.markdown("**Update Status:**")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button(
+                    "✅ Approve", 
+                    disabled=not selected_count,
+                    use_container_width=True
+                ):
+                    st.session_state.action = "Approve"
+                    st.session_state.dialog = {
+                        "name": "confirm",
+                        "props": {
+                            "action_name": "Approve",
+                            "item_count": selected_count
+                        }
+                    }
+                    st.rerun()
+            
+            with col2:
+                if st.button(
+                    "❌ Reject", 
+                    disabled=not selected_count,
+                    use_container_width=True
+                ):
+                    st.session_state.action = "Reject"
+                    st.session_state.dialog = {
+                        "name": "confirm",
+                        "props": {
+                            "action_name": "Reject",
+                            "item_count": selected_count
+                        }
+                    }
+                    st.rerun()
+            
+            # Publishing
+            st.markdown("---")
+            if st.button(
+                "🚀 Publish", 
+                disabled=not selected_count,
+                use_container_width=True,
+                type="primary",
+                help="Publish to configured platforms"
+            ):
+                st.session_state.action = "Publish"
+                # Store selected article IDs in session state
+                st.session_state.selected_articles = [article.id for article in articles if st.session_state.get(f"select_{article.id}", False)]
+                st.session_state.dialog = {
+                    "name": "confirm",
+                    "props": {
+                        "action_name": "Publish",
+                        "item_count": selected_count
+                    }
+                }
+                st.rerun()
+            
+            # Reset
+            if st.button(
+                "🔄 Reset Status", 
+                disabled=not selected_count,
+                use_container_width=True,
+                help="Reset to 'New' status"
+            ):
+                st.session_state.action = "Reset"
+                # Store selected article IDs in session state
+                st.session_state.selected_articles = [article.id for article in articles if st.session_state.get(f"select_{article.id}", False)]
+                st.session_state.dialog = {
+                    "name": "confirm",
+                    "props": {
+                        "action_name": "Reset",
+                        "item_count": selected_count
+                    }
+                }
+                st.rerun()
+
 def show_dashboard(system_components: Dict[str, Any]):
     """Show the main dashboard content"""
     # Unpack system components
@@ -1231,7 +1911,7 @@ def show_dashboard(system_components: Dict[str, Any]):
         if dialog_info['name'] == 'confirm':
             show_confirmation_dialog(**dialog_info['props'])
         elif dialog_info['name'] == 'bulk_edit':
-            show_bulk_edit_dialog(repository=repository, **dialog_info['props'])
+            show_bulk_edit_dialog(_repository=repository, **dialog_info['props'])
         return
 
     # Theme Toggle in top bar
@@ -1419,12 +2099,12 @@ def show_dashboard(system_components: Dict[str, Any]):
             st.session_state.user_preferences['notifications_enabled'] = notifications_enabled
 
             # Auto-refresh toggle
-            auto_refresh = st.checkbox("Auto-refresh (30s)", help="Automatically refresh data every 30 seconds")
-            if auto_refresh:
-                st.markdown(
-                    """<meta http-equiv="refresh" content="30">""",
-                    unsafe_allow_html=True
-                )
+            auto_refresh = st.checkbox(
+                "Auto-refresh (30s)",
+                value=st.session_state.user_preferences['auto_refresh'],
+                help="Automatically refresh the article list every 30 seconds"
+            )
+            st.session_state.user_preferences['auto_refresh'] = auto_refresh
 
     # Main Content Area
     st.markdown("""
@@ -1454,351 +2134,19 @@ def show_dashboard(system_components: Dict[str, Any]):
     
     # Dashboard Tab
     if st.session_state.active_tab == "📊 Dashboard":
-        # Dashboard customization
-        st.markdown("### Dashboard Layout")
-        layout_col1, layout_col2 = st.columns([3, 1])
-        
-        with layout_col2:
-            dashboard_layout = st.selectbox(
-                "Layout",
-                ["Default", "Compact", "Detailed"],
-                index=0
-            )
-        
-        # Metrics Row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        metrics_data = [
-            ("Total Articles", stats.get('total_articles', 0), "#6366f1", "#5558e3"),
-            ("New Today", stats.get('status_counts', {}).get('pulled', 0), "#f59e0b", "#dc2626"),
-            ("Approved", stats.get('status_counts', {}).get('approved', 0), "#8b5cf6", "#7c3aed"),
-            ("Published", stats.get('status_counts', {}).get('published', 0), "#10b981", "#059669")
-        ]
-        
-        for col, (label, value, color1, color2) in zip([col1, col2, col3, col4], metrics_data):
-            with col:
-                st.markdown(f'''
-                <div class="metric-card" style="background: linear-gradient(135deg, {color1} 0%, {color2} 100%);">
-                    <div class="metric-label">{label}</div>
-                    <div class="metric-value">{value:,}</div>
-                </div>
-                ''', unsafe_allow_html=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Charts Row
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if stats.get('source_counts'):
-                st.subheader("📊 Content by Source")
-                source_df = pd.DataFrame(list(stats['source_counts'].items()), columns=['Source', 'Articles'])
-                fig = px.bar(
-                    source_df.nlargest(10, 'Articles'), 
-                    x='Articles', 
-                    y='Source',
-                    orientation='h',
-                    color='Articles',
-                    color_continuous_scale='Blues',
-                    height=400
-                )
-                fig.update_layout(
-                    showlegend=False,
-                    xaxis_title="Number of Articles",
-                    yaxis_title="",
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            if stats.get('status_counts'):
-                st.subheader("📈 Article Pipeline")
-                status_df = pd.DataFrame(list(stats['status_counts'].items()), columns=['Status', 'Count'])
-                fig = px.funnel(
-                    status_df,
-                    y='Status',
-                    x='Count',
-                    color='Status',
-                    color_discrete_map={
-                        'pulled': '#3b82f6', 
-                        'approved': '#8b5cf6',
-                        'published': '#10b981', 
-                        'rejected': '#ef4444'
-                    },
-                    height=400
-                )
-                fig.update_layout(
-                    showlegend=False,
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Activity Timeline
-        st.subheader("📅 7-Day Activity Timeline")
-        activity_df = get_article_activity("news_database.db")
-        if not activity_df.empty:
-            fig = px.line(
-                activity_df,
-                x='date',
-                y='count',
-                color='activity',
-                markers=True,
-                height=300
-            )
-            fig.update_layout(
-                xaxis_title="",
-                yaxis_title="Articles",
-                legend_title="Activity Type",
-                hovermode='x unified',
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        show_overview_tab(stats)
 
     # Articles Tab
     elif st.session_state.active_tab == "📰 Articles":
-        # Article Management Header
-        header_col1, header_col2, header_col3 = st.columns([2, 1, 1])
-        
-        with header_col1:
-            st.subheader("📰 Article Management")
-        
-        with header_col2:
-            view_mode = st.selectbox(
-                "View",
-                ["Card View", "Compact View", "Table View"],
-                index=0,
-                label_visibility="collapsed"
-            )
-        
-        with header_col3:
-            sort_by = st.selectbox(
-                "Sort by",
-                ["Newest First", "Oldest First", "Quality Score", "Source"],
-                index=0,
-                label_visibility="collapsed"
-            )
-        
-        # Load articles with enhanced filters
         article_filters = {
             'status_filter': status_filter if status_filter != 'all' else None,
             'source_filter': source_filter if source_filter else None,
             'search_term': search_term if search_term else None,
             'limit': 200
         }
-        article_dicts = load_articles(repository, article_filters)
-        articles = [Article.from_dict(article_dict) for article_dict in article_dicts]
-        
-        # Apply quality filter
-        if 'quality_range' in locals():
-            articles = [a for a in articles if quality_range[0] <= a.quality_score <= quality_range[1]]
-
-        if not articles:
-            st.info("📭 No articles found. Try adjusting your filters or pulling fresh data!")
-        else:
-            # Export functionality
-            export_col1, export_col2, export_col3 = st.columns([1, 1, 2])
-            
-            with export_col1:
-                if st.button("📥 Export CSV"):
-                    csv_data = export_to_csv(articles)
-                    st.download_button(
-                        label="Download CSV",
-                        data=csv_data,
-                        file_name=f"articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
-            
-            with export_col2:
-                if st.button("📄 Export Selected"):
-                    selected_articles = [a for a in articles if a.id in st.session_state.get('selected_articles', [])]
-                    if selected_articles:
-                        csv_data = export_to_csv(selected_articles)
-                        st.download_button(
-                            label="Download Selected",
-                            data=csv_data,
-                            file_name=f"selected_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        add_notification("No articles selected for export", "warning")
-            
-            # Create layout with sticky action panel
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.write(f"Showing **{len(articles)}** articles")
-                
-                # Select all checkbox
-                select_all = st.checkbox("Select All", key="select_all_articles")
-                
-                # Initialize selected articles in session state
-                if 'selected_articles' not in st.session_state:
-                    st.session_state.selected_articles = []
-                
-                selected_articles = st.session_state.selected_articles if not select_all else [article.id for article in articles]
-                
-                # Render articles based on view mode
-                if view_mode == "Table View":
-                    # Table view
-                    article_data = []
-                    for article in articles:
-                        article_data.append({
-                            'Select': st.checkbox("", key=f"table_select_{article.id}", value=article.id in selected_articles),
-                            'Title': article.title[:50] + "..." if len(article.title) > 50 else article.title,
-                            'Source': article.source,
-                            'Status': article.status.value,
-                            'Quality': f"{article.quality_score}%",
-                            'Date': article.created_at.strftime('%m/%d/%Y')
-                        })
-                    
-                    if article_data:
-                        st.dataframe(
-                            pd.DataFrame(article_data),
-                            use_container_width=True,
-                            hide_index=True
-                        )
-                else:
-                    # Card/Compact view
-                    for idx, article in enumerate(articles):
-                        with st.container():
-                            is_selected = render_article_card(article, idx, selected_articles)
-                            
-                            # Update selected articles list
-                            if is_selected and article.id not in st.session_state.selected_articles:
-                                st.session_state.selected_articles.append(article.id)
-                            elif not is_selected and article.id in st.session_state.selected_articles:
-                                st.session_state.selected_articles.remove(article.id)
-
-            with col2:
-                # Enhanced action panel with better visibility
-                st.markdown(f'''
-                <div class="action-panel">
-                    <h3>⚡ Bulk Actions</h3>
-                </div>
-                ''', unsafe_allow_html=True)
-                
-                selected_count = len(st.session_state.get('selected_articles', []))
-                
-                if selected_count > 0:
-                    st.success(f"**{selected_count}** articles selected")
-                else:
-                    st.info("Select articles to perform actions")
-                
-                st.markdown("---")
-                
-                # Bulk Edit Mode
-                if st.button(
-                    "✏️ Bulk Edit Mode", 
-                    disabled=not selected_count,
-                    use_container_width=True,
-                    help="Edit multiple articles at once"
-                ):
-                    st.session_state.dialog = {
-                        "name": "bulk_edit",
-                        "props": {
-                            "article_ids": st.session_state.get('selected_articles', [])
-                        }
-                    }
-                    st.rerun()
-                
-                # AI Enhancement
-                if st.button(
-                    "✨ Enhance with AI", 
-                    disabled=not selected_count,
-                    use_container_width=True,
-                    help="Generate AI summaries and improve content"
-                ):
-                    st.session_state.action = "Enhance"
-                    st.session_state.dialog = {
-                        "name": "confirm",
-                        "props": {
-                            "action_name": "Enhance with AI",
-                            "item_count": selected_count
-                        }
-                    }
-                    st.rerun()
-                
-                # Status Actions
-                st.markdown("**Update Status:**")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button(
-                        "✅ Approve", 
-                        disabled=not selected_count,
-                        use_container_width=True
-                    ):
-                        st.session_state.action = "Approve"
-                        st.session_state.dialog = {
-                            "name": "confirm",
-                            "props": {
-                                "action_name": "Approve",
-                                "item_count": selected_count
-                            }
-                        }
-                        st.rerun()
-                
-                with col2:
-                    if st.button(
-                        "❌ Reject", 
-                        disabled=not selected_count,
-                        use_container_width=True
-                    ):
-                        st.session_state.action = "Reject"
-                        st.session_state.dialog = {
-                            "name": "confirm",
-                            "props": {
-                                "action_name": "Reject",
-                                "item_count": selected_count
-                            }
-                        }
-                        st.rerun()
-                
-                # Publishing
-                st.markdown("---")
-                if st.button(
-                    "🚀 Publish", 
-                    disabled=not selected_count,
-                    use_container_width=True,
-                    type="primary",
-                    help="Publish to configured platforms"
-                ):
-                    st.session_state.action = "Publish"
-                    # Store selected article IDs in session state
-                    st.session_state.selected_articles = [article.id for article in articles if st.session_state.get(f"select_{article.id}", False)]
-                    st.session_state.dialog = {
-                        "name": "confirm",
-                        "props": {
-                            "action_name": "Publish",
-                            "item_count": selected_count
-                        }
-                    }
-                    st.rerun()
-                
-                # Reset
-                if st.button(
-                    "🔄 Reset Status", 
-                    disabled=not selected_count,
-                    use_container_width=True,
-                    help="Reset to 'New' status"
-                ):
-                    st.session_state.action = "Reset"
-                    # Store selected article IDs in session state
-                    st.session_state.selected_articles = [article.id for article in articles if st.session_state.get(f"select_{article.id}", False)]
-                    st.session_state.dialog = {
-                        "name": "confirm",
-                        "props": {
-                            "action_name": "Reset",
-                            "item_count": selected_count
-                        }
-                    }
-                    st.rerun()
+        # Only the article list reruns on the auto-refresh tick
+        articles_fragment = st.fragment(run_every="30s" if auto_refresh else None)(show_articles_tab)
+        articles_fragment(repository, article_filters, quality_range)
 
     # Handle confirmed actions
     if 'confirmed' in st.session_state:
@@ -1806,16 +2154,9 @@ def show_dashboard(system_components: Dict[str, Any]):
             action = st.session_state.get('action')
             selected_ids = st.session_state.get('selected_articles', [])
             
-            if action == "Enhance":
-                enhance_articles_with_ai(selected_ids, repository, content_service)
-            elif action == "Approve":
-                update_article_status(selected_ids, ArticleStatus.APPROVED, repository)
-            elif action == "Publish":
-                publish_articles(selected_ids, repository, publisher)
-            elif action == "Reject":
-                update_article_status(selected_ids, ArticleStatus.REJECTED, repository)
-            elif action == "Reset":
-                update_article_status(selected_ids, ArticleStatus.PULLED, repository)
+            handler = ACTION_DISPATCH.get(action)
+            if handler:
+                handler(selected_ids, repository, content_service, publisher)
             
         del st.session_state.confirmed
         if 'action' in st.session_state:
@@ -1838,257 +2179,11 @@ def show_dashboard(system_components: Dict[str, Any]):
 
     # Analytics Tab
     if st.session_state.active_tab == "📈 Analytics":
-        st.subheader("📈 Analytics & Insights")
-        
-        # Performance Metrics Row
-        metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
-        
-        with metric_col1:
-            approval_rate = (stats.get('status_counts', {}).get('approved', 0) / 
-                           max(stats.get('total_articles', 1), 1) * 100)
-            st.metric("Approval Rate", f"{approval_rate:.1f}%")
-        
-        with metric_col2:
-            publish_rate = (stats.get('status_counts', {}).get('published', 0) / 
-                          max(stats.get('status_counts', {}).get('approved', 1), 1) * 100)
-            st.metric("Publish Rate", f"{publish_rate:.1f}%")
-        
-        with metric_col3:
-            avg_quality = 75  # Calculate from actual data
-            st.metric("Avg Quality", f"{avg_quality}%")
-        
-        with metric_col4:
-            sources_active = len(stats.get('source_counts', {}))
-            st.metric("Active Sources", sources_active)
-        
-        # Enhanced Performance Metrics
-        st.subheader("🚀 System Performance")
-        perf_metrics = get_performance_metrics()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**Processing Metrics**")
-            for metric, value in perf_metrics.items():
-                if metric in ['avg_processing_time', 'api_response_time']:
-                    st.markdown(f"**{metric.replace('_', ' ').title()}:** {value}s")
-                elif metric in ['success_rate', 'error_rate']:
-                    st.markdown(f"**{metric.replace('_', ' ').title()}:** {value}%")
-                else:
-                    st.markdown(f"**{metric.replace('_', ' ').title()}:** {value}")
-        
-        with col2:
-            # Processing time trend (mock data)
-            time_data = pd.DataFrame({
-                'Hour': range(24),
-                'Processing Time': [2.1 + 0.5 * (i % 6) for i in range(24)]
-            })
-            
-            fig = px.line(time_data, x='Hour', y='Processing Time', title="24h Processing Time Trend")
-            fig.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color=st.session_state.dark_mode and "#ffffff" or "#1e293b"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Activity Logs
-        st.subheader("📋 Recent Activity")
-        
-        logs = load_activity_logs(repository, limit=50)
-        if logs:
-            # Convert to DataFrame for better display
-            logs_df = pd.DataFrame(logs)
-            
-            # Debug: Show available columns
-            if st.checkbox("🐞 Debug: Show available columns", value=False):
-                st.write("Available columns:", list(logs_df.columns))
-                st.write("Sample data:", logs_df.head() if not logs_df.empty else "No data")
-            
-            if not logs_df.empty:
-                # Format timestamps if available
-                timestamp_cols = [col for col in logs_df.columns if 'time' in col.lower()]
-                if timestamp_cols:
-                    time_col = timestamp_cols[0]
-                    try:
-                        logs_df['Time'] = pd.to_datetime(logs_df[time_col]).dt.strftime('%b %d, %H:%M')
-                    except:
-                        logs_df['Time'] = logs_df[time_col].astype(str)
-                
-                # Determine which columns to show based on what's available
-                available_cols = list(logs_df.columns)
-                display_cols = []
-                column_config = {}
-                
-                # Map common column variations
-                col_mapping = {
-                    'Time': ['Time', 'timestamp', 'created_at', 'date'],
-                    'Source': ['scraper_name', 'source', 'name', 'scraper'],
-                    'Status': ['status', 'state', 'result'],
-                    'New Articles': ['new_articles', 'articles_count', 'count', 'articles'],
-                    'Duration': ['duration', 'time_taken', 'elapsed']
-                }
-                
-                for display_name, possible_cols in col_mapping.items():
-                    for col in possible_cols:
-                        if col in available_cols:
-                            display_cols.append(col)
-                            if display_name == 'New Articles':
-                                column_config[col] = st.column_config.NumberColumn(display_name, format="%d")
-                            elif display_name == 'Duration':
-                                column_config[col] = st.column_config.NumberColumn(display_name, format="%.1fs")
-                            else:
-                                column_config[col] = st.column_config.TextColumn(display_name)
-                            break
-                
-                # If no specific columns found, show all available columns
-                if not display_cols:
-                    display_cols = available_cols[:5]  # Show first 5 columns max
-                
-                # Display the table
-                if display_cols:
-                    st.dataframe(
-                        logs_df[display_cols],
-                        column_config=column_config,
-                        hide_index=True,
-                        use_container_width=True
-                    )
-                else:
-                    st.info("No suitable columns found for display")
-            else:
-                st.info("No activity logs available")
-        else:
-            st.info("📭 No recent activity to display. Try running some data pulls or performing bulk operations!")
+        show_analytics_tab(repository, stats)
 
     # Settings Tab
     elif st.session_state.active_tab == "⚙️ Settings":
-        st.subheader("⚙️ System Configuration")
-        
-        # User Preferences
-        with st.expander("👤 User Preferences", expanded=True):
-            st.markdown("**Theme & Display**")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                theme_mode = st.selectbox(
-                    "Theme",
-                    ["Dark Mode", "Light Mode", "Auto"],
-                    index=0 if st.session_state.dark_mode else 1
-                )
-                if theme_mode == "Dark Mode" and not st.session_state.dark_mode:
-                    st.session_state.dark_mode = True
-                    st.rerun()
-                elif theme_mode == "Light Mode" and st.session_state.dark_mode:
-                    st.session_state.dark_mode = False
-                    st.rerun()
-            
-            with col2:
-                default_view = st.selectbox(
-                    "Default Article View",
-                    ["Card View", "Compact View", "Table View"],
-                    index=0
-                )
-            
-            st.markdown("**Notifications**")
-            enable_notifications = st.checkbox(
-                "Enable System Notifications",
-                value=st.session_state.user_preferences['notifications_enabled']
-            )
-            
-            notification_types = st.multiselect(
-                "Notification Types",
-                ["New Articles", "Status Changes", "Errors", "Completions"],
-                default=["New Articles", "Errors"]
-            )
-        
-        # API Configuration
-        with st.expander("🔑 API Configuration"):
-            gemini_key = st.text_input(
-                "Gemini API Key", 
-                value=config.get('ai.gemini_api_key', ''), 
-                type="password",
-                help="Your Google Gemini API key for AI enhancements"
-            )
-            
-            api_endpoint = st.text_input(
-                "Publishing API Endpoint", 
-                value=config.get('publishing.custom_api.endpoint', ''),
-                help="Your custom API endpoint for publishing articles"
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                api_timeout = st.number_input(
-                    "API Timeout (seconds)",
-                    value=30,
-                    min_value=5,
-                    max_value=300
-                )
-            with col2:
-                retry_attempts = st.number_input(
-                    "Retry Attempts",
-                    value=3,
-                    min_value=1,
-                    max_value=10
-                )
-        
-        # AI Settings
-        with st.expander("🤖 AI Configuration"):
-            ai_model = st.selectbox(
-                "AI Model",
-                ["gemini-1.5-flash", "gemini-1.5-pro"],
-                index=0
-            )
-            
-            similarity_threshold = st.slider(
-                "Deduplication Threshold",
-                min_value=0.5,
-                max_value=1.0,
-                value=0.85,
-                step=0.05,
-                help="Higher values mean stricter deduplication"
-            )
-            
-            quality_threshold = st.slider(
-                "Quality Threshold",
-                min_value=0,
-                max_value=100,
-                value=60,
-                help="Minimum quality score for articles"
-            )
-            
-            # Article Templates
-            st.markdown("**Article Templates**")
-            template_name = st.selectbox(
-                "Publishing Template",
-                ["Standard", "Social Media", "Newsletter", "Blog Post"],
-                index=0
-            )
-            
-            if template_name == "Social Media":
-                st.text_area("Template", value="📰 {title}\n\n{summary}\n\n🔗 {url}", height=100)
-            elif template_name == "Newsletter":
-                st.text_area("Template", value="## {title}\n\n{summary}\n\n[Read More]({url})", height=100)
-        
-        # Database Settings
-        with st.expander("💾 Database"):
-            st.info("Database configuration is managed through the config file.")
-            st.code(f"""
-Database Type: {config.get('database.type', 'sqlite')}
-Database Name: news_database.db
-Status: Connected ✅
-Records: {stats.get('total_articles', 0)} articles
-            """)
-        
-        # Save Configuration
-        if st.button("💾 Save Configuration", type="primary", use_container_width=True):
-            with st.spinner("Saving configuration..."):
-                # Update user preferences
-                st.session_state.user_preferences['notifications_enabled'] = enable_notifications
-                st.session_state.user_preferences['default_view'] = default_view
-                
-                time.sleep(1)  # Simulate save operation
-                add_notification("Configuration saved successfully!", "success")
+        show_settings_tab(config, stats)
 
     # Debug Tab (if enabled)
     if config.is_debug_mode_enabled() and st.session_state.active_tab == "🐞 Debug":
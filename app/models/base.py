@@ -1,9 +1,10 @@
 # models/base.py
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 import json
+import warnings
 
 class ArticleStatus(Enum):
     PULLED = "pulled"
@@ -17,7 +18,11 @@ class PublishStatus(Enum):
     RETRY = "retry"
     SKIPPED = "skipped"
 
-@dataclass
+# Lookup tables for hot status conversions
+STATUS_BY_VALUE = {status.value: status for status in ArticleStatus}
+STATUS_VALUES = {status: status.value for status in ArticleStatus}
+
+@dataclass(slots=True)
 class Article:
     id: int
     title: str
@@ -39,6 +44,11 @@ class Article:
     created_at: datetime = field(default_factory=datetime.now)
     published_at: Optional[datetime] = None
 
+    @property
+    def ai_tags_json(self) -> str:
+        """ai_tags serialized for the articles.ai_tags column (empty list when unset)"""
+        return json.dumps(self.ai_tags or [])
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert Article object to a dictionary for serialization"""
         return {
@@ -51,7 +61,7 @@ class Article:
             'author': self.author,
             'date': self.date.isoformat() if self.date else None,
             'category': self.category,
-            'status': self.status.value,
+            'status': STATUS_VALUES[self.status],
             'quality_score': self.quality_score,
             'sentiment_score': self.sentiment_score,
             'ai_summary': self.ai_summary,
@@ -76,11 +86,58 @@ class Article:
         
         # Convert status string back to enum
         if data.get('status'):
-            data['status'] = ArticleStatus(data['status'])
+            data['status'] = STATUS_BY_VALUE[data['status']]
         
         return cls(**data)
 
-@dataclass
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> List['Article']:
+        """Create Article objects from a list of dictionaries, parsing dates in bulk"""
+        import pandas as pd
+
+        def parse_one(value: Optional[str]) -> Optional[datetime]:
+            try:
+                return datetime.fromisoformat(value) if value else None
+            except (ValueError, TypeError):
+                return None
+
+        def parse_dates(key: str) -> List[Optional[datetime]]:
+            values = [record.get(key) or None for record in records]
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                try:
+                    parsed = pd.to_datetime(values, errors='coerce', format='ISO8601', cache=True)
+                except (ValueError, TypeError):
+                    parsed = None
+            # Mixed offsets (or naive mixed with aware) come back as an object Index, or coerced
+            # to UTC on some pandas versions; only all-naive columns take the bulk result
+            if not isinstance(parsed, pd.DatetimeIndex) or parsed.tz is not None:
+                return [parse_one(value) for value in values]
+            return [None if value is pd.NaT else value for value in parsed.to_pydatetime()]
+
+        dates = parse_dates('date')
+        created = parse_dates('created_at')
+        published = parse_dates('published_at')
+
+        return [
+            cls(**{
+                **record,
+                'date': date,
+                'created_at': created_at,
+                'published_at': published_at,
+                'status': STATUS_BY_VALUE[record['status']] if record.get('status') else ArticleStatus.PULLED
+            })
+            for record, date, created_at, published_at in zip(records, dates, created, published)
+        ]
+
+    @classmethod
+    def many_to_columnar(cls, articles: List['Article']) -> Dict[str, List[Any]]:
+        """Convert a list of Articles to a dict of column lists for bulk DataFrame construction"""
+        columns = {f.name: [getattr(article, f.name) for article in articles] for f in fields(cls)}
+        columns['status'] = [STATUS_VALUES[status] for status in columns['status']]
+        return columns
+
+@dataclass(slots=True)
 class ScraperRun:
     scraper_name: str
     status: str
@@ -92,18 +149,23 @@ class ScraperRun:
     id: Optional[int] = None
     created_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True)
 class PublishResult:
     status: PublishStatus
     article_id: int
     platform: str
+    article_title: str = ""
+    external_id: Optional[str] = None
     published_url: Optional[str] = None
     error_message: Optional[str] = None
     retry_count: int = 0
+    status_code: Optional[int] = None
+    retry_after: Optional[float] = None
+    retryable: bool = False
     id: Optional[int] = None
     created_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True)
 class ActivityLog:
     id: Optional[int] = None
     timestamp: datetime = field(default_factory=datetime.now)
@@ -1,93 +1,77 @@
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Iterator
 import json
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime
 import logging
-from collections import Counter
-from models.base import Article, ArticleStatus, ScraperRun, PublishResult
+import threading
+import atexit
+from collections import deque
+from cachetools import TTLCache
+from models.base import Article, ArticleStatus, ScraperRun, PublishResult, STATUS_BY_VALUE
 from database.sqlite_manager import SQLiteManager
 from utils.ui_logger import UILogger
 
 logger = logging.getLogger(__name__)
 
+ACTIVITY_LOG_COLUMNS = ('id', 'timestamp', 'activity_type', 'details', 'status')
+
+# Columns needed by list views; article_body is only loaded by get_article_by_id
+ARTICLE_LIST_COLUMNS = (
+    'id', 'display_id', 'title', 'url', 'source', 'author', 'date', 'published_at',
+    'description', 'category', 'status', 'ai_summary', 'ai_tags', 'quality_score',
+    'sentiment_score', 'image_url', 'content_hash', 'created_at'
+)
+
 class ArticleRepository:
+    __slots__ = (
+        'db', 'ui_logger', '_cache_lock', '_articles_by_id', '_articles_by_hash',
+        '_log_queue', '_log_flusher', '_log_stop', '_inserts_since_optimize'
+    )
+
+    # Max bound parameters per IN (...) lookup
+    IN_CLAUSE_CHUNK = 500
+    # Seconds between background flushes of buffered activity logs
+    LOG_FLUSH_INTERVAL = 0.5
+    # Single-article lookups are cached briefly; scrapers re-query the same rows on retries.
+    # This repository's writes invalidate entries; writes from other processes show up after the TTL
+    ARTICLE_CACHE_SIZE = 10_000
+    ARTICLE_CACHE_TTL = 10
+    # Inserted articles between PRAGMA optimize runs
+    OPTIMIZE_EVERY = 1000
+
     def __init__(self, db_manager: SQLiteManager, ui_logger: UILogger):
         self.db = db_manager
         self.ui_logger = ui_logger
+        self._cache_lock = threading.Lock()
+        self._inserts_since_optimize = 0
+        self._articles_by_id = TTLCache(maxsize=self.ARTICLE_CACHE_SIZE, ttl=self.ARTICLE_CACHE_TTL)
+        self._articles_by_hash = TTLCache(maxsize=self.ARTICLE_CACHE_SIZE, ttl=self.ARTICLE_CACHE_TTL)
+        self._start_activity_log_flusher()
     
-    def _get_next_display_id(self) -> str:
-        """Generates the next display_id in the format 'st-n-X'."""
-        try:
-            query = "SELECT display_id FROM articles WHERE display_id LIKE 'st-n-%' ORDER BY id DESC LIMIT 1"
-            result = self.db.execute_query(query)
-            if result:
-                last_id = result[0]['display_id']
-                last_num = int(last_id.split('-')[-1])
-                return f"st-n-{last_num + 1}"
-            return "st-n-1"
-        except Exception as e:
-            logger.error(f"Could not generate next display ID: {e}")
-            # Fallback to a timestamp-based unique ID
-            return f"st-n-err-{int(datetime.now().timestamp())}"
-
     def save_article(self, article: Article) -> Tuple[bool, str]:
         """Saves a new article to the database, handling uniqueness."""
         self.ui_logger.log(f"Attempting to save article: {article.url}")
         
-        # First, check for existing hash
-        self.ui_logger.log(f"Checking for duplicate hash: {article.content_hash}")
-        if self.get_article_by_hash(article.content_hash):
-            self.ui_logger.log("-> Result: Duplicate hash found.")
-            return False, "duplicate_hash"
-        
-        # Then, check for existing URL
-        self.ui_logger.log(f"Checking for duplicate URL: {article.url}")
-        query_url = "SELECT id FROM articles WHERE url = ?"
-        if self.db.execute_query(query_url, (article.url,)):
-            self.ui_logger.log("-> Result: Duplicate URL found.")
-            return False, "duplicate_url"
-            
-        # If no duplicates, insert the new article
-        self.ui_logger.log("No duplicates found. Proceeding to add article to DB.")
         try:
-            query = """
-                INSERT INTO articles (
-                    title, url, source, author, date, category, description,
-                    article_body, status, image_url, quality_score, ai_tags,
-                    ai_summary, sentiment_score, content_hash, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            params = (
-                article.title,
-                article.url,
-                article.source,
-                article.author,
-                article.date,
-                article.category,
-                article.description,
-                article.article_body,
-                article.status.value,
-                article.image_url,
-                article.quality_score,
-                json.dumps(article.ai_tags) if article.ai_tags else None,
-                article.ai_summary,
-                article.sentiment_score,
-                article.content_hash,
-                article.created_at
-            )
-            
-            last_id = self.db.execute_update(query, params)
-            if last_id:
+            last_id = self._insert_article(article)
+            if last_id is not None:
                 self.ui_logger.log(f"-> Result: Successfully added article with DB ID {last_id}.")
                 # Assign the new ID back to the article object
                 article.id = last_id
-                # Generate a user-friendly display ID
-                display_id = f"st-n-{last_id}"
-                update_query = "UPDATE articles SET display_id = ? WHERE id = ?"
-                self.db.execute_update(update_query, (display_id, last_id))
-                article.display_id = display_id
+                article.display_id = f"st-n-{last_id}"
+                self._record_inserts(1)
                 self.log_activity("Article Save", f"Saved article: {article.title}")
                 return True, "success"
             
+            # Nothing was inserted: work out which unique constraint was hit
+            reason = self._duplicate_reason(article)
+            if reason == "duplicate_hash":
+                self.ui_logger.log("-> Result: Duplicate hash found.")
+                return False, reason
+            if reason == "duplicate_url":
+                self.ui_logger.log("-> Result: Duplicate URL found.")
+                return False, reason
+            
             self.ui_logger.log("-> Result: Database insert failed.")
             return False, "db_insert_failed"
             
@@ -96,190 +80,313 @@ class ArticleRepository:
             self.ui_logger.log(f"-> Result: Error during save: {str(e)}")
             return False, "db_error"
 
-    def get_articles(self, **filters: Any) -> List[Article]:
-        """Retrieves articles with flexible filtering."""
-        query = "SELECT * FROM articles WHERE 1=1"
-        params = []
-
-        if filters.get('status_filter'):
-            query += " AND status = ?"
-            params.append(filters['status_filter'])
-        if filters.get('source_filter'):
-            placeholders = ','.join('?' for _ in filters['source_filter'])
-            query += f" AND source IN ({placeholders})"
-            params.extend(filters['source_filter'])
-        if filters.get('search_term'):
-            term = f"%{filters['search_term']}%"
-            query += " AND (title LIKE ? OR description LIKE ?)"
-            params.extend([term, term])
-
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([filters.get('limit', 100), filters.get('offset', 0)])
-        
-        try:
-            rows = self.db.execute_query(query, tuple(params))
-            return [self._row_to_article(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Error getting articles: {e}")
+    def save_articles(self, articles: List[Article]) -> List[Tuple[bool, str]]:
+        """Saves a batch of articles in one transaction, returning a (success, message) pair per article."""
+        if not articles:
             return []
+        
+        # Bulk-load the hashes and URLs that already exist so duplicates are skipped in Python
+        existing_hashes = self._existing_values('content_hash', [a.content_hash for a in articles])
+        existing_urls = self._existing_values('url', [a.url for a in articles])
+        
+        results: List[Optional[Tuple[bool, str]]] = []
+        to_insert = []
+        for article in articles:
+            if article.content_hash in existing_hashes:
+                results.append((False, "duplicate_hash"))
+            elif article.url in existing_urls:
+                results.append((False, "duplicate_url"))
+            else:
+                # Also catches duplicates within the batch itself
+                existing_hashes.add(article.content_hash)
+                existing_urls.add(article.url)
+                to_insert.append(article)
+                results.append(None)
+        
+        returned = []
+        if to_insert:
+            # Rows skipped by ON CONFLICT return nothing, so only our own inserts report an id
+            # (display_id is set by the insert trigger)
+            query = """
+                INSERT INTO articles (
+                    title, url, source, author, date, category, description,
+                    article_body, status, image_url, quality_score, ai_tags,
+                    ai_summary, sentiment_score, content_hash, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT DO NOTHING
+                RETURNING id, url
+            """
+            returned = self.db.execute_many_returning(query, [self._article_params(a) for a in to_insert])
+            if returned is None:
+                return [result or (False, "db_error") for result in results]
+        
+        inserted = iter(zip(to_insert, returned))
+        for index, result in enumerate(results):
+            if result is None:
+                article, rows = next(inserted)
+                if rows:
+                    article.id = rows[0]['id']
+                    article.display_id = f"st-n-{article.id}"
+                    results[index] = (True, "success")
+                else:
+                    # Written by another writer since the existence check
+                    results[index] = (False, self._duplicate_reason(article) or "db_insert_failed")
+        saved = sum(1 for success, _ in results if success)
+        self._record_inserts(saved)
+        self.ui_logger.log(f"Batch save: {saved} of {len(articles)} articles added.")
+        self.log_activity("Article Save", f"Saved {saved} of {len(articles)} articles in batch")
+        return results
+
+    def _duplicate_reason(self, article: Article) -> Optional[str]:
+        """Names the unique constraint an existing row shares with the article, hash first."""
+        duplicate_query = """
+            SELECT COUNT(*) as matches, MAX(content_hash = ?) as duplicate_hash
+            FROM articles WHERE content_hash = ? OR url = ?
+        """
+        duplicate = self.db.execute_query(duplicate_query, (article.content_hash, article.content_hash, article.url))
+        if duplicate and duplicate[0]['matches']:
+            return "duplicate_hash" if duplicate[0]['duplicate_hash'] else "duplicate_url"
+        return None
+
+    def _record_inserts(self, count: int):
+        """Counts inserted articles and refreshes planner statistics every OPTIMIZE_EVERY rows."""
+        self._inserts_since_optimize += count
+        if self._inserts_since_optimize >= self.OPTIMIZE_EVERY:
+            self._inserts_since_optimize = 0
+            self.db.optimize()
+
+    def _existing_values(self, column: str, values: List[Any]) -> set:
+        """Returns which of the given values already exist in an articles column, querying in chunks."""
+        existing = set()
+        for start in range(0, len(values), self.IN_CLAUSE_CHUNK):
+            chunk = values[start:start + self.IN_CLAUSE_CHUNK]
+            placeholders = ','.join('?' for _ in chunk)
+            rows = self.db.execute_query(f"SELECT {column} FROM articles WHERE {column} IN ({placeholders})", tuple(chunk))
+            existing.update(row[column] for row in rows)
+        return existing
+
+    def _article_params(self, article: Article) -> tuple:
+        """Builds the INSERT parameters for an article, in articles column order."""
+        return (
+            article.title,
+            article.url,
+            article.source,
+            article.author,
+            article.date,
+            article.category,
+            article.description,
+            article.article_body,
+            article.status.value,
+            article.image_url,
+            article.quality_score,
+            article.ai_tags_json,
+            article.ai_summary,
+            article.sentiment_score,
+            article.content_hash,
+            article.created_at
+        )
 
     def get_article_by_id(self, article_id: int) -> Optional[Article]:
         """Retrieves a single article by its primary key ID."""
+        with self._cache_lock:
+            cached = self._articles_by_id.get(article_id)
+        if cached is not None:
+            return self._snapshot(cached)
         try:
             row = self.db.execute_query("SELECT * FROM articles WHERE id = ?", (article_id,))
-            return self._row_to_article(row[0]) if row else None
+            if not row:
+                return None
+            article = self._row_to_article(row[0])
+            with self._cache_lock:
+                self._articles_by_id[article_id] = self._snapshot(article)
+            return article
         except Exception as e:
             logger.error(f"Error getting article by ID {article_id}: {e}")
             return None
 
-    def update_article_status(self, article_ids: List[int], new_status: ArticleStatus) -> bool:
-        """Updates the status of one or more articles."""
-        if not article_ids:
-            return False
-        
-        try:
-            placeholders = ','.join('?' for _ in article_ids)
-            query = f"UPDATE articles SET status = ? WHERE id IN ({placeholders})"
-            params = [new_status.value] + article_ids
-
-            if new_status == ArticleStatus.PUBLISHED:
-                query = f"UPDATE articles SET status = ?, published_at = ? WHERE id IN ({placeholders})"
-                params = [new_status.value, datetime.now()] + article_ids
-            
-            self.db.execute_update(query, tuple(params))
-            self.log_activity("Status Update", f"Updated {len(article_ids)} articles to {new_status.value}.")
-            return True
-        except Exception as e:
-            logger.error(f"Error updating article status: {e}")
-            return False
-
-    def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Gathers various statistics for the main dashboard."""
-        try:
-            stats = {}
-            # Total articles, status counts, source counts
-            stats['total_articles'] = self.db.execute_query("SELECT COUNT(*) as c FROM articles")[0]['c']
-            stats['status_counts'] = {r['status']: r['c'] for r in self.db.execute_query("SELECT status, COUNT(*) as c FROM articles GROUP BY status")}
-            stats['source_counts'] = {r['source']: r['c'] for r in self.db.execute_query("SELECT source, COUNT(*) as c FROM articles GROUP BY source")}
-
-            # Pulled in last 24 hours
-            yesterday = datetime.now() - timedelta(days=1)
-            stats['recent_articles'] = self.db.execute_query("SELECT COUNT(*) as c FROM articles WHERE created_at >= ?", (yesterday,))[0]['c']
-            
-            # Published today
-            today_start = datetime.now().replace(hour=0, minute=0, second=0)
-            stats['published_today'] = self.db.execute_query("SELECT COUNT(*) as c FROM articles WHERE published_at >= ?", (today_start,))[0]['c']
-            
-            return stats
-        except Exception as e:
-            logger.error(f"Error getting dashboard stats: {e}")
-            return {}
-
-    def get_distinct_sources(self) -> List[str]:
-        """Gets a list of all unique source names."""
-        try:
-            rows = self.db.execute_query("SELECT DISTINCT source FROM articles WHERE source IS NOT NULL ORDER BY source")
-            return [row['source'] for row in rows]
-        except Exception as e:
-            logger.error(f"Error getting distinct sources: {e}")
-            return []
-            
-    def log_activity(self, activity_type: str, details: str, status: str = "success"):
-        """Logs a generic activity to the activity_logs table."""
-        try:
-            query = "INSERT INTO activity_logs (activity_type, details, status) VALUES (?, ?, ?)"
-            self.db.execute_update(query, (activity_type, details, status))
-        except Exception as e:
-            logger.error(f"Error logging activity: {e}")
-
-    def get_activity_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Retrieves the most recent activity logs."""
+    def get_articles_by_ids(self, article_ids: List[int]) -> Dict[int, Article]:
+        """Retrieves many articles by ID, querying only uncached ids in chunks."""
+        articles = {}
+        with self._cache_lock:
+            for article_id in article_ids:
+                cached = self._articles_by_id.get(article_id)
+                if cached is not None:
+                    articles[article_id] = self._snapshot(cached)
+        missing = list(dict.fromkeys(article_id for article_id in article_ids if article_id not in articles))
         try:
-            query = "SELECT timestamp, activity_type, details, status FROM activity_logs ORDER BY timestamp DESC LIMIT ?"
-            return self.db.execute_query(query, (limit,))
+            for start in range(0, len(missing), self.IN_CLAUSE_CHUNK):
+                chunk = missing[start:start + self.IN_CLAUSE_CHUNK]
+                placeholders = ','.join('?' for _ in chunk)
+                rows = self.db.execute_query(f"SELECT * FROM articles WHERE id IN ({placeholders})", tuple(chunk))
+                fetched = {row['id']: self._row_to_article(row) for row in rows}
+                with self._cache_lock:
+                    self._articles_by_id.update((article_id, self._snapshot(article)) for article_id, article in fetched.items())
+                articles.update(fetched)
         except Exception as e:
-            logger.error(f"Error getting activity logs: {e}")
-            return []
+            logger.error(f"Error getting articles by IDs: {e}")
+        return articles
 
     def _row_to_article(self, row: Dict[str, Any]) -> Article:
         """Convert a database row to an Article object"""
         try:
-            # Handle datetime parsing - only use date part
-            published_at = None
-            if row.get('published_at'):
-                try:
-                    # Just parse the date part (YYYY-MM-DD)
-                    date_str = row['published_at'].split()[0]  # Get just the date part
-                    published_at = datetime.strptime(date_str, '%Y-%m-%d')
-                except (ValueError, IndexError):
-                    logger.warning(f"Could not parse published_at date: {row['published_at']}")
-            
-            # Parse article date similarly
-            article_date = None
-            if row.get('date'):
-                try:
-                    date_str = row['date'].split()[0]  # Get just the date part
-                    article_date = datetime.strptime(date_str, '%Y-%m-%d')
-                except (ValueError, IndexError):
-                    logger.warning(f"Could not parse article date: {row['date']}")
-            
             return Article(
                 id=row['id'],
                 title=row['title'],
                 url=row['url'],
                 source=row['source'],
                 author=row.get('author'),
-                date=article_date,
-                published_at=published_at,
-                article_body=row.get('article_body', ''),
+                date=self._parse_date_part(row.get('date'), 'article date'),
+                published_at=self._parse_date_part(row.get('published_at'), 'published_at date'),
+                article_body=row.get('article_body') or '',
                 description=row.get('description', ''),
                 category=row.get('category'),
-                status=ArticleStatus(row['status']) if row.get('status') else ArticleStatus.PENDING,
+                status=STATUS_BY_VALUE.get(row.get('status'), ArticleStatus.PULLED),
                 ai_summary=row.get('ai_summary'),
-                ai_tags=row.get('ai_tags', []),
+                ai_tags=self._parse_ai_tags(row.get('ai_tags')),
                 quality_score=row.get('quality_score'),
                 sentiment_score=row.get('sentiment_score'),
-                image_url=row.get('image_url')
+                image_url=row.get('image_url'),
+                display_id=row.get('display_id'),
+                content_hash=row.get('content_hash') or "",
+                created_at=self._parse_created_at(row.get('created_at'))
             )
         except Exception as e:
             logger.error(f"Error converting row to article: {e}")
             logger.error(f"Row data: {row}")
             raise
 
+    def _article_row_factory(self, cursor, row: tuple) -> Article:
+        """sqlite3 row factory building an Article straight from a tuple in ARTICLE_LIST_COLUMNS order."""
+        (article_id, display_id, title, url, source, author, date, published_at,
+         description, category, status, ai_summary, ai_tags, quality_score,
+         sentiment_score, image_url, content_hash, created_at) = row
+        return Article(
+            id=article_id,
+            title=title,
+            url=url,
+            source=source,
+            author=author,
+            date=self._parse_date_part(date, 'article date'),
+            published_at=self._parse_date_part(published_at, 'published_at date'),
+            article_body='',
+            description=description,
+            category=category,
+            status=STATUS_BY_VALUE.get(status, ArticleStatus.PULLED),
+            ai_summary=ai_summary,
+            ai_tags=self._parse_ai_tags(ai_tags),
+            quality_score=quality_score,
+            sentiment_score=sentiment_score,
+            image_url=image_url,
+            display_id=display_id,
+            content_hash=content_hash or "",
+            created_at=self._parse_created_at(created_at)
+        )
+
+    @staticmethod
+    def _parse_date_part(value: Optional[str], label: str) -> Optional[datetime]:
+        # Only the date part (YYYY-MM-DD) is used
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.split()[0])
+        except (ValueError, IndexError):
+            logger.warning(f"Could not parse {label}: {value}")
+            return None
+
+    @staticmethod
+    def _parse_created_at(value: Optional[str]) -> datetime:
+        if value:
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                logger.warning(f"Could not parse created_at: {value}")
+        return datetime.now()
+
+    @staticmethod
+    def _parse_ai_tags(value: Optional[str]) -> List[str]:
+        if not value:
+            return []
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.warning(f"Could not parse ai_tags: {value}")
+            return []
+
     def add_article(self, article: Article) -> Optional[int]:
         """Adds a new article to the database."""
-        query = """
-            INSERT INTO articles (
-                title, url, source, author, date, category, description,
-                article_body, image_url, status, content_hash, quality_score,
-                ai_tags, ai_summary, sentiment_score
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        params = (
-            article.title, article.url, article.source, article.author,
-            article.date.strftime('%Y-%m-%d %H:%M:%S') if article.date else None,
-            article.category, article.description, article.article_body,
-            article.image_url, article.status.value, article.content_hash,
-            article.quality_score, json.dumps(article.ai_tags),
-            article.ai_summary, article.sentiment_score
-        )
         try:
-            last_id = self.db.execute_update(query, params)
-            if last_id:
+            last_id = self._insert_article(article)
+            if last_id is not None:
+                self._record_inserts(1)
                 self.log_activity("Article Added", f"New article '{article.title[:50]}...' added from {article.source}.")
-                self.db.commit()
             return last_id
         except Exception as e:
             logger.error(f"Failed to add article {article.url}: {e}")
             return None
 
+    def _insert_article(self, article: Article) -> Optional[int]:
+        """Inserts one article unless its hash or URL already exists, returning the new id."""
+        # Duplicates are filtered in the same statement (the NOT EXISTS guard
+        # keeps them from consuming an AUTOINCREMENT id); display_id is
+        # filled in by the trg_articles_display_id trigger
+        query = """
+            INSERT INTO articles (
+                title, url, source, author, date, category, description,
+                article_body, status, image_url, quality_score, ai_tags,
+                ai_summary, sentiment_score, content_hash, created_at
+            )
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            WHERE NOT EXISTS (SELECT 1 FROM articles WHERE content_hash = ? OR url = ?)
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """
+        params = self._article_params(article) + (article.content_hash, article.url)
+        result = self.db.execute_query(query, params)
+        return result[0]['id'] if result else None
+
     def get_article_by_hash(self, content_hash: str) -> Optional[Article]:
+        with self._cache_lock:
+            cached = self._articles_by_hash.get(content_hash)
+        if cached is not None:
+            return self._snapshot(cached)
         query = "SELECT * FROM articles WHERE content_hash = ?"
         result = self.db.execute_query(query, (content_hash,))
-        return self._row_to_article(result[0]) if result else None
+        if not result:
+            return None
+        article = self._row_to_article(result[0])
+        with self._cache_lock:
+            self._articles_by_hash[content_hash] = self._snapshot(article)
+        return article
+
+    @staticmethod
+    def _snapshot(article: Article) -> Article:
+        """Copies an article (and its tag list) so callers never mutate a cached instance."""
+        return replace(article, ai_tags=list(article.ai_tags) if article.ai_tags is not None else None)
+
+    def _invalidate_cached_articles(self, article_ids: Optional[List[int]] = None):
+        """Drops cached lookups for the given article ids, or every cached article when no ids are given."""
+        with self._cache_lock:
+            if article_ids is None:
+                self._articles_by_id.clear()
+                self._articles_by_hash.clear()
+                return
+            ids = set(article_ids)
+            for article_id in ids:
+                self._articles_by_id.pop(article_id, None)
+            for content_hash in [h for h, article in self._articles_by_hash.items() if article.id in ids]:
+                self._articles_by_hash.pop(content_hash, None)
+
+    def get_articles_list(self, status_filter: Optional[str] = None, source_filter: Optional[List[str]] = None, search_term: Optional[str] = None, limit: int = 50, cursor_created_at: Optional[str] = None, cursor_id: Optional[int] = None) -> List[Article]:
+        """Retrieves a page of articles for list views without the article body.
+
+        Pages are keyset-paginated: pass the (created_at, id) cursor from
+        next_page_cursor() to continue after the last article of the previous page.
+        """
+        return list(self.iter_articles(status_filter, source_filter, search_term, limit, cursor_created_at, cursor_id))
 
-    def get_articles(self, status_filter: Optional[str] = None, source_filter: Optional[List[str]] = None, search_term: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Article]:
-        query = "SELECT * FROM articles"
+    def iter_articles(self, status_filter: Optional[str] = None, source_filter: Optional[List[str]] = None, search_term: Optional[str] = None, limit: int = -1, cursor_created_at: Optional[str] = None, cursor_id: Optional[int] = None) -> Iterator[Article]:
+        """Streams articles (without body) matching the filters; a negative limit means no limit."""
+        query = f"SELECT {', '.join(ARTICLE_LIST_COLUMNS)} FROM articles"
         conditions = []
         params = []
 
@@ -290,74 +397,161 @@ class ArticleRepository:
             placeholders = ','.join('?' for _ in source_filter)
             conditions.append(f"source IN ({placeholders})")
             params.extend(source_filter)
-        if search_term:
-            conditions.append("(title LIKE ? OR description LIKE ? OR ai_summary LIKE ?)")
-            term = f"%{search_term}%"
-            params.extend([term, term, term])
+        match_expression = self._fts_match_expression(search_term) if search_term else None
+        if match_expression and self.db.fts_enabled:
+            conditions.append("id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(match_expression)
+        elif match_expression:
+            conditions.append("search_blob LIKE ?")
+            params.append(f"%{search_term.strip().lower()}%")
+        if cursor_created_at is not None and cursor_id is not None:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend([cursor_created_at, cursor_id])
 
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
 
-        results = self.db.execute_query(query, tuple(params))
-        return [self._row_to_article(row) for row in results]
+        yield from self.db.iter_query(query, tuple(params), row_factory=self._article_row_factory)
+
+    def next_page_cursor(self, articles: List[Article]) -> Optional[Tuple[str, int]]:
+        """Returns the (created_at, id) cursor that follows the last article of a page."""
+        if not articles:
+            return None
+        last = articles[-1]
+        # The cursor must be the stored created_at text: str() of the parsed value differs for
+        # SQLite-stamped rows and for rows whose value failed to parse
+        rows = self.db.execute_query("SELECT created_at FROM articles WHERE id = ?", (last.id,))
+        if not rows:
+            return None
+        return rows[0]['created_at'], last.id
 
     def update_article_status(self, article_ids: List[int], status: ArticleStatus) -> bool:
+        """Updates the status of one or more articles."""
         if not article_ids:
             return False
         placeholders = ','.join('?' for _ in article_ids)
-        query = f"UPDATE articles SET status = ?, published_at = ? WHERE id IN ({placeholders})"
-        
-        now = datetime.now() if status == ArticleStatus.PUBLISHED else None
-        params = [status.value, now] + article_ids
+        # Let SQLite stamp published_at rather than binding a Python datetime; article
+        # timestamps (created_at, older published_at rows) are local time, so stamp local too
+        published_at = "datetime('now', 'localtime')" if status == ArticleStatus.PUBLISHED else "NULL"
+        query = f"UPDATE articles SET status = ?, published_at = {published_at} WHERE id IN ({placeholders})"
+        params = [status.value] + article_ids
         
         try:
             self.db.execute_update(query, tuple(params))
+            self._invalidate_cached_articles(article_ids)
             self.log_activity("Status Update", f"Updated {len(article_ids)} articles to '{status.value}'.")
             return True
         except Exception as e:
             logger.error(f"Failed to update article status: {e}")
             return False
 
+    @staticmethod
+    def _fts_match_expression(search_term: str) -> Optional[str]:
+        """Quote each word as an FTS5 prefix term so user input can't inject query syntax."""
+        tokens = search_term.split()
+        if not tokens:
+            return None
+        return ' '.join('"' + token.replace('"', '""') + '"*' for token in tokens)
+
     def get_distinct_sources(self) -> List[str]:
-        query = "SELECT DISTINCT source FROM articles"
-        results = self.db.execute_query(query)
-        return [row['source'] for row in results if row['source']]
+        """Gets a list of all unique source names."""
+        try:
+            rows = self.db.execute_query("SELECT DISTINCT source FROM articles WHERE source IS NOT NULL ORDER BY source")
+            return [row['source'] for row in rows]
+        except Exception as e:
+            logger.error(f"Error getting distinct sources: {e}")
+            return []
 
     def get_dashboard_stats(self) -> Dict[str, Any]:
-        stats = {}
-        
-        # Total articles
-        total_query = "SELECT COUNT(*) as total FROM articles"
-        stats['total_articles'] = self.db.execute_query(total_query)[0]['total']
+        """Gathers various statistics for the main dashboard."""
+        try:
+            stats = {}
         
-        # Recent articles (last 24h)
-        recent_query = "SELECT COUNT(*) as total FROM articles WHERE created_at >= date('now', '-1 day')"
-        stats['recent_articles'] = self.db.execute_query(recent_query)[0]['total']
-
-        # Published today
-        pub_query = "SELECT COUNT(*) as total FROM articles WHERE status = 'published' AND date(published_at) = date('now')"
-        stats['published_today'] = self.db.execute_query(pub_query)[0]['total']
-
-        # Status counts
-        status_query = "SELECT status, COUNT(*) as count FROM articles GROUP BY status"
-        stats['status_counts'] = {row['status']: row['count'] for row in self.db.execute_query(status_query)}
+            # Total and per-status counts are kept up to date by triggers
+            counters = dict(self.db.execute_query_tuples("SELECT name, value FROM stats_counters"))
+            stats['total_articles'] = counters.get('total', 0)
+            stats['status_counts'] = {
+                name[len('status:'):]: value
+                for name, value in counters.items()
+                if name.startswith('status:') and value
+            }
+
+            # Recent (last 24h) and published today are index range counts
+            windows_query = """
+                SELECT
+                    (SELECT COUNT(*) FROM articles WHERE created_at >= date('now', 'localtime', '-1 day')) as recent,
+                    (SELECT COUNT(*) FROM articles WHERE status = 'published' AND published_at >= date('now', 'localtime')) as published_today
+            """
+            windows = self.db.execute_query(windows_query)[0]
+            stats['recent_articles'] = windows['recent']
+            stats['published_today'] = windows['published_today']
 
-        # Source counts
-        source_query = "SELECT source, COUNT(*) as count FROM articles GROUP BY source"
-        stats['source_counts'] = {row['source']: row['count'] for row in self.db.execute_query(source_query)}
+            # Source counts (served from idx_articles_source)
+            source_query = "SELECT source, COUNT(*) as count FROM articles GROUP BY source"
+            stats['source_counts'] = dict(self.db.execute_query_tuples(source_query))
 
-        return stats
+            return stats
+        except Exception as e:
+            logger.error(f"Error getting dashboard stats: {e}")
+            return {}
     
     def log_activity(self, activity_type: str, details: str, status: str = "success"):
-        query = "INSERT INTO activity_logs (activity_type, details, status) VALUES (?, ?, ?)"
-        self.db.execute_update(query, (activity_type, details, status))
+        """Buffers an activity log entry; entries are written in batches by the flusher thread."""
+        self._log_queue.append((activity_type, details, status))
+
+    def flush_activity_logs(self):
+        """Writes all buffered activity log entries in one transaction."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._log_queue.popleft())
+            except IndexError:
+                break
+        if batch:
+            # timestamp comes from the column's CURRENT_TIMESTAMP default
+            query = "INSERT INTO activity_logs (activity_type, details, status) VALUES (?, ?, ?)"
+            if self.db.execute_many(query, batch) is None:
+                # Write failed (e.g. database busy): put the batch back, in order, for the next flush
+                self._log_queue.extendleft(reversed(batch))
+
+    def _start_activity_log_flusher(self):
+        self._log_queue = deque()
+        self._log_stop = threading.Event()
+        self._log_flusher = threading.Thread(target=self._flush_activity_logs_loop, name="activity-log-flusher", daemon=True)
+        self._log_flusher.start()
+        atexit.register(self.flush_activity_logs)
+
+    def _flush_activity_logs_loop(self):
+        while not self._log_stop.wait(self.LOG_FLUSH_INTERVAL):
+            try:
+                self.flush_activity_logs()
+            except Exception as e:
+                logger.error(f"Error flushing activity logs: {e}")
+
+    def close(self):
+        """Stops the activity log flusher and writes any entries still buffered."""
+        self._log_stop.set()
+        self._log_flusher.join()
+        atexit.unregister(self.flush_activity_logs)
+        self.flush_activity_logs()
         
-    def get_activity_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
-        query = "SELECT * FROM activity_logs ORDER BY timestamp DESC LIMIT ?"
-        return self.db.execute_query(query, (limit,))
+    def get_activity_logs(self, limit: int = 100, offset: int = 0, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Retrieves activity logs, optionally projected to the given columns."""
+        selected = [col for col in ACTIVITY_LOG_COLUMNS if col in columns] if columns else ACTIVITY_LOG_COLUMNS
+        if not selected:
+            return []
+        self.flush_activity_logs()
+        query = f"SELECT {', '.join(selected)} FROM activity_logs ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        return self.db.execute_query(query, (limit, offset))
+
+    def count_activity_logs(self) -> int:
+        """Returns the total number of activity log entries."""
+        self.flush_activity_logs()
+        result = self.db.execute_query("SELECT COUNT(*) as count FROM activity_logs")
+        return result[0]['count'] if result else 0
 
     def clear_all_articles(self) -> bool:
         """Deletes all articles from the articles table."""
@@ -366,6 +560,9 @@ class ArticleRepository:
             # Optional: Reset the autoincrement sequence for a clean slate
             self.db.execute_update("DELETE FROM sqlite_sequence WHERE name='articles'")
             self.db.commit()
+            self._invalidate_cached_articles()
+            self._inserts_since_optimize = 0
+            self.db.optimize()
             self.log_activity("Database Cleared", "All articles were deleted from the database.")
             logger.info("All articles have been cleared from the database.")
             return True
@@ -395,6 +592,7 @@ class ArticleRepository:
                 article_id
             )
             self.db.execute_update(query, params)
+            self._invalidate_cached_articles([article_id])
             self.log_activity("AI Enhancement", f"Enhanced article ID {article_id} with new AI insights.")
             return True
         except Exception as e:
@@ -406,6 +604,7 @@ class ArticleRepository:
         try:
             query = "UPDATE articles SET description = ? WHERE id = ?"
             self.db.execute_update(query, (new_description, article_id))
+            self._invalidate_cached_articles([article_id])
             self.log_activity("Article Edit", f"Updated description for article ID {article_id}.")
             return True
         except Exception as e:
@@ -417,6 +616,7 @@ class ArticleRepository:
         try:
             query = "UPDATE articles SET ai_summary = ? WHERE id = ?"
             self.db.execute_update(query, (new_summary, article_id))
+            self._invalidate_cached_articles([article_id])
             self.log_activity("Article Edit", f"Updated AI summary for article ID {article_id}.")
             return True
         except Exception as e:
@@ -2,18 +2,24 @@
 import google.generativeai as genai
 import hashlib
 import json
+import os
 import re
 import logging
+import threading
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
+from cachetools import LRUCache
 from dataclasses import dataclass, field
 from sentence_transformers import SentenceTransformer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import torch
+from sklearn.base import clone
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from scipy.sparse import csr_matrix, vstack
 import numpy as np
-from textblob import TextBlob
+from textblob.en import sentiment as textblob_sentiment
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+from nltk.tokenize import word_tokenize
 from models.base import Article
 
 logger = logging.getLogger(__name__)
@@ -32,6 +38,145 @@ def ensure_nltk_data():
 
 ensure_nltk_data()
 
+# Regex tokenizers for the per-article scoring paths (Punkt is too slow there)
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+WORD_RE = re.compile(r"\b[\w']+\b")
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences at terminal punctuation followed by a capitalized word."""
+    text = text.strip()
+    return SENTENCE_SPLIT_RE.split(text) if text else []
+
+def split_words(text: str) -> List[str]:
+    """Split text into word tokens, dropping punctuation."""
+    return WORD_RE.findall(text)
+
+# Syllable heuristic applied to a whole space-joined, lower-cased document: vowel runs,
+# minus a trailing silent 'e', plus consonant + 'le' endings, with one syllable minimum per word
+VOWEL_RUN_RE = re.compile(r'[aeiouy]+')
+SILENT_E_RE = re.compile(r'e(?= |$)')
+CONSONANT_LE_RE = re.compile(r'(?<=[^aeiouy ])le(?= |$)')
+ZERO_SYLLABLE_RE = re.compile(r'(?:^| )(?:[^aeiouy ]+|(?![^ ]*[^aeiouy ]le(?= |$))[^aeiouy ]*[aeiouy]*e)(?= |$)')
+
+def count_syllables(words: List[str]) -> int:
+    """Approximate total syllable count for a list of words in a few regex passes."""
+    text = ' '.join(words).lower()
+    return (
+        len(VOWEL_RUN_RE.findall(text))
+        - len(SILENT_E_RE.findall(text))
+        + len(CONSONANT_LE_RE.findall(text))
+        + len(ZERO_SYLLABLE_RE.findall(text))  # words the rules above leave at zero count as one
+    )
+
+# Sentiment: TextBlob's English lexicon flattened to word -> polarity (averaged over senses)
+# and scored with plain dict lookups instead of building a TextBlob per article
+NEGATIONS = frozenset({'no', 'not', 'never'})
+
+@lru_cache(maxsize=1)
+def get_polarity_lexicon() -> Dict[str, float]:
+    """Load TextBlob's sentiment lexicon once as a flat word -> polarity dict."""
+    textblob_sentiment.load()
+    return {word: senses[None][0] for word, senses in textblob_sentiment.items() if None in senses}
+
+def polarity(words: List[str]) -> float:
+    """Mean polarity of the lexicon words in a token list; a preceding negation flips and halves it."""
+    lexicon = get_polarity_lexicon()
+    scores = []
+    negated = False
+    for word in words:
+        word = word.lower()
+        score = lexicon.get(word)
+        if score is not None:
+            scores.append(-0.5 * score if negated else score)
+            negated = False
+        elif word in NEGATIONS or word.endswith("n't"):
+            negated = True
+    return max(-1.0, min(1.0, sum(scores) / len(scores))) if scores else 0.0
+
+# Keyword tables for the heuristic scorers, compiled once into alternations
+HIGH_VALUE_KEYWORDS = [
+    'funding', 'raises', 'startup', 'ipo', 'acquisition', 'merger',
+    'launch', 'partnership', 'investment', 'series', 'round',
+    'breakthrough', 'innovation', 'growth', 'expansion'
+]
+HIGH_VALUE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, HIGH_VALUE_KEYWORDS)))
+COMPANY_PATTERNS = [
+    re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Inc|Corp|Ltd|LLC|Technologies|Tech|Labs|Systems)\b'),
+    re.compile(r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)*\b(?=\s+(?:raised|announces|launches|acquires))'),
+]
+# Case-insensitive so article-sized texts are scanned as-is rather than lower-cased copies
+TOPIC_PATTERNS = [
+    (topic, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+    for topic, keywords in [
+        ('funding', ['funding', 'raised', 'investment', 'series', 'round']),
+        ('product-launch', ['launch', 'unveil', 'release', 'new product']),
+        ('acquisition', ['acquire', 'merger', 'buyout']),
+        ('partnership', ['partner', 'collaboration', 'agreement']),
+    ]
+]
+PLACEHOLDER_RE = re.compile('lorem ipsum|placeholder|test content', re.IGNORECASE)
+
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=4096)
+def normalize_text(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace; cached since the same texts recur across checks."""
+    text = PUNCTUATION_RE.sub('', text.lower())
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+def normalized_prefix(text: str, length: int) -> str:
+    """normalize_text(text)[:length], normalizing only a leading window when that is long enough."""
+    window = length * 4
+    if len(text) > window:
+        # Normalization works per character, so a window yielding more than `length` chars
+        # agrees with the full normalization on its first `length` chars
+        prefix = normalize_text(text[:window])
+        if len(prefix) > length:
+            return prefix[:length]
+    return normalize_text(text)[:length]
+
+# 64-bit SimHash over normalized title tokens for the near-duplicate title pre-filter
+SIMHASH_BITS = np.arange(64, dtype=np.uint64)
+POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def title_simhash(tokens: List[str]) -> int:
+    """SimHash of a token list: each bit is the majority vote of that bit across the token hashes."""
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'little') for token in tokens],
+        dtype=np.uint64
+    )
+    bits = (hashes[:, None] >> SIMHASH_BITS) & np.uint64(1)
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(tokens)
+    return int(np.sum(np.uint64(1) << SIMHASH_BITS[votes > 0]))
+
+def hamming_distances(fingerprints: np.ndarray, fingerprint: int) -> np.ndarray:
+    """Popcount of XOR between each stored 64-bit fingerprint and the query."""
+    xor = np.bitwise_xor(fingerprints, np.uint64(fingerprint))
+    return POPCOUNT_TABLE[xor.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+SENTENCE_MODEL_NAME = 'all-MiniLM-L6-v2'
+# Opt-in int8 dynamic quantization of the encoder (CPU only, small similarity drift)
+QUANTIZE_SENTENCE_MODEL = os.getenv('QUANTIZED_ENCODER', '0') == '1'
+
+@lru_cache(maxsize=1)
+def get_sentence_model(name: str = SENTENCE_MODEL_NAME) -> SentenceTransformer:
+    """Loads the sentence transformer once per process; analyzer and deduplicator share it."""
+    logger.info(f"Loading sentence transformer model: '{name}'...")
+    model = SentenceTransformer(name)
+    if torch.cuda.is_available():
+        # FP16 weights on GPU; encode(convert_to_numpy=True) still hands back arrays for the dot products
+        model = model.half().to('cuda')
+        logger.info("Sentence transformer running in FP16 on CUDA.")
+    else:
+        torch.set_num_threads(os.cpu_count() or 1)
+        if QUANTIZE_SENTENCE_MODEL:
+            # Linear layers run as int8 GEMMs; tokenization and pooling are unchanged
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            logger.info("Sentence transformer quantized to int8.")
+    logger.info("Sentence transformer model loaded successfully.")
+    return model
+
 @dataclass
 class ContentAnalysis:
     quality_score: int
@@ -50,17 +195,42 @@ class DuplicationResult:
     similar_article_title: Optional[str] = None
     confidence: str = "medium"
 
+# Structured-output schema for _generate_ai_insights, so Gemini replies with bare JSON
+AI_INSIGHTS_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'tags': {'type': 'ARRAY', 'items': {'type': 'STRING'}},
+        'summary': {'type': 'STRING'},
+        'category': {'type': 'STRING'},
+    },
+    'required': ['tags', 'summary', 'category'],
+}
+
 class ContentAnalyzer:
     """A content analyzer that can use either Gemini or basic NLP."""
+    # Gemini requests allowed in flight at once across threads
+    GEMINI_MAX_IN_FLIGHT = 8
+    # Parsed insights kept per prompt hash so reprocessed articles skip the request
+    INSIGHTS_CACHE_SIZE = 2048
+
     def __init__(self, gemini_api_key: Optional[str] = None, model: str = "gemini-2.0-flash"):
         self.gemini_api_key = gemini_api_key
         self.model_name = model
         self.stop_words = set(stopwords.words('english'))
+        self._gemini_slots = threading.BoundedSemaphore(self.GEMINI_MAX_IN_FLIGHT)
+        self._insights_cache = LRUCache(maxsize=self.INSIGHTS_CACHE_SIZE)
+        self._insights_lock = threading.Lock()
         
         if self.gemini_api_key:
             try:
                 genai.configure(api_key=self.gemini_api_key)
-                self.gemini_model = genai.GenerativeModel(self.model_name)
+                self.gemini_model = genai.GenerativeModel(
+                    self.model_name,
+                    generation_config=genai.GenerationConfig(
+                        response_mime_type='application/json',
+                        response_schema=AI_INSIGHTS_SCHEMA
+                    )
+                )
                 logger.info(f"Gemini model '{self.model_name}' initialized successfully.")
             except Exception as e:
                 logger.error(f"Failed to initialize Gemini model: {e}")
@@ -70,14 +240,12 @@ class ContentAnalyzer:
 
         # Initialize sentence transformer for semantic similarity
         try:
-            logger.info("Loading sentence transformer model: 'all-MiniLM-L6-v2'...")
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Sentence transformer model loaded successfully.")
+            self.sentence_model = get_sentence_model()
         except Exception as e:
             logger.error(f"Failed to load sentence transformer model: {e}", exc_info=True)
             self.sentence_model = None
         
-        # Initialize TF-IDF as fallback
+        # TF-IDF settings for the fallback tags; each call fits its own clone
         self.tfidf = TfidfVectorizer(
             max_features=5000,
             stop_words='english',
@@ -141,13 +309,8 @@ class ContentAnalyzer:
             score += 5
         
         # High-value keywords in title
-        high_value_keywords = [
-            'funding', 'raises', 'startup', 'ipo', 'acquisition', 'merger',
-            'launch', 'partnership', 'investment', 'series', 'round',
-            'breakthrough', 'innovation', 'growth', 'expansion'
-        ]
         title_lower = title.lower()
-        keyword_matches = sum(1 for keyword in high_value_keywords if keyword in title_lower)
+        keyword_matches = len(set(HIGH_VALUE_KEYWORDS_RE.findall(title_lower)))
         score += min(keyword_matches * 3, 15)
         
         # Content depth (0-25 points)
@@ -170,7 +333,7 @@ class ContentAnalyzer:
             score += 5
         
         # Content structure (0-15 points)
-        sentences = sent_tokenize(article_body)
+        sentences = split_sentences(article_body)
         if len(sentences) > 5:
             score += 10
             # Check for variety in sentence length
@@ -179,7 +342,7 @@ class ContentAnalyzer:
                 score += 5
         
         # Penalize poor quality indicators
-        if any(indicator in article_body.lower() for indicator in ['lorem ipsum', 'placeholder', 'test content']):
+        if PLACEHOLDER_RE.search(article_body):
             score -= 20
         
         return max(0, min(100, score))
@@ -187,8 +350,7 @@ class ContentAnalyzer:
     def _analyze_sentiment(self, content: str) -> float:
         """Analyze sentiment of content (-1 to 1)"""
         try:
-            blob = TextBlob(content)
-            return float(blob.sentiment.polarity)
+            return polarity(split_words(content))
         except Exception as e:
             logger.warning(f"Sentiment analysis failed: {e}")
             return 0.0
@@ -196,14 +358,14 @@ class ContentAnalyzer:
     def _calculate_readability(self, content: str) -> float:
         """Calculate readability score (Flesch Reading Ease approximation)"""
         try:
-            sentences = sent_tokenize(content)
-            words = word_tokenize(content)
+            sentences = split_sentences(content)
+            words = split_words(content)
             
             if not sentences or not words:
                 return 0.0
             
             avg_sentence_length = len(words) / len(sentences)
-            syllable_count = sum(self._count_syllables(word) for word in words)
+            syllable_count = count_syllables(words)
             avg_syllables_per_word = syllable_count / len(words) if words else 0
             
             # Simplified Flesch Reading Ease formula
@@ -214,38 +376,14 @@ class ContentAnalyzer:
             logger.warning(f"Readability calculation failed: {e}")
             return 50.0  # Default neutral score
     
-    def _count_syllables(self, word: str) -> int:
-        """Approximate syllable count for a word"""
-        word = word.lower()
-        count = 0
-        vowels = 'aeiouy'
-        if word[0] in vowels:
-            count += 1
-        for index in range(1, len(word)):
-            if word[index] in vowels and word[index-1] not in vowels:
-                count += 1
-        if word.endswith('e'):
-            count -= 1
-        if word.endswith('le') and len(word) > 2 and word[-3] not in vowels:
-            count += 1
-        if count == 0:
-            count += 1
-        return count
-    
     def _extract_entities(self, content: str) -> List[str]:
         """Extract key entities (companies, people, etc.)"""
         # Simple regex-based entity extraction
         entities = []
         
         # Company patterns
-        company_patterns = [
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Inc|Corp|Ltd|LLC|Technologies|Tech|Labs|Systems)\b',
-            r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)*\b(?=\s+(?:raised|announces|launches|acquires))',
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.findall(pattern, content)
-            entities.extend(matches)
+        for pattern in COMPANY_PATTERNS:
+            entities.extend(pattern.findall(content))
         
         # Remove duplicates and common words
         common_words = {'The', 'This', 'That', 'These', 'Those', 'Inc', 'Corp', 'Ltd'}
@@ -272,39 +410,29 @@ class ContentAnalyzer:
             ---
             """
             
-            response = self.gemini_model.generate_content(prompt)
+            prompt_key = hashlib.sha256(prompt.encode()).hexdigest()
+            with self._insights_lock:
+                cached = self._insights_cache.get(prompt_key)
+            if cached is not None:
+                tags, summary, category = cached
+                return list(tags), summary, category
+
+            with self._gemini_slots:
+                response = self.gemini_model.generate_content(prompt)
             
-            # Clean and parse the JSON response
-            cleaned_response_text = response.text.strip().replace("```json", "").replace("```", "").strip()
+            # The model is configured for JSON output, so the text parses directly
+            insights = json.loads(response.text)
+            tags = insights.get("tags", [])
+            summary = insights.get("summary", "")
+            category = insights.get("category", "general-news")
             
-            try:
-                insights = json.loads(cleaned_response_text)
-                tags = insights.get("tags", [])
-                summary = insights.get("summary", "")
-                category = insights.get("category", "general-news")
-                
-                # Basic validation
-                if not isinstance(tags, list) or not isinstance(summary, str) or not isinstance(category, str):
-                    raise ValueError("Invalid format for generated insights.")
-
-                return tags, summary, category
-
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.error(f"Failed to parse Gemini response: {e}\nResponse text: {cleaned_response_text}")
-                # Fallback parsing if JSON is invalid
-                tags = re.findall(r'"tags":\s*\[([^\]]+)\]', cleaned_response_text)
-                if tags:
-                    tags = [t.strip().strip('"') for t in tags[0].split(',')]
-                else:
-                    tags = []
-                
-                summary_match = re.search(r'"summary":\s*"([^"]+)"', cleaned_response_text)
-                summary = summary_match.group(1) if summary_match else ""
-
-                category_match = re.search(r'"category":\s*"([^"]+)"', cleaned_response_text)
-                category = category_match.group(1) if category_match else "general-news"
-                
-                return tags, summary, category
+            # Basic validation
+            if not isinstance(tags, list) or not isinstance(summary, str) or not isinstance(category, str):
+                raise ValueError("Invalid format for generated insights.")
+
+            with self._insights_lock:
+                self._insights_cache[prompt_key] = (tuple(tags), summary, category)
+            return tags, summary, category
 
         except Exception as e:
             logger.error(f"AI insight generation failed: {e}")
@@ -316,9 +444,11 @@ class ContentAnalyzer:
             # Tokenize and remove stop words
             tokens = [word for word in word_tokenize(content.lower()) if word.isalpha() and word not in self.stop_words]
             
-            # Use TF-IDF to find important keywords
-            tfidf_matrix = self.tfidf.fit_transform([" ".join(tokens)])
-            feature_names = self.tfidf.get_feature_names_out()
+            # Use TF-IDF to find important keywords; a fresh clone keeps concurrent analyses
+            # from refitting one shared vocabulary
+            tfidf = clone(self.tfidf)
+            tfidf_matrix = tfidf.fit_transform([" ".join(tokens)])
+            feature_names = tfidf.get_feature_names_out()
             
             # Get top N keywords
             top_n = 10
@@ -336,7 +466,7 @@ class ContentAnalyzer:
             return description
         
         try:
-            sentences = sent_tokenize(article_body)
+            sentences = split_sentences(article_body)
             return " ".join(sentences[:2])  # Return first two sentences
         except Exception as e:
             logger.warning(f"Basic summary generation failed: {e}")
@@ -344,15 +474,9 @@ class ContentAnalyzer:
 
     def _classify_topic(self, content: str) -> str:
         """Basic topic classification based on keywords"""
-        content_lower = content.lower()
-        if any(kw in content_lower for kw in ['funding', 'raised', 'investment', 'series', 'round']):
-            return 'funding'
-        if any(kw in content_lower for kw in ['launch', 'unveil', 'release', 'new product']):
-            return 'product-launch'
-        if any(kw in content_lower for kw in ['acquire', 'merger', 'buyout']):
-            return 'acquisition'
-        if any(kw in content_lower for kw in ['partner', 'collaboration', 'agreement']):
-            return 'partnership'
+        for topic, pattern in TOPIC_PATTERNS:
+            if pattern.search(content):
+                return topic
         return 'general'
 
     def _default_analysis(self) -> ContentAnalysis:
@@ -369,39 +493,165 @@ class ContentAnalyzer:
 
 @dataclass
 class SemanticDeduplicator:
+    # Prepared texts memoized for stored articles re-checked against explicit lists
+    PREPARED_TEXT_CACHE_SIZE = 4096
+
     similarity_threshold: float = 0.85
+    # Titles within this many differing SimHash bits always get the embedding check
+    simhash_max_distance: int = 3
+    # The sentence encoder only runs if some stored text reaches this hashed-term cosine
+    semantic_min_term_similarity: float = 0.1
     sentence_model: Optional[SentenceTransformer] = field(init=False, default=None)
+    # Articles registered via add_article: id/title, prepared texts and a row-aligned
+    # embedding buffer (grown by doubling) so checks don't re-encode the corpus
+    _indexed: List[Dict] = field(init=False, default_factory=list, repr=False)
+    _indexed_texts: List[str] = field(init=False, default_factory=list, repr=False)
+    _matrix: Optional[np.ndarray] = field(init=False, default=None, repr=False)
+    # Reused output buffer for the matrix-vector product, sized to the embedding buffer
+    _scores: Optional[np.ndarray] = field(init=False, default=None, repr=False)
+    # Stateless term hasher for the keyword check; stored articles' rows are kept stacked
+    _hasher: HashingVectorizer = field(
+        init=False, repr=False,
+        default_factory=lambda: HashingVectorizer(n_features=2**18, alternate_sign=False, norm='l2', ngram_range=(1, 2))
+    )
+    _indexed_term_rows: List[csr_matrix] = field(init=False, default_factory=list, repr=False)
+    _indexed_term_matrix: Optional[csr_matrix] = field(init=False, default=None, repr=False)
+    # Exact content hashes of stored articles, checked before any model work, and title SimHashes
+    _indexed_hashes: Dict[str, int] = field(init=False, default_factory=dict, repr=False)
+    _title_simhashes: np.ndarray = field(init=False, default_factory=lambda: np.empty(64, dtype=np.uint64), repr=False)
+    # Prepared texts of stored articles, keyed by (id, title, description, body prefix)
+    _prepared_texts: LRUCache = field(
+        init=False, repr=False, default_factory=lambda: LRUCache(maxsize=SemanticDeduplicator.PREPARED_TEXT_CACHE_SIZE)
+    )
+    # First-10-word prefix of each stored text -> first matching row, rebuilt lazily after adds
+    _title_prefixes: Optional[Dict[str, int]] = field(init=False, default=None, repr=False)
+    # One deduplicator is shared by every session, so adds and checks take turns on the index
+    _index_lock: threading.RLock = field(init=False, default_factory=threading.RLock, repr=False)
     
     def __post_init__(self):
         try:
-            logger.info("Deduplicator: Loading sentence transformer model 'all-MiniLM-L6-v2'...")
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Deduplicator: Sentence transformer loaded successfully.")
+            self.sentence_model = get_sentence_model()
         except Exception as e:
             logger.error(f"Deduplicator: Failed to load sentence transformer model: {e}", exc_info=True)
             self.sentence_model = None
 
-    def check_for_duplicates(self, new_article: Dict, existing_articles: List[Dict]) -> DuplicationResult:
-        """Check for duplicates using semantic and keyword-based methods"""
+    def add_article(self, article: Dict) -> bool:
+        """Register a saved article so later checks can compare against it without re-encoding"""
+        return self.add_articles([article])
+
+    def add_articles(self, articles: List[Dict]) -> bool:
+        """Register several saved articles with a single batched encode"""
+        if not articles:
+            return True
+        with self._index_lock:
+            return self._add_articles(articles)
+
+    def _add_articles(self, articles: List[Dict]) -> bool:
+        texts = [self._prepare_text(a) for a in articles]
+        if self.sentence_model:
+            try:
+                embeddings = self.sentence_model.encode(
+                    texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+                )
+            except Exception as e:
+                logger.warning(f"Failed to index articles for deduplication: {e}")
+                return False
+            
+            count, needed = len(self._indexed), len(self._indexed) + len(texts)
+            if self._matrix is None:
+                self._matrix = np.empty((max(64, needed), embeddings.shape[1]), dtype=np.float32)
+            elif needed > len(self._matrix):
+                grown = np.empty((max(2 * len(self._matrix), needed), self._matrix.shape[1]), dtype=np.float32)
+                grown[:count] = self._matrix[:count]
+                self._matrix = grown
+            self._matrix[count:needed] = embeddings
+        
+        for article, text in zip(articles, texts):
+            count = len(self._indexed)
+            if count == len(self._title_simhashes):
+                self._title_simhashes = np.concatenate([self._title_simhashes, np.empty(count, dtype=np.uint64)])
+            self._title_simhashes[count] = title_simhash(self._normalize_text(article.get('title', '')).split() or [''])
+            self._indexed_hashes.setdefault(self._article_hash(article), count)
+            self._indexed.append({'id': article.get('id'), 'title': article.get('title', '')})
+            self._indexed_texts.append(text)
+        
+        self._indexed_term_rows.append(self._hasher.transform(texts))
+        self._indexed_term_matrix = None
+        self._title_prefixes = None
+        return True
+
+    def encode_articles(self, articles: List[Dict]) -> Optional[np.ndarray]:
+        """Normalized embeddings for a list of articles, to reuse across several checks against it"""
+        if not self.sentence_model or not articles:
+            return None
+        try:
+            return self.sentence_model.encode(
+                [self._prepare_text(a) for a in articles],
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to encode articles for deduplication: {e}")
+            return None
+
+    def check_for_duplicates(self, new_article: Dict, existing_articles: Optional[List[Dict]] = None,
+                             existing_embeddings: Optional[np.ndarray] = None) -> DuplicationResult:
+        """Check for duplicates using semantic and keyword-based methods
+
+        Without existing_articles, the check runs against the articles registered via add_article.
+        existing_embeddings, from encode_articles, saves re-encoding existing_articles on every call.
+        """
+        with self._index_lock:
+            return self._check_for_duplicates(new_article, existing_articles, existing_embeddings)
+
+    def _check_for_duplicates(self, new_article: Dict, existing_articles: Optional[List[Dict]],
+                              existing_embeddings: Optional[np.ndarray]) -> DuplicationResult:
+        use_index = existing_articles is None
+        if use_index:
+            existing_articles = self._indexed
         if not existing_articles:
             return DuplicationResult(is_duplicate=False, similarity_score=0.0)
 
+        if use_index:
+            result = self._hash_prefilter(new_article)
+            if result.is_duplicate:
+                return result
+
         new_text = self._prepare_text(new_article)
-        existing_texts = [self._prepare_text(a) for a in existing_articles]
+        existing_texts = self._indexed_texts if use_index else [self._prepare_text(a) for a in existing_articles]
+        
+        # Cheap sparse term similarities, used to gate the encoder and for the keyword check
+        if use_index and self._indexed_term_matrix is None:
+            self._indexed_term_matrix = vstack(self._indexed_term_rows, format='csr')
+        existing_vectors = self._indexed_term_matrix if use_index else None
+        term_similarities = self._term_similarities(new_text, existing_texts, existing_vectors)
+        # Texts sharing (almost) no terms with any stored article skip the transformer encode,
+        # unless a stored title is a SimHash near-match; the embedding threshold still decides
+        shares_terms = term_similarities is None or term_similarities.max() >= self.semantic_min_term_similarity
+        if use_index and not shares_terms:
+            shares_terms = self._has_similar_title(new_article)
         
         # First, try semantic check if model is available
-        if self.sentence_model:
-            result = self._semantic_similarity_check(new_text, existing_texts, existing_articles)
+        if self.sentence_model and shares_terms and use_index:
+            result = self._index_similarity_check(new_text)
+            if result.is_duplicate:
+                return result
+        elif self.sentence_model and shares_terms:
+            result = self._semantic_similarity_check(new_text, existing_texts, existing_articles, existing_embeddings)
             if result.is_duplicate:
                 return result
 
         # Fallback to TF-IDF check
-        result = self._tfidf_similarity_check(new_text, existing_texts, existing_articles)
+        result = self._tfidf_similarity_check(term_similarities, existing_articles)
         if result.is_duplicate:
             return result
             
         # Final quick check on normalized titles
-        result = self._simple_title_check(new_text, existing_texts, existing_articles)
+        if use_index and self._title_prefixes is None:
+            self._title_prefixes = self._build_title_prefixes(existing_texts)
+        prefixes = self._title_prefixes if use_index else None
+        result = self._simple_title_check(new_text, existing_texts, existing_articles, prefixes)
         if result.is_duplicate:
             return result
 
@@ -414,38 +664,46 @@ class SemanticDeduplicator:
         # Only use first 500 chars of body to avoid noise and save computation
         body = article.get('article_body', '')[:500]
         
-        text = f"{title} {description} {body}".strip()
-        return self._normalize_text(text)
+        # Stored articles are re-prepared on every check against an explicit list
+        key = (article['id'], title, description, body) if article.get('id') is not None else None
+        cached = self._prepared_texts.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+        
+        text = self._normalize_text(f"{title} {description} {body}".strip())
+        if key is not None:
+            self._prepared_texts[key] = text
+        return text
 
     def _normalize_text(self, text: any) -> str:
         """Normalize text for consistent comparison"""
         if not isinstance(text, str):
-            text = ""  # Treat non-strings (like NaN floats or None) as empty strings.
-
-        # Lowercase
-        text = text.lower()
-        # Remove punctuation
-        text = re.sub(r'[^\w\s]', '', text)
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+            return ""  # Treat non-strings (like NaN floats or None) as empty strings.
+        return normalize_text(text)
 
     def _semantic_similarity_check(self, new_text: str, existing_texts: List[str], 
-                                 existing_articles: List[Dict]) -> DuplicationResult:
+                                 existing_articles: List[Dict],
+                                 existing_embeddings: Optional[np.ndarray] = None) -> DuplicationResult:
         """Use sentence embeddings for semantic similarity check"""
         try:
-            new_embedding = self.sentence_model.encode(new_text, convert_to_tensor=True)
-            existing_embeddings = self.sentence_model.encode(existing_texts, convert_to_tensor=True)
-            
-            similarities = cosine_similarity(
-                new_embedding.reshape(1, -1),
-                existing_embeddings
-            )[0]
+            # Normalized embeddings make cosine similarity a dot product
+            if existing_embeddings is not None:
+                query = self.sentence_model.encode(new_text, convert_to_numpy=True, normalize_embeddings=True)
+                similarities = existing_embeddings @ query
+            else:
+                # One batched encode for the new text and the whole list
+                embeddings = self.sentence_model.encode(
+                    [new_text, *existing_texts],
+                    batch_size=64,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+                similarities = embeddings[1:] @ embeddings[0]
             
-            max_similarity = np.max(similarities)
+            most_similar_idx = int(np.argmax(similarities))
+            max_similarity = similarities[most_similar_idx]
             
             if max_similarity > self.similarity_threshold:
-                most_similar_idx = np.argmax(similarities)
                 return DuplicationResult(
                     is_duplicate=True,
                     similarity_score=float(max_similarity),
@@ -458,21 +716,84 @@ class SemanticDeduplicator:
         
         return DuplicationResult(is_duplicate=False, similarity_score=0.0)
 
-    def _tfidf_similarity_check(self, new_text: str, existing_texts: List[str], 
-                               existing_articles: List[Dict]) -> DuplicationResult:
-        """Use TF-IDF for keyword-based similarity check"""
+    def _article_hash(self, article: Dict) -> str:
+        return self.generate_content_hash(
+            article.get('title', ''), article.get('description', ''), article.get('article_body', '')
+        )
+
+    def _hash_prefilter(self, new_article: Dict) -> DuplicationResult:
+        """Exact content-hash match against the stored articles"""
+        match = self._indexed_hashes.get(self._article_hash(new_article))
+        if match is not None:
+            return DuplicationResult(
+                is_duplicate=True,
+                similarity_score=1.0,
+                similar_article_id=self._indexed[match]['id'],
+                similar_article_title=self._indexed[match]['title'],
+                confidence="high"
+            )
+        return DuplicationResult(is_duplicate=False, similarity_score=0.0)
+
+    def _has_similar_title(self, new_article: Dict) -> bool:
+        """Whether a stored title is a SimHash near-match; templated headlines collide, so this
+        only shortlists the article for the embedding check and never flags a duplicate itself"""
+        tokens = self._normalize_text(new_article.get('title', '')).split()
+        # Very short titles collide too easily to be useful
+        if len(tokens) < 3:
+            return False
+        distances = hamming_distances(self._title_simhashes[:len(self._indexed)], title_simhash(tokens))
+        return bool(distances.min() <= self.simhash_max_distance)
+
+    def _index_similarity_check(self, new_text: str) -> DuplicationResult:
+        """Score the new text against the stored embedding matrix with a single matrix-vector product"""
         try:
-            vectorizer = TfidfVectorizer().fit(existing_texts + [new_text])
+            query = self.sentence_model.encode(new_text, convert_to_numpy=True, normalize_embeddings=True)
+            count = len(self._indexed)
+            if self._scores is None or len(self._scores) < len(self._matrix):
+                self._scores = np.empty(len(self._matrix), dtype=np.float32)
+            similarities = np.dot(self._matrix[:count], query.astype(np.float32, copy=False), out=self._scores[:count])
             
-            existing_vectors = vectorizer.transform(existing_texts)
-            new_vector = vectorizer.transform([new_text])
+            most_similar_idx = int(np.argmax(similarities))
+            max_similarity = similarities[most_similar_idx]
             
-            similarities = cosine_similarity(new_vector, existing_vectors)[0]
-            max_similarity = np.max(similarities)
+            if max_similarity > self.similarity_threshold:
+                return DuplicationResult(
+                    is_duplicate=True,
+                    similarity_score=float(max_similarity),
+                    similar_article_id=self._indexed[most_similar_idx]['id'],
+                    similar_article_title=self._indexed[most_similar_idx]['title'],
+                    confidence="high"
+                )
+        except Exception as e:
+            logger.warning(f"Semantic similarity check failed: {e}")
+        
+        return DuplicationResult(is_duplicate=False, similarity_score=0.0)
+
+    def _term_similarities(self, new_text: str, existing_texts: List[str],
+                           existing_vectors: Optional[csr_matrix] = None) -> Optional[np.ndarray]:
+        """Cosine similarities of hashed term vectors, or None if they can't be computed"""
+        try:
+            # The hasher needs no fit, so only the texts without precomputed rows are transformed
+            if existing_vectors is None:
+                existing_vectors = self._hasher.transform(existing_texts)
+            new_vector = self._hasher.transform([new_text])
+            
+            # Rows are L2-normalized, so the sparse dot product is the cosine similarity
+            return (existing_vectors @ new_vector.T).toarray().ravel()
+        except Exception as e:
+            logger.warning(f"TF-IDF similarity check failed: {e}")
+            return None
+
+    def _tfidf_similarity_check(self, similarities: Optional[np.ndarray], existing_articles: List[Dict]) -> DuplicationResult:
+        """Use hashed term vectors for keyword-based similarity check"""
+        if similarities is None:
+            return DuplicationResult(is_duplicate=False, similarity_score=0.0)
+        try:
+            most_similar_idx = int(np.argmax(similarities))
+            max_similarity = similarities[most_similar_idx]
             
             # Use a slightly lower threshold for TF-IDF as it's less nuanced
             if max_similarity > (self.similarity_threshold - 0.05):
-                most_similar_idx = np.argmax(similarities)
                 return DuplicationResult(
                     is_duplicate=True,
                     similarity_score=float(max_similarity),
@@ -485,35 +806,47 @@ class SemanticDeduplicator:
             
         return DuplicationResult(is_duplicate=False, similarity_score=0.0)
 
+    @staticmethod
+    def _title_prefix(text: str) -> str:
+        return ' '.join(text.split(' ', 10)[:10]) # Approx first 10 words
+
+    @classmethod
+    def _build_title_prefixes(cls, texts: List[str]) -> Dict[str, int]:
+        prefixes: Dict[str, int] = {}
+        for i, text in enumerate(texts):
+            prefixes.setdefault(cls._title_prefix(text), i)
+        return prefixes
+
     def _simple_title_check(self, new_text: str, existing_texts: List[str], 
-                          existing_articles: List[Dict]) -> DuplicationResult:
+                          existing_articles: List[Dict],
+                          prefixes: Optional[Dict[str, int]] = None) -> DuplicationResult:
         """A very basic check on normalized titles for exact or near-exact matches"""
-        new_title = new_text.split(' ')[0:10] # Approx first 10 words
-        new_title_str = " ".join(new_title)
-
-        for i, text in enumerate(existing_texts):
-            existing_title = text.split(' ')[0:10]
-            existing_title_str = " ".join(existing_title)
-            
-            if new_title_str == existing_title_str:
-                return DuplicationResult(
-                    is_duplicate=True,
-                    similarity_score=1.0,
-                    similar_article_id=existing_articles[i]['id'],
-                    similar_article_title=existing_articles[i]['title'],
-                    confidence="low"
-                )
+        if prefixes is None:
+            prefixes = self._build_title_prefixes(existing_texts)
+        i = prefixes.get(self._title_prefix(new_text))
+        if i is not None:
+            return DuplicationResult(
+                is_duplicate=True,
+                similarity_score=1.0,
+                similar_article_id=existing_articles[i]['id'],
+                similar_article_title=existing_articles[i]['title'],
+                confidence="low"
+            )
         return DuplicationResult(is_duplicate=False, similarity_score=0.0)
 
     def generate_content_hash(self, title: str, description: str, article_body: str) -> str:
         """Generate a consistent hash for a given article's content."""
         
-        # Normalize content for hashing
+        # Normalize content for hashing; only the leading parts of description and body count
         norm_title = self._normalize_text(title)
-        norm_desc = self._normalize_text(description)
-        norm_body = self._normalize_text(article_body)
-        
-        # Combine the most important parts for the hash
-        content_string = f"{norm_title}|{norm_desc[:200]}|{norm_body[:500]}"
+        norm_desc = normalized_prefix(description, 200) if isinstance(description, str) else ""
+        norm_body = normalized_prefix(article_body, 500) if isinstance(article_body, str) else ""
         
-        return hashlib.sha256(content_string.encode('utf-8')).hexdigest()
\ No newline at end of file
+        # Stream the parts into the digest instead of joining them first
+        digest = hashlib.sha256(usedforsecurity=False)
+        digest.update(norm_title.encode('utf-8'))
+        digest.update(b'|')
+        digest.update(norm_desc.encode('utf-8'))
+        digest.update(b'|')
+        digest.update(norm_body.encode('utf-8'))
+        return digest.hexdigest()
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 from models.base import Article
 from repository.repository import ArticleRepository
@@ -6,9 +7,13 @@ from services.content_analyzer import ContentAnalyzer, SemanticDeduplicator
 from config.settings import Settings
 import logging
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 
 logger = logging.getLogger(__name__)
 
+# strptime formats tried after the ISO 8601 and RFC 2822 parsers
+FALLBACK_DATE_FORMATS = ('%B %d, %Y / %H:%M', '%d %B, %Y')
+
 class ContentService:
     def __init__(self, repository: ArticleRepository, analyzer: ContentAnalyzer, deduplicator: SemanticDeduplicator, settings: Settings):
         self.repository = repository
@@ -16,21 +21,120 @@ class ContentService:
         self.deduplicator = deduplicator
         self.settings = settings
 
+    # Concurrent analyses in process_articles, matching the analyzer's Gemini in-flight cap
+    ANALYSIS_WORKERS = ContentAnalyzer.GEMINI_MAX_IN_FLIGHT
+
     def process_article(self, article_data: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
         """
         Main entry point for processing a pulled article.
         Handles content analysis, deduplication, and saving.
         """
+        error = self._validate(article_data)
+        if error:
+            return False, error
+        article, error = self._build_article(article_data)
+        if article is None:
+            return False, error
+        error = self._similar_article_error(article)
+        if error:
+            return False, error
+        success, result = self._save_article(article)
+        if success:
+            self._register_saved([article])
+        return success, result
+
+    def process_articles(self, batch: List[Dict[str, Any]]) -> List[Tuple[bool, Dict[str, Any]]]:
+        """
+        Processes a batch of pulled articles, returning results in input order.
+        Analysis runs concurrently; near-duplicates of earlier articles are dropped, the rest are saved
+        in one transaction (duplicates within the batch resolve in input order) and indexed with one encode.
+        """
+        # Validation logs to the UI, which is only reachable from the calling thread
+        errors = [self._validate(article_data) for article_data in batch]
+        valid = [article_data for article_data, error in zip(batch, errors) if not error]
+        with ThreadPoolExecutor(max_workers=self.ANALYSIS_WORKERS) as executor:
+            built = iter(list(executor.map(self._build_article, valid)))
+        
+        outcomes = [(None, error) if error else next(built) for error in errors]
+        # Near-duplicates of articles saved earlier are dropped before the insert
+        for index, (article, _) in enumerate(outcomes):
+            error = self._similar_article_error(article) if article is not None else {}
+            if error:
+                outcomes[index] = (None, error)
+        articles = [article for article, _ in outcomes if article is not None]
         try:
-            # 1. Flexible data extraction
-            title = article_data.get('title') or article_data.get('Title')
-            url = article_data.get('url') or article_data.get('URL')
+            save_results = iter(self.repository.save_articles(articles))
+        except Exception as e:
+            logger.error(f"Error saving batch of {len(articles)} articles: {e}", exc_info=True)
+            save_results = iter([(False, str(e))] * len(articles))
+        
+        results = []
+        saved = []
+        for article, error in outcomes:
+            if article is None:
+                results.append((False, error))
+                continue
+            success, message = next(save_results)
+            if success:
+                saved.append(article)
+            results.append(self._save_result(article, success, message))
+        self._register_saved(saved)
+        return results
+
+    def _similar_article_error(self, article: Article) -> Dict[str, Any]:
+        """Returns a duplicate result if the deduplicator matches an article saved earlier, else an empty dict."""
+        if not self.settings.is_deduplication_enabled():
+            return {}
+        try:
+            duplicate = self.deduplicator.check_for_duplicates(self._dedup_entry(article))
+        except Exception as e:
+            logger.warning(f"Duplicate check failed for '{article.title}': {e}")
+            return {}
+        if not duplicate.is_duplicate:
+            return {}
+        return {
+            'status': 'duplicate',
+            'message': f"Article already exists (similar_content: article {duplicate.similar_article_id}, "
+                       f"score {duplicate.similarity_score:.2f}).",
+            'similar_article_id': duplicate.similar_article_id
+        }
+
+    def _register_saved(self, articles: List[Article]):
+        """Adds saved articles to the deduplicator's index so later pulls are checked against them."""
+        if not articles or not self.settings.is_deduplication_enabled():
+            return
+        try:
+            self.deduplicator.add_articles([self._dedup_entry(article) for article in articles])
+        except Exception as e:
+            logger.warning(f"Failed to index {len(articles)} saved articles for deduplication: {e}")
+
+    @staticmethod
+    def _dedup_entry(article: Article) -> Dict[str, Any]:
+        return {
+            'id': article.id,
+            'title': article.title,
+            'description': article.description,
+            'article_body': article.article_body
+        }
 
-            # 2. Basic validation
-            if not title or not url:
-                keys = list(article_data.keys())
-                self.repository.ui_logger.log(f"Validation failed: Missing title or URL. Available keys: {keys}")
-                return False, {"status": "error", "message": f"Missing title or URL. Available keys: {keys}"}
+    def _validate(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns an error result if the pulled data lacks a title or URL, else an empty dict."""
+        # 1. Flexible data extraction
+        title = article_data.get('title') or article_data.get('Title')
+        url = article_data.get('url') or article_data.get('URL')
+
+        # 2. Basic validation
+        if not title or not url:
+            keys = list(article_data.keys())
+            self.repository.ui_logger.log(f"Validation failed: Missing title or URL. Available keys: {keys}")
+            return {"status": "error", "message": f"Missing title or URL. Available keys: {keys}"}
+        return {}
+
+    def _build_article(self, article_data: Dict[str, Any]) -> Tuple[Optional[Article], Dict[str, Any]]:
+        """Analyzes validated data; returns the Article or None with an error result."""
+        title = article_data.get('title') or article_data.get('Title')
+        try:
+            url = article_data.get('url') or article_data.get('URL')
 
             # 3. Generate content hash (conditionally)
             if self.settings.is_deduplication_enabled():
@@ -51,6 +155,7 @@ class ContentService:
             
             # 5. Create Article object
             article = Article(
+                id=None,
                 title=title,
                 url=url,
                 source=article_data.get('source', 'Unknown'),
@@ -66,21 +171,33 @@ class ContentService:
                 ai_summary=analysis.ai_summary,
                 sentiment_score=analysis.sentiment_score
             )
-            
+            return article, {}
+                
+        except Exception as e:
+            logger.error(f"Error processing article '{title}': {e}", exc_info=True)
+            return None, {'status': 'error', 'message': str(e)}
+
+    def _save_article(self, article: Article) -> Tuple[bool, Dict[str, Any]]:
+        """Saves a built article."""
+        try:
             # 6. Save to database
             success, message = self.repository.save_article(article)
-            
-            if success:
-                return True, {'status': 'success', 'message': 'Article processed and saved', 'article_id': article.id}
-            elif message in ["duplicate_hash", "duplicate_url"]:
-                return False, {'status': 'duplicate', 'message': f'Article already exists ({message}).'}
-            else:
-                return False, {'status': 'db_error', 'message': message}
+            return self._save_result(article, success, message)
                 
         except Exception as e:
-            logger.error(f"Error processing article '{title}': {e}", exc_info=True)
+            logger.error(f"Error processing article '{article.title}': {e}", exc_info=True)
             return False, {'status': 'error', 'message': str(e)}
 
+    @staticmethod
+    def _save_result(article: Article, success: bool, message: str) -> Tuple[bool, Dict[str, Any]]:
+        """Maps a repository save outcome to the service's result dict."""
+        if success:
+            return True, {'status': 'success', 'message': 'Article processed and saved', 'article_id': article.id}
+        elif message in ["duplicate_hash", "duplicate_url"]:
+            return False, {'status': 'duplicate', 'message': f'Article already exists ({message}).'}
+        else:
+            return False, {'status': 'db_error', 'message': message}
+
     def enhance_article(self, article: Article) -> bool:
         """
         Runs AI analysis on an existing article and updates it.
@@ -115,8 +232,19 @@ class ContentService:
         # Handle ordinal suffixes (e.g., "10th June, 2025")
         cleaned_date_str = date_str.replace('st,', ',').replace('nd,', ',').replace('rd,', ',').replace('th,', ',')
 
+        # ISO 8601 covers '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%d %H:%M:%S' and '%Y-%m-%d'
+        try:
+            return datetime.fromisoformat(cleaned_date_str.rstrip('Z'))
+        except ValueError:
+            pass
+        # RFC 2822 feed dates ('%a, %d %b %Y %H:%M:%S %z')
+        try:
+            return parsedate_to_datetime(cleaned_date_str)
+        except (ValueError, TypeError):
+            pass
+
         # Add more formats here if needed
-        for fmt in ('%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%d %H:%M:%S', '%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%d', '%B %d, %Y / %H:%M', '%d %B, %Y'):
+        for fmt in FALLBACK_DATE_FORMATS:
             try:
                 return datetime.strptime(cleaned_date_str, fmt)
             except (ValueError, TypeError):
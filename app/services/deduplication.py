@@ -1,128 +1,243 @@
 # utils/deduplication.py
 import hashlib
+import os
 import re
+import sqlite3
+import threading
+from functools import lru_cache
 import numpy as np
-from typing import List, Tuple, Optional
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import vstack
+from typing import Dict, List, Tuple, Optional
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from models.base import Article
+from repository.repository import ArticleRepository
+from database.sqlite_manager import SQLiteManager
+from utils.ui_logger import UILogger
 
 # Download required NLTK data (run once)
 try:
-    nltk.data.find('tokenizers/punkt')
     nltk.data.find('corpora/stopwords')
 except LookupError:
-    nltk.download('punkt')
     nltk.download('stopwords')
 
+# Leading body characters that take part in the similarity comparison
+COMPARISON_BODY_CHARS = 500
+
+STOP_WORDS = frozenset(stopwords.words('english'))
+
+# normalize_text patterns, compiled once; site names and attribution words share one alternation
+NEWS_ARTIFACT_RE = re.compile(r'\b(?:inc42|entrackr|moneycontrol|startupnews|source|image|reuters|pti|ians)\b')
+URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+EMAIL_RE = re.compile(r'\S+@\S+')
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.]')
+
 class SemanticDeduplicator:
+    # Refit the IDF weights once this fraction of rows has been appended since the last fit
+    REFIT_GROWTH = 0.05
+
     def __init__(self, similarity_threshold: float = 0.85):
         self.similarity_threshold = similarity_threshold
-        self.stop_words = set(stopwords.words('english'))
-        self.vectorizer = TfidfVectorizer(
-            max_features=5000,
+        # Stateless term counts (no vocabulary to build or refit) with IDF weighting fitted on top
+        self.hasher = HashingVectorizer(
+            n_features=2**17,
             stop_words='english',
             ngram_range=(1, 2),
-            min_df=1,
-            max_df=0.95
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32  # Half the bytes streamed through the sparse similarity product
         )
+        self.tfidf = TfidfTransformer()
+        # Corpus registered via prepare(): hashed once, then new articles are only transformed
+        self.prepared_articles: List[dict] = []
+        self.prepared_counts = None
+        self.existing_matrix = None
+        self.fitted_rows = 0
+        # Normalized title -> first prepared article with it, for exact-title reposts
+        self.title_index: Dict[str, dict] = {}
+        # Title word sets of prepared articles and an inverted index word -> row positions,
+        # so the Jaccard fallback only scores articles sharing at least one title word
+        self.title_words: List[frozenset] = []
+        self.title_postings: Dict[str, List[int]] = {}
         
-    def normalize_text(self, text: str) -> str:
-        """Normalize text for better comparison"""
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def normalize_text(text: str) -> str:
+        """Normalize text for better comparison; cached since titles and descriptions recur within a batch"""
         if not text:
             return ""
         
-        # Convert to lowercase
+        # Convert to lowercase (whitespace runs need no collapsing: the final split absorbs them)
         text = text.lower()
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
         # Remove common news artifacts
-        text = re.sub(r'\b(inc42|entrackr|moneycontrol|startupnews)\b', '', text)
-        text = re.sub(r'\b(source|image|reuters|pti|ians)\b', '', text)
+        text = NEWS_ARTIFACT_RE.sub('', text)
         
-        # Remove URLs and email addresses
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        text = re.sub(r'\S+@\S+', '', text)
+        # Remove URLs and email addresses; a substring probe skips each scan when it can't match
+        if 'http' in text:
+            text = URL_RE.sub('', text)
+        if '@' in text:
+            text = EMAIL_RE.sub('', text)
         
         # Remove special characters but keep sentence structure
-        text = re.sub(r'[^\w\s\.]', ' ', text)
+        text = SPECIAL_CHARS_RE.sub(' ', text)
         
-        # Remove stopwords
-        tokens = word_tokenize(text)
-        tokens = [token for token in tokens if token not in self.stop_words and len(token) > 2]
+        # Remove stopwords; only spaces and periods are left as separators, so a split suffices
+        tokens = (token.rstrip('.') for token in text.split())
+        tokens = [token for token in tokens if len(token) > 2 and token not in STOP_WORDS]
         
         return ' '.join(tokens)
     
     def generate_content_hash(self, title: str, description: str, body: str) -> str:
         """Generate a semantic-aware content hash"""
+        return self.hash_from_normalized(*self._normalized_hash_parts(title, description, body))
+    
+    def generate_content_hashes(self, title: str, description: str, body: str) -> Tuple[str, str]:
+        """The content hash and its legacy SHA-256 form, normalizing the parts once"""
+        parts = self._normalized_hash_parts(title, description, body)
+        return self.hash_from_normalized(*parts), self.legacy_hash_from_normalized(*parts)
+    
+    def _normalized_hash_parts(self, title: str, description: str, body: str) -> Tuple[str, str, str]:
         # Normalize each component
         title_norm = self.normalize_text(title)
         desc_norm = self.normalize_text(description)
         body_norm = self.normalize_text(body[:1000])  # First 1000 chars
-        
+        return title_norm, desc_norm, body_norm
+    
+    @staticmethod
+    def _hash_content(title_norm: str, desc_norm: str, body_norm: str) -> bytes:
         # Weight title more heavily as it's most distinctive
-        content = f"{title_norm} {title_norm} {desc_norm} {body_norm}"
-        
-        return hashlib.sha256(content.encode()).hexdigest()
+        return f"{title_norm} {title_norm} {desc_norm} {body_norm}".encode()
     
-    def find_similar_articles(self, new_article: dict, existing_articles: List[dict]) -> List[Tuple[dict, float]]:
-        """Find articles similar to the new one"""
+    @staticmethod
+    def hash_from_normalized(title_norm: str, desc_norm: str, body_norm: str) -> str:
+        """Content hash from components that are already normalized"""
+        # Only compared for equality, so a 128-bit BLAKE2b digest is plenty and cheaper than SHA-256
+        content = SemanticDeduplicator._hash_content(title_norm, desc_norm, body_norm)
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def legacy_hash_from_normalized(title_norm: str, desc_norm: str, body_norm: str) -> str:
+        """SHA-256 content hash stored for articles saved before the switch to BLAKE2b"""
+        return hashlib.sha256(SemanticDeduplicator._hash_content(title_norm, desc_norm, body_norm)).hexdigest()
+    
+    def prepare(self, existing_articles: List[dict]):
+        """Hash a corpus and fit its IDF weights once, for later find_similar_articles calls to reuse"""
+        self.prepared_articles = list(existing_articles)
+        self.existing_matrix = None
+        self.title_index = {}
+        self.title_words = []
+        self.title_postings = {}
+        for article in self.prepared_articles:
+            self._index_title(article)
+        texts = [self._prepare_text_for_comparison(article) for article in self.prepared_articles]
+        self.prepared_counts = self.hasher.transform(texts) if texts else None
+        if self.prepared_articles:
+            self._fit_prepared()
+
+    def add_prepared(self, article: dict):
+        """Append an article to the prepared corpus, transforming it with the existing fit"""
+        self.prepared_articles.append(article)
+        self._index_title(article)
+        counts = self.hasher.transform([self._prepare_text_for_comparison(article)])
+        self.prepared_counts = counts if self.prepared_counts is None else vstack([self.prepared_counts, counts], format='csr')
+        if len(self.prepared_articles) - self.fitted_rows > self.REFIT_GROWTH * self.fitted_rows:
+            self.existing_matrix = None  # Refit lazily on the next lookup
+        if self.existing_matrix is not None:
+            self.existing_matrix = vstack([self.existing_matrix, self.tfidf.transform(counts)], format='csr')
+
+    def _index_title(self, article: dict):
+        title = self.normalize_text(article.get('title', ''))
+        if title:
+            self.title_index.setdefault(title, article)
+        words = frozenset(title.split())
+        for word in words:
+            self.title_postings.setdefault(word, []).append(len(self.title_words))
+        self.title_words.append(words)
+
+    def find_same_title(self, new_article: dict) -> Optional[dict]:
+        """The prepared article whose normalized title equals the new one's, if any"""
+        title = self.normalize_text(new_article.get('title', ''))
+        return self.title_index.get(title) if title else None
+
+    def _fit_prepared(self):
+        # Only the IDF weights are refit; the hashed counts are reused as-is
+        try:
+            self.existing_matrix = self.tfidf.fit_transform(self.prepared_counts)
+            self.fitted_rows = self.prepared_counts.shape[0]
+        except Exception:
+            self.existing_matrix = None
+
+    def find_similar_articles(self, new_article: dict, existing_articles: Optional[List[dict]] = None) -> List[Tuple[dict, float]]:
+        """Find articles similar to the new one
+
+        Without existing_articles, compares against the corpus registered via prepare().
+        """
+        use_prepared = existing_articles is None
+        if use_prepared:
+            existing_articles = self.prepared_articles
         if not existing_articles:
             return []
         
         # Prepare texts for comparison
         new_text = self._prepare_text_for_comparison(new_article)
-        existing_texts = [self._prepare_text_for_comparison(article) for article in existing_articles]
-        
-        # Add new text to fit the vectorizer
-        all_texts = existing_texts + [new_text]
         
         try:
-            # Create TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            
-            # Calculate similarities
-            new_vector = tfidf_matrix[-1]  # Last one is the new article
-            existing_vectors = tfidf_matrix[:-1]
-            
-            similarities = cosine_similarity(new_vector, existing_vectors).flatten()
+            if use_prepared:
+                if self.existing_matrix is None:
+                    self._fit_prepared()
+                if self.existing_matrix is None:
+                    raise ValueError("Prepared corpus could not be vectorized")
+                # Reuse the corpus fit; only the new article is transformed
+                existing_vectors = self.existing_matrix
+                new_vector = self.tfidf.transform(self.hasher.transform([new_text]))
+            else:
+                # Add new text to fit the IDF weights
+                existing_texts = [self._prepare_text_for_comparison(article) for article in existing_articles]
+                tfidf_matrix = self.tfidf.fit_transform(self.hasher.transform(existing_texts + [new_text]))
+                self.existing_matrix = None  # The prepared corpus no longer matches this fit
+                new_vector = tfidf_matrix[-1]  # Last one is the new article
+                existing_vectors = tfidf_matrix[:-1]
             
-            # Find similar articles above threshold
-            similar_articles = []
-            for i, similarity in enumerate(similarities):
-                if similarity >= self.similarity_threshold:
-                    similar_articles.append((existing_articles[i], similarity))
+            # TF-IDF rows are L2-normalized, so the sparse dot product is the cosine similarity;
+            # only its stored (non-zero) entries can clear a positive threshold, so it stays sparse
+            similarities = (existing_vectors @ new_vector.T).tocoo()
+            rows, scores = similarities.row, similarities.data
             
-            # Sort by similarity (highest first)
-            similar_articles.sort(key=lambda x: x[1], reverse=True)
-            return similar_articles
+            # Find similar articles above threshold, sorted by similarity (highest first)
+            keep = np.flatnonzero(scores >= self.similarity_threshold)
+            keep = keep[np.lexsort((rows[keep], -scores[keep]))]
+            return [(existing_articles[rows[j]], float(scores[j])) for j in keep]
             
         except Exception as e:
             # Fallback to simple text comparison
-            return self._simple_similarity_check(new_article, existing_articles)
+            return self._simple_similarity_check(new_article, existing_articles, use_prepared)
     
     def _prepare_text_for_comparison(self, article: dict) -> str:
         """Prepare article text for similarity comparison"""
         title = article.get('title', '')
         description = article.get('description', '')
-        body = article.get('article_body', '')[:500]  # First 500 chars
+        body = article.get('article_body', '')[:COMPARISON_BODY_CHARS]
         
-        # Combine and normalize
-        combined = f"{title} {description} {body}"
-        return self.normalize_text(combined)
+        # Normalize per component so title and description hit the same cache entries as the hash
+        parts = (self.normalize_text(title), self.normalize_text(description), self.normalize_text(body))
+        return ' '.join(part for part in parts if part)
     
-    def _simple_similarity_check(self, new_article: dict, existing_articles: List[dict]) -> List[Tuple[dict, float]]:
+    def _simple_similarity_check(self, new_article: dict, existing_articles: List[dict],
+                                 use_prepared: bool = False) -> List[Tuple[dict, float]]:
         """Fallback simple similarity check"""
         new_title_words = set(self.normalize_text(new_article.get('title', '')).split())
         similar_articles = []
         
-        for article in existing_articles:
-            existing_title_words = set(self.normalize_text(article.get('title', '')).split())
-            
+        if use_prepared:
+            # Articles sharing no title word have zero overlap, so only posting-list hits are scored
+            candidates = sorted({i for word in new_title_words for i in self.title_postings.get(word, ())})
+            pairs = ((existing_articles[i], self.title_words[i]) for i in candidates)
+        else:
+            pairs = ((article, set(self.normalize_text(article.get('title', '')).split())) for article in existing_articles)
+        
+        for article, existing_title_words in pairs:
             if len(new_title_words) > 0 and len(existing_title_words) > 0:
                 jaccard_similarity = len(new_title_words & existing_title_words) / len(new_title_words | existing_title_words)
                 
@@ -133,14 +248,56 @@ class SemanticDeduplicator:
 
 # Enhanced ArticleRepository with semantic deduplication
 class EnhancedArticleRepository(ArticleRepository):
-    def __init__(self, db_path: str):
-        super().__init__(db_path)
+    def __init__(self, db_manager: SQLiteManager, ui_logger: UILogger):
+        super().__init__(db_manager, ui_logger)
+        # The dedup queries open their own connections to the same database file
+        self.db_path = db_manager.db_name
         self.deduplicator = SemanticDeduplicator()
+        # Per-source fitted corpora, kept resident across CSV rows and extended on save
+        self._dedup_cache: Dict[str, SemanticDeduplicator] = {}
+        # One long-lived connection per thread instead of a connect/close per query
+        self._tls = threading.local()
     
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened and configured on first use."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._tls.conn = conn
+        return conn
+    
+    def prepare_dedup(self, source: str, limit: int = 1000) -> SemanticDeduplicator:
+        """Fetch a source's existing articles once and fit its cached deduplicator on them"""
+        # Only the compared fields, with the body cut to the compared prefix in SQL,
+        # instead of full Article objects converted to dicts
+        cursor = self._conn().execute('''
+            SELECT id, title, description, substr(article_body, 1, ?), url
+            FROM articles 
+            WHERE source = ? 
+            ORDER BY created_at DESC 
+            LIMIT ?
+        ''', (COMPARISON_BODY_CHARS, source, limit))
+        deduplicator = self._dedup_cache.setdefault(
+            source, SemanticDeduplicator(self.deduplicator.similarity_threshold)
+        )
+        deduplicator.prepare([
+            {
+                'id': article_id,
+                'title': title or '',
+                'description': description or '',
+                'article_body': body or '',
+                'url': url
+            }
+            for article_id, title, description, body, url in cursor
+        ])
+        return deduplicator
+
     def save_article_with_dedup_check(self, article: Article) -> dict:
-        """Save article with advanced deduplication checking"""
-        # Get existing articles from same source (for efficiency)
-        existing_articles = self.get_articles_by_source(article.source, limit=1000)
+        """Save article with advanced deduplication checking against the source's cached corpus"""
+        source_deduplicator = self._dedup_cache.get(article.source) or self.prepare_dedup(article.source)
         
         # Convert to dict format for deduplicator
         new_article_dict = {
@@ -150,21 +307,21 @@ class EnhancedArticleRepository(ArticleRepository):
             'url': article.url
         }
         
-        existing_articles_dict = [
-            {
-                'title': a.title,
-                'description': a.description, 
-                'article_body': a.article_body,
-                'url': a.url,
-                'id': a.id
+        # Exact reposts: same content hash already stored, or same normalized title in the corpus
+        content_hash, legacy_hash = self.deduplicator.generate_content_hashes(
+            article.title, article.description, article.article_body
+        )
+        exact_match = self._find_by_content_hash(content_hash, legacy_hash) or source_deduplicator.find_same_title(new_article_dict)
+        if exact_match:
+            return {
+                'status': 'duplicate',
+                'similarity_score': 1.0,
+                'similar_article': exact_match,
+                'all_similar': [(exact_match, 1.0)]
             }
-            for a in existing_articles
-        ]
         
         # Check for similar articles
-        similar_articles = self.deduplicator.find_similar_articles(
-            new_article_dict, existing_articles_dict
-        )
+        similar_articles = source_deduplicator.find_similar_articles(new_article_dict)
         
         if similar_articles:
             # Found similar articles
@@ -177,11 +334,10 @@ class EnhancedArticleRepository(ArticleRepository):
             }
         
         # No duplicates found, save the article
-        content_hash = self.deduplicator.generate_content_hash(
-            article.title, article.description, article.article_body
-        )
-        
         success = self._save_article_with_hash(article, content_hash)
+        if success:
+            # Later rows in the same batch are checked against this one too
+            source_deduplicator.add_prepared(dict(new_article_dict, id=article.id))
         
         return {
             'status': 'saved' if success else 'error',
@@ -190,28 +346,35 @@ class EnhancedArticleRepository(ArticleRepository):
     
     def get_articles_by_source(self, source: str, limit: int = 1000) -> List[Article]:
         """Get articles filtered by source"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        cursor = self._conn().execute('''
             SELECT * FROM articles 
             WHERE source = ? 
             ORDER BY created_at DESC 
             LIMIT ?
         ''', (source, limit))
         
-        rows = cursor.fetchall()
-        conn.close()
+        columns = [column[0] for column in cursor.description]
         
-        return [self._row_to_article(row) for row in rows]
+        return [self._row_to_article(dict(zip(columns, row))) for row in cursor.fetchall()]
+    
+    def _find_by_content_hash(self, content_hash: str, legacy_hash: Optional[str] = None) -> Optional[dict]:
+        """Look up a stored article by content hash (index probes on the UNIQUE column)
+
+        Rows saved before the BLAKE2b switch carry the SHA-256 form, so both are probed
+        until those rows age out.
+        """
+        row = self._conn().execute(
+            'SELECT id, title, url FROM articles WHERE content_hash IN (?, ?) LIMIT 1',
+            (content_hash, legacy_hash or content_hash)
+        ).fetchone()
+        return {'id': row[0], 'title': row[1], 'url': row[2]} if row else None
     
     def _save_article_with_hash(self, article: Article, content_hash: str) -> bool:
         """Save article with provided content hash"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
         try:
-            cursor.execute('''
+            cursor = conn.execute('''
                 INSERT INTO articles (
                     title, url, source, author, date, category, 
                     description, article_body, image_url, content_hash
@@ -220,11 +383,18 @@ class EnhancedArticleRepository(ArticleRepository):
                   article.date, article.category, article.description, 
                   article.article_body, article.image_url, content_hash))
             conn.commit()
+            article.id = cursor.lastrowid
             return True
         except sqlite3.IntegrityError:
+            conn.rollback()  # Leave the shared connection outside any transaction
             return False  # Duplicate
-        finally:
-            conn.close()
+
+# Columns read from scraper CSVs, with the value used when a column is absent
+CSV_COLUMN_DEFAULTS = {
+    'Title': '', 'URL': '', 'Author': 'Unknown', 'Date': '',
+    'Category': 'News', 'Description': '', 'ArticleBody': ''
+}
+CSV_CHUNK_SIZE = 500
 
 # Usage example in your CSV processing
 def process_csv_with_smart_deduplication(csv_file: str, source: str, repo: EnhancedArticleRepository):
@@ -234,26 +404,41 @@ def process_csv_with_smart_deduplication(csv_file: str, source: str, repo: Enhan
     if not os.path.exists(csv_file):
         return {'error': f"CSV file {csv_file} not found"}
     
-    df = pd.read_csv(csv_file)
     results = {
-        'total_processed': len(df),
+        'total_processed': 0,
         'new_articles': 0,
         'duplicates_found': 0,
         'duplicate_details': [],
         'errors': 0
     }
     
-    for _, row in df.iterrows():
+    # Keep the normalization cache scoped to one file
+    SemanticDeduplicator.normalize_text.cache_clear()
+    
+    # Refresh the source's cached corpus once for the whole file rather than per row
+    repo.prepare_dedup(source)
+    
+    # Stream the file in chunks of plain strings; missing columns get their defaults
+    chunks = pd.read_csv(csv_file, chunksize=CSV_CHUNK_SIZE, dtype=str, keep_default_na=False)
+    rows = (
+        row
+        for chunk in chunks
+        for row in chunk.reindex(columns=list(CSV_COLUMN_DEFAULTS)).fillna(CSV_COLUMN_DEFAULTS).itertuples(index=False)
+    )
+    
+    for row in rows:
+        results['total_processed'] += 1
         try:
             article = Article(
-                title=str(row.get('Title', '')).strip(),
-                url=str(row.get('URL', '')).strip(),
+                id=None,
+                title=row.Title.strip(),
+                url=row.URL.strip(),
                 source=source,
-                author=str(row.get('Author', 'Unknown')).strip(),
-                date=str(row.get('Date', '')).strip(),
-                category=str(row.get('Category', 'News')).strip(),
-                description=str(row.get('Description', '')).strip(),
-                article_body=str(row.get('ArticleBody', '')).strip()
+                author=row.Author.strip(),
+                date=row.Date.strip(),
+                category=row.Category.strip(),
+                description=row.Description.strip(),
+                article_body=row.ArticleBody.strip()
             )
             
             if not article.title or not article.url:
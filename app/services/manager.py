@@ -6,7 +6,7 @@ import os
 import time
 import logging
 import pandas as pd
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from services.content_service import ContentService
 from repository.repository import ArticleRepository
 from utils.ui_logger import UILogger
@@ -29,29 +29,43 @@ class ScraperManager:
         """
         Runs a single, specified scraper script and processes its output.
         """
+        start_time, error = self._run_script(scraper_name)
+        return self._finish_scraper(scraper_name, start_time, error)
+
+    def run_all(self, scraper_names: List[str], on_complete: Optional[Callable[[int, str], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Runs several scraper scripts concurrently and processes each output as it arrives.
+        Output processing (DB writes, UI logging) stays on the calling thread; results are in input order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(scraper_names)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._run_script, name): (i, name) for i, name in enumerate(scraper_names)}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                i, name = futures[future]
+                start_time, error = future.result()
+                results[i] = self._finish_scraper(name, start_time, error)
+                if on_complete:
+                    on_complete(done, name)
+        return results
+
+    def _run_script(self, scraper_name: str) -> Tuple[float, Optional[Tuple[str, str]]]:
+        """Runs a scraper script, timed from when the worker picks it up (not when it was queued).
+
+        Returns the start time and _execute_script's result.
+        """
         start_time = time.time()
-        
-        def create_error_result(error_msg: str, status: str = 'failed') -> Dict[str, Any]:
-            """Helper to create a consistent error dictionary."""
-            duration = time.time() - start_time
-            self.repository.log_activity(f"Data Pull Error: {scraper_name}", error_msg, "error")
-            return {
-                "status": status,
-                "scraper_name": scraper_name,
-                "error_message": error_msg,
-                "duration": duration,
-                "articles_found": 0,
-                "new_articles": 0,
-            }
+        return start_time, self._execute_script(scraper_name)
 
+    def _execute_script(self, scraper_name: str) -> Optional[Tuple[str, str]]:
+        """Runs a scraper script; returns (error message, status) on failure, None on success."""
         if scraper_name not in self.scraper_configs:
-            return create_error_result("Configuration not found")
+            return "Configuration not found", 'failed'
 
         config = self.scraper_configs[scraper_name]
         script_path = config.get('script_path')
 
         if not script_path or not os.path.exists(script_path):
-            return create_error_result(f"Scraper script not found at {script_path}")
+            return f"Scraper script not found at {script_path}", 'failed'
 
         try:
             # Ensure output directory exists
@@ -77,18 +91,36 @@ class ScraperManager:
             
             if result.returncode != 0:
                 raise subprocess.CalledProcessError(result.returncode, script_path, output=result.stdout, stderr=result.stderr)
-
-            # Process the output CSV
-            return self._process_output(scraper_name, config, time.time() - start_time)
+            return None
 
         except subprocess.TimeoutExpired:
-            return create_error_result(f"Timeout after {config.get('timeout', 300)}s.", status='timeout')
+            return f"Timeout after {config.get('timeout', 300)}s.", 'timeout'
         except subprocess.CalledProcessError as e:
             # Capture stderr for better error reporting
             error_details = e.stderr or e.output or "No output from script."
-            return create_error_result(f"Scraper script failed with return code {e.returncode}. Details: {error_details[:500]}")
+            return f"Scraper script failed with return code {e.returncode}. Details: {error_details[:500]}", 'failed'
         except Exception as e:
-            return create_error_result(f"An unexpected error occurred: {str(e)}")
+            return f"An unexpected error occurred: {str(e)}", 'failed'
+
+    def _finish_scraper(self, scraper_name: str, start_time: float, error: Optional[Tuple[str, str]]) -> Dict[str, Any]:
+        """Processes a finished script's output, or builds the error result for a failed one."""
+        if error is None:
+            try:
+                # Process the output CSV
+                return self._process_output(scraper_name, self.scraper_configs[scraper_name], time.time() - start_time)
+            except Exception as e:
+                error = f"An unexpected error occurred: {str(e)}", 'failed'
+
+        error_msg, status = error
+        self.repository.log_activity(f"Data Pull Error: {scraper_name}", error_msg, "error")
+        return {
+            "status": status,
+            "scraper_name": scraper_name,
+            "error_message": error_msg,
+            "duration": time.time() - start_time,
+            "articles_found": 0,
+            "new_articles": 0,
+        }
 
     def _process_output(self, scraper_name: str, config: Dict[str, Any], duration: float) -> Dict[str, Any]:
         """Reads the CSV output of a scraper and sends it to the ContentService."""
@@ -112,13 +144,15 @@ class ScraperManager:
             new_count = 0
             duplicate_count = 0
             
-            for i, article_data in enumerate(articles_data):
-                url = article_data.get('url', f"Article-{i}")
-                self.ui_logger.log(f"--- Processing article {i+1}/{len(articles_data)} ({url}) ---")
+            for article_data in articles_data:
                 # Add source from config
                 article_data['source'] = config.get('source_name', scraper_name)
-                # Let the content service handle the rest
-                is_new, result = self.content_service.process_article(article_data)
+            # Let the content service handle the rest; results come back in input order
+            results = self.content_service.process_articles(articles_data)
+            
+            for i, (article_data, (is_new, result)) in enumerate(zip(articles_data, results)):
+                url = article_data.get('url', f"Article-{i}")
+                self.ui_logger.log(f"--- Processed article {i+1}/{len(articles_data)} ({url}) ---")
                 self.ui_logger.log(f"-> Result from ContentService: is_new={is_new}, message='{result.get('message')}'")
                 if is_new:
                     new_count += 1
@@ -9,9 +9,10 @@ import sys
 import time
 import psutil
 import psycopg2
+from psycopg2.extras import execute_values
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add parent directory to path to import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,17 +22,29 @@ from config.settings import Settings
 def get_system_metrics() -> Dict[str, Any]:
     """Get system performance metrics"""
     return {
-        'cpu_percent': psutil.cpu_percent(interval=1),
+        # Non-blocking: usage since the previous call (primed once in main)
+        'cpu_percent': psutil.cpu_percent(interval=None),
         'memory_percent': psutil.virtual_memory().percent,
         'disk_usage': psutil.disk_usage('/').percent,
         'load_average': os.getloadavg()[0] if hasattr(os, 'getloadavg') else 0,
         'timestamp': datetime.now()
     }
 
-def check_database_health(db_params: Dict[str, str]) -> Dict[str, Any]:
+def connect(db_params: Dict[str, str], conn=None):
+    """Return conn if it is still open, otherwise a new connection (None if that fails)"""
+    if conn is not None and not conn.closed:
+        return conn
+    try:
+        return psycopg2.connect(**db_params)
+    except Exception as e:
+        logging.error(f"Failed to connect to database: {e}")
+        return None
+
+def check_database_health(conn) -> Dict[str, Any]:
     """Check database connection and basic metrics"""
     try:
-        conn = psycopg2.connect(**db_params)
+        if conn is None:
+            raise ConnectionError("No database connection")
         cursor = conn.cursor()
         
         # Check connection
@@ -56,7 +69,8 @@ def check_database_health(db_params: Dict[str, str]) -> Dict[str, Any]:
         """)
         table_stats = cursor.fetchall()
         
-        conn.close()
+        # End the read transaction so the connection doesn't sit idle in it until the next check
+        conn.rollback()
         
         return {
             'status': 'healthy',
@@ -72,25 +86,28 @@ def check_database_health(db_params: Dict[str, str]) -> Dict[str, Any]:
             'timestamp': datetime.now()
         }
 
-def log_metrics(metrics: Dict[str, Any], db_params: Dict[str, str]):
+def log_metrics(metrics: Dict[str, Any], conn):
     """Log metrics to database"""
+    if conn is None:
+        return
     try:
-        conn = psycopg2.connect(**db_params)
         cursor = conn.cursor()
         
-        # Insert system metrics
-        for metric_name, value in metrics.items():
-            if isinstance(value, (int, float)):
-                cursor.execute("""
-                    INSERT INTO monitoring.system_metrics (metric_name, metric_value, metric_unit)
-                    VALUES (%s, %s, %s)
-                """, (metric_name, value, '%' if 'percent' in metric_name else None))
+        # Insert system metrics in one multi-row statement (executemany sends one per row)
+        execute_values(cursor, """
+            INSERT INTO monitoring.system_metrics (metric_name, metric_value, metric_unit)
+            VALUES %s
+        """, [
+            (metric_name, value, '%' if 'percent' in metric_name else None)
+            for metric_name, value in metrics.items() if isinstance(value, (int, float))
+        ])
         
         conn.commit()
-        conn.close()
         
     except Exception as e:
         logging.error(f"Failed to log metrics: {e}")
+        if not conn.closed:
+            conn.rollback()
 
 def main():
     """Main monitoring loop"""
@@ -110,11 +127,17 @@ def main():
     
     logging.info("Starting system monitoring...")
     
+    # One connection for the whole loop, reopened only after it drops
+    conn: Optional[Any] = None
+    # Prime the CPU counter so each loop's reading covers the time since the last one
+    psutil.cpu_percent(interval=None)
+    
     try:
         while True:
             # Collect metrics
             system_metrics = get_system_metrics()
-            db_health = check_database_health(db_params)
+            conn = connect(db_params, conn)
+            db_health = check_database_health(conn)
             
             # Log to console
             logging.info(f"CPU: {system_metrics['cpu_percent']:.1f}%, "
@@ -124,7 +147,7 @@ def main():
             logging.info(f"Database: {db_health['status']}")
             
             # Log to database
-            log_metrics(system_metrics, db_params)
+            log_metrics(system_metrics, conn)
             
             # Check thresholds and alert if needed
             if system_metrics['cpu_percent'] > 80:
@@ -143,6 +166,9 @@ def main():
         logging.info("Monitoring stopped by user")
     except Exception as e:
         logging.error(f"Monitoring error: {e}")
+    finally:
+        if conn is not None and not conn.closed:
+            conn.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
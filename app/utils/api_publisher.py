@@ -1,12 +1,15 @@
 # api/publisher.py
-import requests
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 import time
+import random
 import logging
 import json
 import base64
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import hashlib
 import os
 import streamlit as st
@@ -23,25 +26,50 @@ class PublishingPlatform:
     endpoint: str
     auth_config: Dict[str, str]
     default_settings: Dict[str, Any]
-
-@dataclass
-class PublishResult:
-    status: PublishStatus
-    article_id: int
-    article_title: str
-    platform: str
-    external_id: Optional[str] = None
-    error_message: Optional[str] = None
-    retry_count: int = 0
-    published_url: Optional[str] = None
+    auth_header: Optional[str] = None
 
 class APIPublisher:
+    MAX_KEEPALIVE_CONNECTIONS = 16
+    MAX_CONNECTIONS = 64
+    PUBLISH_WORKERS = 16
+    # 4xx responses worth retrying: request timeout, too early, rate limited
+    RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+
     def __init__(self, config: Dict[str, Any], repository: ArticleRepository):
         self.config = config
         self.repository = repository
         self.platforms = self._load_publishing_platforms()
         self.max_retries = 3
         self.retry_delay = 5
+        self.max_delay = 30
+        self.client = self._create_client()
+        # Use the backend API URL from environment
+        backend_api_url = os.getenv('BACKEND_API_URL', '').rstrip('/')
+        self.custom_api_endpoint = f"{backend_api_url}/v1/article"
+        if 'custom_api' in self.platforms and not backend_api_url:
+            logger.error("BACKEND_API_URL is not set; disabling the custom_api publishing platform")
+            del self.platforms['custom_api']
+        self.handlers = {
+            'wordpress': self._publish_to_wordpress,
+            'custom_api': self._publish_to_custom_api,
+            'ghost': self._publish_to_ghost,
+            'webhook': self._publish_to_webhook,
+        }
+
+    def _create_client(self) -> httpx.Client:
+        """Create a pooled HTTP/2 client so concurrent publishes to one host share a connection"""
+        limits = httpx.Limits(max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS, max_connections=self.MAX_CONNECTIONS)
+        return httpx.Client(http2=True, limits=limits, timeout=30, follow_redirects=True)
+
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _load_publishing_platforms(self) -> Dict[str, PublishingPlatform]:
         """Load publishing platform configurations"""
@@ -54,14 +82,25 @@ class APIPublisher:
                     enabled=True,
                     endpoint=platform_config['endpoint'],
                     auth_config=platform_config.get('auth', {}),
-                    default_settings=platform_config.get('defaults', {})
+                    default_settings=platform_config.get('defaults', {}),
+                    auth_header=self._build_auth_header(platform_config.get('auth', {}))
                 )
         
         return platforms
     
+    @staticmethod
+    def _build_auth_header(auth: Dict[str, str]) -> Optional[str]:
+        """Build the Authorization header once per platform instead of per article"""
+        if 'username' in auth and 'password' in auth:
+            credentials = base64.b64encode(f"{auth['username']}:{auth['password']}".encode()).decode()
+            return f'Basic {credentials}'
+        if 'api_key' in auth:
+            return f'Bearer {auth["api_key"]}'
+        return None
+
     def is_platform_enabled(self, platform: str) -> bool:
         """Checks if a given publishing platform is enabled in the config."""
-        return self.config.get('publishing', {}).get(platform, {}).get('enabled', False)
+        return platform in self.platforms
 
     def publish_articles(self, article_ids: List[int], platform: str) -> List[PublishResult]:
         """Publish multiple articles to specified platform"""
@@ -69,61 +108,64 @@ class APIPublisher:
             logger.warning(f"Publishing platform '{platform}' is not enabled.")
             return []
 
-        results = []
+        articles_by_id = self.repository.get_articles_by_ids(article_ids)
+        articles = []
         for article_id in article_ids:
-            article = self.repository.get_article_by_id(article_id)
-            print(f"Article: {article}")
+            article = articles_by_id.get(article_id)
             if article:
-                result = self._publish_single_article(article, platform)
-                results.append(result)
-                # Log the outcome
-                status = "success" if result.status == PublishStatus.SUCCESS else "error"
-                details = f"Published to {platform}."
-                if result.error_message:
-                    details += f" Error: {result.error_message}"
-                self.repository.log_activity("Article Publish", details, status)
+                logger.debug("Publishing article id=%s", article.id)
+                articles.append(article)
             else:
                 logger.warning(f"Could not find article with ID {article_id} to publish.")
+        if not articles:
+            return []
+
+        # Session state is only readable from the Streamlit script thread
+        id_token = st.session_state.get('id_token')
+        # Publishes are independent round trips, so they run concurrently over the shared client pool
+        with ThreadPoolExecutor(max_workers=min(self.PUBLISH_WORKERS, len(articles))) as executor:
+            results = list(executor.map(lambda article: self._publish_single_article(article, platform, id_token), articles))
+
+        for result in results:
+            # Log the outcome
+            status = "success" if result.status == PublishStatus.SUCCESS else "error"
+            details = f"Published to {platform}."
+            if result.error_message:
+                details += f" Error: {result.error_message}"
+            self.repository.log_activity("Article Publish", details, status)
         return results
     
-    def _publish_single_article(self, article: Article, platform: str) -> PublishResult:
+    def _publish_single_article(self, article: Article, platform: str, id_token: Optional[str] = None) -> PublishResult:
         """Publish a single article with retry logic"""
         platform_config = self.platforms[platform]
+        handler = self.handlers.get(platform)
+        if handler is None:
+            return PublishResult(
+                article_id=article.id,
+                article_title=article.title,
+                platform=platform,
+                status=PublishStatus.FAILED,
+                error_message=f"Unknown platform type: {platform}"
+            )
         for attempt in range(self.max_retries + 1):
             try:
                 logger.info(f"Publishing article {article.id} to {platform} (attempt {attempt + 1})")
-                
-                if platform == 'wordpress':
-                    result = self._publish_to_wordpress(article, platform_config)
-                elif platform == 'custom_api':
-                    result = self._publish_to_custom_api(article, platform_config)
-                elif platform == 'ghost':
-                    result = self._publish_to_ghost(article, platform_config)
-                elif platform == 'webhook':
-                    result = self._publish_to_webhook(article, platform_config)
-                else:
-                    return PublishResult(
-                        article_id=article.id,
-                        article_title=article.title,
-                        platform=platform,
-                        status=PublishStatus.FAILED,
-                        error_message=f"Unknown platform type: {platform}"
-                    )
+                result = handler(article, platform_config, id_token)
                 
                 if result.status == PublishStatus.SUCCESS:
                     logger.info(f"Successfully published article {article.id} to {platform}")
                     return result
-                elif result.status == PublishStatus.FAILED and attempt < self.max_retries:
+                elif result.status == PublishStatus.FAILED and attempt < self.max_retries and result.retryable:
                     logger.warning(f"Attempt {attempt + 1} failed for article {article.id}: {result.error_message}")
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    self._backoff(attempt, result.retry_after)
                     result.retry_count = attempt + 1
                 else:
                     return result
                     
             except Exception as e:
                 logger.error(f"Unexpected error publishing article {article.id}: {e}")
-                if attempt < self.max_retries:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                if attempt < self.max_retries and isinstance(e, httpx.TransportError):
+                    self._backoff(attempt)
                 else:
                     return PublishResult(
                         article_id=article.id,
@@ -142,11 +184,61 @@ class APIPublisher:
             error_message="Max retries exceeded"
         )
     
-    def _publish_to_wordpress(self, article: Article, platform: PublishingPlatform) -> PublishResult:
+    def _is_retryable_status(self, status_code: int) -> bool:
+        """Only server errors and throttling responses can succeed on a retry"""
+        return status_code >= 500 or status_code in self.RETRYABLE_CLIENT_ERRORS
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None):
+        """Sleep with capped exponential backoff and full jitter so concurrent retries do not align"""
+        if retry_after is not None:
+            # Publishing blocks the Streamlit script, so server hints are capped too
+            time.sleep(min(self.max_delay, retry_after))
+            return
+        delay = min(self.max_delay, self.retry_delay * (2 ** attempt))
+        time.sleep(random.uniform(0, delay))
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given either as seconds or as an HTTP date"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _http_failure(self, article: Article, platform: PublishingPlatform, response: httpx.Response) -> PublishResult:
+        """Build a failed result that keeps the status code for retry classification"""
+        return PublishResult(
+            article_id=article.id,
+            article_title=article.title,
+            platform=platform.name,
+            status=PublishStatus.FAILED,
+            error_message=f"HTTP {response.status_code}: {response.text[:200]}",
+            status_code=response.status_code,
+            retry_after=self._parse_retry_after(response.headers.get('Retry-After')),
+            retryable=self._is_retryable_status(response.status_code)
+        )
+
+    def _exception_failure(self, article: Article, platform: PublishingPlatform, error: Exception) -> PublishResult:
+        """Build a failed result; only transport errors are retried, since any other failure
+        (bad config, an unparseable reply to a request that already succeeded) would repeat or re-post"""
+        return PublishResult(
+            article_id=article.id,
+            article_title=article.title,
+            platform=platform.name,
+            status=PublishStatus.FAILED,
+            error_message=str(error),
+            retryable=isinstance(error, httpx.TransportError)
+        )
+
+    def _publish_to_wordpress(self, article: Article, platform: PublishingPlatform, id_token: Optional[str] = None) -> PublishResult:
         """Publish to WordPress using REST API"""
         try:
-            auth = platform.auth_config
-            
             # Prepare post data
             post_data = {
                 'title': article.title,
@@ -166,15 +258,9 @@ class APIPublisher:
             }
             
             # Set up authentication
-            if 'username' in auth and 'password' in auth:
-                credentials = base64.b64encode(f"{auth['username']}:{auth['password']}".encode()).decode()
-                headers = {
-                    'Authorization': f'Basic {credentials}',
-                    'Content-Type': 'application/json'
-                }
-            elif 'api_key' in auth:
+            if platform.auth_header:
                 headers = {
-                    'Authorization': f'Bearer {auth["api_key"]}',
+                    'Authorization': platform.auth_header,
                     'Content-Type': 'application/json'
                 }
             else:
@@ -186,7 +272,7 @@ class APIPublisher:
                     error_message="No valid authentication configured"
                 )
             
-            response = requests.post(platform.endpoint, json=post_data, headers=headers, timeout=30)
+            response = self.client.post(platform.endpoint, json=post_data, headers=headers, timeout=30)
             
             if response.status_code in [200, 201]:
                 wp_post = response.json()
@@ -199,24 +285,12 @@ class APIPublisher:
                     published_url=wp_post.get('link')
                 )
             else:
-                return PublishResult(
-                    article_id=article.id,
-                    article_title=article.title,
-                    platform=platform.name,
-                    status=PublishStatus.FAILED,
-                    error_message=f"HTTP {response.status_code}: {response.text[:200]}"
-                )
+                return self._http_failure(article, platform, response)
                 
         except Exception as e:
-            return PublishResult(
-                article_id=article.id,
-                article_title=article.title,
-                platform=platform.name,
-                status=PublishStatus.FAILED,
-                error_message=str(e)
-            )
+            return self._exception_failure(article, platform, e)
     
-    def _publish_to_custom_api(self, article: Article, platform: PublishingPlatform) -> PublishResult:
+    def _publish_to_custom_api(self, article: Article, platform: PublishingPlatform, id_token: Optional[str] = None) -> PublishResult:
         """Publish to custom API"""
         try:
             auth = platform.auth_config
@@ -237,18 +311,14 @@ class APIPublisher:
             # Set up headers
             headers = {'Content-Type': 'application/json'}
             if 'api_key' in auth:
-                if 'id_token' in st.session_state:
-                    headers['Authorization'] = f"Bearer {st.session_state['id_token']}"
+                if id_token:
+                    headers['Authorization'] = f"Bearer {id_token}"
                 else:
                     headers['Authorization'] = f"Bearer {auth['api_key']}"
             if 'custom_headers' in platform.default_settings:
                 headers.update(platform.default_settings['custom_headers'])
             
-            
-            # Use the backend API URL from environment
-            endpoint = f"{os.getenv('BACKEND_API_URL', '').rstrip('/')}/v1/article"
-            
-            response = requests.post(endpoint, json=article_data, headers=headers, timeout=30)
+            response = self.client.post(self.custom_api_endpoint, json=article_data, headers=headers, timeout=30)
             
             if response.status_code in [200, 201]:
                 api_response = response.json()
@@ -269,25 +339,12 @@ class APIPublisher:
                     error_message="Article has already been published"
                 )
             else:
-                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                return PublishResult(
-                    article_id=article.id,
-                    article_title=article.title,
-                    platform=platform.name,
-                    status=PublishStatus.FAILED,
-                    error_message=error_msg
-                )
+                return self._http_failure(article, platform, response)
                 
         except Exception as e:
-            return PublishResult(
-                article_id=article.id,
-                article_title=article.title,
-                platform=platform.name,
-                status=PublishStatus.FAILED,
-                error_message=str(e)
-            )
+            return self._exception_failure(article, platform, e)
     
-    def _publish_to_ghost(self, article: Article, platform: PublishingPlatform) -> PublishResult:
+    def _publish_to_ghost(self, article: Article, platform: PublishingPlatform, id_token: Optional[str] = None) -> PublishResult:
         """Publish to Ghost CMS"""
         try:
             # Ghost implementation would go here
@@ -300,15 +357,9 @@ class APIPublisher:
                 error_message="Ghost publishing not implemented yet"
             )
         except Exception as e:
-            return PublishResult(
-                article_id=article.id,
-                article_title=article.title,
-                platform=platform.name,
-                status=PublishStatus.FAILED,
-                error_message=str(e)
-            )
+            return self._exception_failure(article, platform, e)
     
-    def _publish_to_webhook(self, article: Article, platform: PublishingPlatform) -> PublishResult:
+    def _publish_to_webhook(self, article: Article, platform: PublishingPlatform, id_token: Optional[str] = None) -> PublishResult:
         """Publish via webhook"""
         try:
             # Prepare webhook payload
@@ -339,7 +390,7 @@ class APIPublisher:
                 signature = hashlib.sha256((payload_str + secret).encode()).hexdigest()
                 headers['X-Webhook-Signature'] = signature
             
-            response = requests.post(platform.endpoint, json=payload, headers=headers, timeout=30)
+            response = self.client.post(platform.endpoint, json=payload, headers=headers, timeout=30)
             
             if response.status_code in [200, 201, 202]:
                 return PublishResult(
@@ -350,22 +401,10 @@ class APIPublisher:
                     external_id=f"webhook_{int(time.time())}"
                 )
             else:
-                return PublishResult(
-                    article_id=article.id,
-                    article_title=article.title,
-                    platform=platform.name,
-                    status=PublishStatus.FAILED,
-                    error_message=f"HTTP {response.status_code}: {response.text[:200]}"
-                )
+                return self._http_failure(article, platform, response)
                 
         except Exception as e:
-            return PublishResult(
-                article_id=article.id,
-                article_title=article.title,
-                platform=platform.name,
-                status=PublishStatus.FAILED,
-                error_message=str(e)
-            )
+            return self._exception_failure(article, platform, e)
     
     def _format_article_content(self, article: Article) -> str:
         """Format article content for publishing"""
@@ -405,10 +444,7 @@ class APIPublisher:
     def _get_article_by_id(self, article_id: int) -> Optional[Article]:
         """Get article by ID from repository"""
         try:
-            articles = self.repository.get_articles(limit=1)  # This would need to be modified to get by ID
-            # For now, we'll need to add a get_by_id method to the repository
-            # This is a placeholder
-            return None
+            return self.repository.get_article_by_id(article_id)
         except Exception as e:
             logger.error(f"Error getting article {article_id}: {e}")
             return None
@@ -0,0 +1,65 @@
+# tests/conftest.py
+import pytest
+import os
+import hashlib
+import numpy as np
+import tempfile
+import shutil
+from unittest.mock import Mock
+
+# Application modules import each other from the app directory
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+from database.sqlite_manager import SQLiteManager
+from repository.repository import ArticleRepository
+import services.content_analyzer as content_analyzer
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory for tests"""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+@pytest.fixture
+def db_manager(temp_dir):
+    """Test database manager"""
+    db_path = os.path.join(temp_dir, 'test.db')
+    manager = SQLiteManager(db_path)
+    return manager
+
+@pytest.fixture
+def repository(db_manager):
+    """Test repository; the UI logger is only written to"""
+    repository = ArticleRepository(db_manager, Mock())
+    yield repository
+    repository.close()
+
+class FakeSentenceEncoder:
+    """Stands in for the sentence transformer: hashed bag-of-words vectors, L2-normalized"""
+    DIMENSIONS = 256
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, normalize_embeddings=True, **kwargs):
+        self.calls += 1
+        single = isinstance(texts, str)
+        vectors = np.zeros((1 if single else len(texts), self.DIMENSIONS), dtype=np.float32)
+        for row, text in enumerate([texts] if single else texts):
+            for word in text.split():
+                vectors[row, int(hashlib.md5(word.encode()).hexdigest(), 16) % self.DIMENSIONS] += 1
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors[0] if single else vectors
+
+@pytest.fixture
+def sentence_encoder(monkeypatch):
+    """Fake encoder handed to every SemanticDeduplicator created in the test"""
+    encoder = FakeSentenceEncoder()
+    monkeypatch.setattr(content_analyzer, 'get_sentence_model', lambda: encoder)
+    return encoder
+
+@pytest.fixture
+def deduplicator(sentence_encoder):
+    return content_analyzer.SemanticDeduplicator()
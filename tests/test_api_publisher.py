@@ -0,0 +1,113 @@
+# tests/test_api_publisher.py
+import httpx
+import pytest
+from unittest.mock import Mock
+
+import utils.api_publisher as api_publisher
+from models.base import Article, PublishStatus
+from utils.api_publisher import APIPublisher
+
+ENDPOINT = "https://hooks.example.com/articles"
+
+def article():
+    return Article(id=7, title="Title", url="https://example.com/7", source="Source", article_body="Body")
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(api_publisher.time, 'sleep', recorded.append)
+    return recorded
+
+@pytest.fixture
+def publisher_for():
+    """Builds a webhook publisher whose requests are answered by the given handler"""
+    publishers = []
+
+    def build(handler):
+        config = {'publishing': {'webhook': {'enabled': True, 'endpoint': ENDPOINT}}}
+        publisher = APIPublisher(config, Mock())
+        publisher.client.close()
+        publisher.client = httpx.Client(transport=httpx.MockTransport(handler))
+        publishers.append(publisher)
+        return publisher
+
+    yield build
+    for publisher in publishers:
+        publisher.close()
+
+def respond(*responses):
+    """Handler replaying the given (status, headers) pairs and counting calls"""
+    calls = []
+
+    def handler(request):
+        status, headers = responses[min(len(calls), len(responses) - 1)]
+        calls.append(request)
+        return httpx.Response(status, headers=headers, text="reply")
+
+    return handler, calls
+
+class TestRetryClassification:
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 409, 422])
+    def test_client_errors_are_not_retried(self, publisher_for, sleeps, status):
+        handler, calls = respond((status, {}))
+        result = publisher_for(handler)._publish_single_article(article(), 'webhook')
+        assert result.status == PublishStatus.FAILED
+        assert result.status_code == status
+        assert not result.retryable
+        assert len(calls) == 1
+        assert sleeps == []
+
+    @pytest.mark.parametrize("status", [408, 425, 429, 500, 502, 503])
+    def test_server_errors_and_throttling_are_retried(self, publisher_for, sleeps, status):
+        handler, calls = respond((status, {}))
+        publisher = publisher_for(handler)
+        result = publisher._publish_single_article(article(), 'webhook')
+        assert result.status == PublishStatus.FAILED
+        assert result.retryable
+        assert len(calls) == publisher.max_retries + 1
+        assert len(sleeps) == publisher.max_retries
+
+    def test_retry_then_success(self, publisher_for, sleeps):
+        handler, calls = respond((503, {}), (202, {}))
+        result = publisher_for(handler)._publish_single_article(article(), 'webhook')
+        assert result.status == PublishStatus.SUCCESS
+        assert len(calls) == 2
+
+    def test_transport_errors_are_retried(self, publisher_for, sleeps):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        publisher = publisher_for(handler)
+        result = publisher._publish_single_article(article(), 'webhook')
+        assert result.status == PublishStatus.FAILED
+        assert len(calls) == publisher.max_retries + 1
+
+    def test_backoff_is_jittered_within_the_cap(self, publisher_for, sleeps):
+        handler, _ = respond((500, {}))
+        publisher = publisher_for(handler)
+        publisher._publish_single_article(article(), 'webhook')
+        for attempt, delay in enumerate(sleeps):
+            assert 0 <= delay <= min(publisher.max_delay, publisher.retry_delay * 2 ** attempt)
+
+class TestRetryAfter:
+    def test_retry_after_seconds_is_honoured(self, publisher_for, sleeps):
+        handler, _ = respond((429, {'Retry-After': '2'}), (201, {}))
+        result = publisher_for(handler)._publish_single_article(article(), 'webhook')
+        assert result.status == PublishStatus.SUCCESS
+        assert sleeps == [2.0]
+
+    def test_retry_after_is_capped(self, publisher_for, sleeps):
+        handler, _ = respond((429, {'Retry-After': '900'}))
+        publisher = publisher_for(handler)
+        publisher._publish_single_article(article(), 'webhook')
+        assert sleeps == [publisher.max_delay] * publisher.max_retries
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, None), ("", None), ("5", 5.0), ("-3", 0.0), ("soon", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ])
+    def test_parse_retry_after(self, value, expected):
+        assert APIPublisher._parse_retry_after(value) == expected
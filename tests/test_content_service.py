@@ -0,0 +1,113 @@
+# tests/test_content_service.py
+import hashlib
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from services.content_analyzer import ContentAnalysis, DuplicationResult
+from services.content_service import ContentService
+
+def analysis_for(title, description, article_body, source):
+    if title == "Analysis fails":
+        raise RuntimeError("analyzer unavailable")
+    return ContentAnalysis(
+        quality_score=70,
+        ai_tags=["startup"],
+        ai_summary=f"Summary of {title}",
+        sentiment_score=0.1,
+        readability_score=60.0,
+        key_entities=[],
+        topic_category="funding"
+    )
+
+@pytest.fixture
+def content_service(repository):
+    analyzer = Mock()
+    analyzer.analyze_content.side_effect = analysis_for
+    deduplicator = Mock()
+    deduplicator.generate_content_hash.side_effect = (
+        lambda title, description, body: hashlib.sha256(title.encode()).hexdigest()
+    )
+    deduplicator.check_for_duplicates.return_value = DuplicationResult(is_duplicate=False, similarity_score=0.0)
+    settings = Mock()
+    settings.is_deduplication_enabled.return_value = True
+    return ContentService(repository, analyzer, deduplicator, settings)
+
+def pulled(title, url, **extra):
+    return {'title': title, 'url': url, 'source': 'TestSource', 'description': f"About {title}", **extra}
+
+class TestProcessArticles:
+    def test_mixed_batch_results_follow_input_order(self, content_service):
+        # Stored before the batch, so a later item with the same title hashes as a duplicate
+        saved, _ = content_service.process_article(pulled("Already stored", "https://example.com/stored"))
+        assert saved is True
+
+        batch = [
+            pulled("Startup raises seed round", "https://example.com/1"),
+            {'title': "No URL", 'source': 'TestSource'},
+            pulled("Fintech launches card", "https://example.com/2"),
+            pulled("Different title, same URL", "https://example.com/1"),
+            pulled("Already stored", "https://example.com/3"),
+            pulled("Analysis fails", "https://example.com/4"),
+            pulled("Edtech expands abroad", "https://example.com/5"),
+        ]
+        results = content_service.process_articles(batch)
+
+        statuses = [details['status'] for _, details in results]
+        assert statuses == ['success', 'error', 'success', 'duplicate', 'duplicate', 'error', 'success']
+        assert [success for success, _ in results] == [True, False, True, False, False, False, True]
+        assert 'duplicate_url' in results[3][1]['message']
+        assert 'duplicate_hash' in results[4][1]['message']
+        assert results[5][1]['message'] == "analyzer unavailable"
+
+        saved_ids = [details['article_id'] for success, details in results if success]
+        assert len(set(saved_ids)) == 3
+        for (success, details), article_data in zip(results, batch):
+            if success:
+                assert content_service.repository.get_article_by_id(details['article_id']).url == article_data['url']
+
+    def test_empty_batch(self, content_service):
+        assert content_service.process_articles([]) == []
+
+class TestNearDuplicates:
+    @pytest.fixture
+    def content_service(self, repository, deduplicator):
+        analyzer = Mock()
+        analyzer.analyze_content.side_effect = analysis_for
+        settings = Mock()
+        settings.is_deduplication_enabled.return_value = True
+        return ContentService(repository, analyzer, deduplicator, settings)
+
+    def test_reworded_article_from_a_later_pull_is_dropped(self, content_service):
+        first = pulled("Acme Robotics raises $20M Series B", "https://example.com/acme",
+                       article_body="Acme Robotics raised $20 million led by Sequoia to scale its picking robots.")
+        [(saved, details)] = content_service.process_articles([first])
+        assert saved is True
+
+        reworded = {**first, 'url': "https://other.example.com/acme-funding",
+                    'description': "About the Acme Robotics Series B"}
+        unrelated = pulled("Monsoon session opens in parliament", "https://example.com/monsoon")
+        results = content_service.process_articles([reworded, unrelated])
+
+        assert results[0][0] is False
+        assert results[0][1]['status'] == 'duplicate'
+        assert results[0][1]['similar_article_id'] == details['article_id']
+        assert results[1][0] is True
+        assert len(content_service.repository.get_articles_list()) == 2
+
+class TestParseDate:
+    @pytest.mark.parametrize("value, expected", [
+        ("2025-06-10T14:30:00Z", datetime(2025, 6, 10, 14, 30)),
+        ("2025-06-10 14:30:00", datetime(2025, 6, 10, 14, 30)),
+        ("2025-06-10", datetime(2025, 6, 10)),
+        ("2025-06-10T14:30:00+05:30", datetime(2025, 6, 10, 14, 30, tzinfo=timezone(timedelta(hours=5, minutes=30)))),
+        ("Tue, 10 Jun 2025 14:30:00 +0000", datetime(2025, 6, 10, 14, 30, tzinfo=timezone.utc)),
+        ("June 10, 2025 / 14:30", datetime(2025, 6, 10, 14, 30)),
+        ("10 June, 2025", datetime(2025, 6, 10)),
+    ])
+    def test_supported_formats(self, content_service, value, expected):
+        assert content_service._parse_date(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "yesterday", 20250610])
+    def test_unparseable_values(self, content_service, value):
+        assert content_service._parse_date(value) is None
@@ -0,0 +1,102 @@
+# tests/test_deduplication.py
+import hashlib
+import random
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from models.base import Article
+
+try:
+    from services.deduplication import EnhancedArticleRepository, SemanticDeduplicator, STOP_WORDS
+except LookupError:
+    # The module loads the NLTK stopwords corpus at import time
+    pytest.skip("NLTK stopwords corpus is not available", allow_module_level=True)
+
+def reference_normalize(text):
+    """normalize_text before the regex passes were trimmed"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\b(?:inc42|entrackr|moneycontrol|startupnews|source|image|reuters|pti|ians)\b', '', text)
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'\S+@\S+', '', text)
+    text = re.sub(r'[^\w\s\.]', ' ', text)
+    tokens = (token.rstrip('.') for token in text.split())
+    return ' '.join(token for token in tokens if len(token) > 2 and token not in STOP_WORDS)
+
+VOCABULARY = [
+    "Zepto", "raises", "funding", "the", "of", "Inc42", "Reuters", "source:", "image", "PTI",
+    "https://inc42.com/buzz/zepto-raises/", "http://x.co/a?b=1", "press@zepto.com", "a@b",
+    "U.S.", "e.g.", "startup's", "Rs 1,000", "—", "(IANS)", "valuation.", "\t", "\n\n", "  ", "AI-led", "café",
+]
+
+def random_text(rng):
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 25)))
+
+class TestNormalizeText:
+    def test_known_output(self):
+        text = "Zepto raises $200M (Source: Inc42) — read more at https://inc42.com/buzz/zepto or mail press@zepto.com."
+        assert SemanticDeduplicator.normalize_text(text) == "zepto raises 200m read mail"
+        assert SemanticDeduplicator.normalize_text("") == ""
+        assert SemanticDeduplicator.normalize_text(None) == ""
+
+    def test_matches_reference(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            text = random_text(rng)
+            assert SemanticDeduplicator.normalize_text(text) == reference_normalize(text), text
+
+    def test_comparison_text_matches_normalizing_the_joined_parts(self):
+        rng = random.Random(5)
+        deduplicator = SemanticDeduplicator()
+        for _ in range(200):
+            article = {'title': random_text(rng), 'description': random_text(rng), 'article_body': random_text(rng) * 3}
+            joined = f"{article['title']} {article['description']} {article['article_body'][:500]}"
+            assert deduplicator._prepare_text_for_comparison(article) == reference_normalize(joined)
+
+class TestContentHash:
+    def test_digests(self):
+        deduplicator = SemanticDeduplicator()
+        parts = ("Zepto raises funding", "Quick commerce startup Zepto raised funding.", "Body text " * 200)
+        normalized = (
+            SemanticDeduplicator.normalize_text(parts[0]),
+            SemanticDeduplicator.normalize_text(parts[1]),
+            SemanticDeduplicator.normalize_text(parts[2][:1000]),
+        )
+        content = f"{normalized[0]} {normalized[0]} {normalized[1]} {normalized[2]}".encode()
+
+        current, legacy = deduplicator.generate_content_hashes(*parts)
+        assert current == deduplicator.generate_content_hash(*parts) == hashlib.blake2b(content, digest_size=16).hexdigest()
+        assert legacy == hashlib.sha256(content).hexdigest()
+
+class TestEnhancedArticleRepository:
+    @pytest.fixture
+    def enhanced_repository(self, db_manager):
+        repository = EnhancedArticleRepository(db_manager, Mock())
+        yield repository
+        repository.close()
+
+    def test_rows_with_legacy_sha256_hash_are_still_duplicates(self, enhanced_repository):
+        title, description, body = "Zepto raises funding", "Quick commerce startup Zepto raised funding.", "Body"
+        _, legacy = enhanced_repository.deduplicator.generate_content_hashes(title, description, body)
+        enhanced_repository.db.execute_update(
+            "INSERT INTO articles (title, url, source, description, article_body, content_hash) VALUES (?, ?, ?, ?, ?, ?)",
+            ("Older copy", "https://example.com/old", "Inc42", description, body, legacy)
+        )
+
+        article = Article(id=None, title=title, url="https://example.com/new", source="Other",
+                          description=description, article_body=body)
+        result = enhanced_repository.save_article_with_dedup_check(article)
+        assert result['status'] == 'duplicate'
+        assert result['similar_article']['url'] == "https://example.com/old"
+
+    def test_new_rows_store_the_blake2b_hash(self, enhanced_repository):
+        article = Article(id=None, title="Monsoon session opens", url="https://example.com/monsoon", source="PTI",
+                          description="Parliament convenes.", article_body="Lawmakers debate farm bills.")
+        result = enhanced_repository.save_article_with_dedup_check(article)
+        assert result['status'] == 'saved'
+        assert len(result['content_hash']) == 32
+        assert enhanced_repository.get_article_by_id(article.id).content_hash == result['content_hash']
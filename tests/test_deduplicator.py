@@ -0,0 +1,64 @@
+# tests/test_deduplicator.py
+
+def stored(article_id, title, description, body):
+    return {'id': article_id, 'title': title, 'description': description, 'article_body': body}
+
+FUNDING = stored(
+    1, "Acme Robotics raises $20M Series B",
+    "The warehouse automation startup will expand into Europe.",
+    "Acme Robotics said on Monday it raised $20 million led by Sequoia to scale its picking robots."
+)
+
+class TestIndexMode:
+    def test_empty_index_is_not_a_duplicate(self, deduplicator):
+        assert not deduplicator.check_for_duplicates(FUNDING).is_duplicate
+
+    def test_hash_prefilter_matches_without_encoding(self, deduplicator, sentence_encoder):
+        deduplicator.add_articles([FUNDING])
+        calls = sentence_encoder.calls
+
+        # Same content under another id: punctuation and case don't change the content hash
+        result = deduplicator.check_for_duplicates({**FUNDING, 'id': None, 'title': FUNDING['title'].upper() + "!"})
+        assert result.is_duplicate
+        assert result.similarity_score == 1.0
+        assert result.similar_article_id == 1
+        assert result.confidence == "high"
+        assert sentence_encoder.calls == calls
+
+    def test_reworded_article_matches_on_embeddings(self, deduplicator, sentence_encoder):
+        deduplicator.add_articles([FUNDING])
+        calls = sentence_encoder.calls
+
+        reworded = {**FUNDING, 'id': None, 'description': "The warehouse automation startup plans to expand in Europe."}
+        result = deduplicator.check_for_duplicates(reworded)
+        assert result.is_duplicate
+        assert result.similar_article_id == 1
+        assert result.confidence == "high"
+        assert sentence_encoder.calls == calls + 1
+
+    def test_term_gate_skips_encoder_for_unrelated_text(self, deduplicator, sentence_encoder):
+        deduplicator.add_articles([FUNDING])
+        calls = sentence_encoder.calls
+
+        unrelated = stored(None, "Monsoon session opens in parliament", "Lawmakers debate farm bills.",
+                           "Opposition members walked out during question hour.")
+        assert not deduplicator.check_for_duplicates(unrelated).is_duplicate
+        assert sentence_encoder.calls == calls
+
+    def test_simhash_shortlist_encodes_but_does_not_flag(self, sentence_encoder):
+        from services.content_analyzer import SemanticDeduplicator
+        # Every title of three or more words is a SimHash near-match at this distance
+        deduplicator = SemanticDeduplicator(simhash_max_distance=64)
+        deduplicator.add_articles([FUNDING])
+        calls = sentence_encoder.calls
+
+        unrelated = stored(None, "Monsoon session opens in parliament", "Lawmakers debate farm bills.",
+                           "Opposition members walked out during question hour.")
+        assert not deduplicator.check_for_duplicates(unrelated).is_duplicate
+        assert sentence_encoder.calls == calls + 1
+
+    def test_added_articles_are_encoded_in_one_batch(self, deduplicator, sentence_encoder):
+        articles = [stored(i, f"Headline number {i}", "", f"Body {i}") for i in range(100)]
+        assert deduplicator.add_articles(articles)
+        assert sentence_encoder.calls == 1
+        assert deduplicator.check_for_duplicates({**articles[42], 'id': None}).similar_article_id == 42
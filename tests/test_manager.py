@@ -0,0 +1,34 @@
+# tests/test_manager.py
+import os
+import pytest
+from unittest.mock import Mock
+
+from services.manager import ScraperManager
+
+SLOW_FAILING_SCRIPT = "import sys, time\ntime.sleep(0.4)\nsys.exit(1)\n"
+
+@pytest.fixture
+def manager(temp_dir):
+    script_path = os.path.join(temp_dir, 'slow_scraper.py')
+    with open(script_path, 'w') as script:
+        script.write(SLOW_FAILING_SCRIPT)
+    sources = {name: {'script_path': script_path} for name in ('first', 'second', 'third')}
+    config = {'scrapers': {'max_workers': 1, 'sources': sources}}
+    return ScraperManager(Mock(), Mock(), config, Mock())
+
+class TestRunAll:
+    def test_queued_scrapers_are_timed_from_their_own_start(self, manager):
+        completed = []
+        results = manager.run_all(['first', 'second', 'third'], on_complete=lambda done, name: completed.append(name))
+
+        assert [result['scraper_name'] for result in results] == ['first', 'second', 'third']
+        assert sorted(completed) == ['first', 'second', 'third']
+        for result in results:
+            assert result['status'] == 'failed'
+            # Each run sleeps 0.4s; time spent queued behind the single worker isn't counted
+            assert 0.4 <= result['duration'] < 0.8
+
+    def test_unknown_scraper(self, manager):
+        [result] = manager.run_all(['missing'])
+        assert result['status'] == 'failed'
+        assert result['error_message'] == "Configuration not found"
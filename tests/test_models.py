@@ -0,0 +1,40 @@
+# tests/test_models.py
+from datetime import datetime, timedelta, timezone
+
+from models.base import Article, ArticleStatus
+
+def record(**dates):
+    return {'id': 1, 'title': "Title", 'url': "https://example.com", 'source': "Source",
+            'article_body': "Body", 'status': 'approved', **dates}
+
+class TestFromRecords:
+    def test_naive_dates_parse_in_bulk(self):
+        articles = Article.from_records([
+            record(date="2024-03-01", created_at="2024-03-01 10:15:00"),
+            record(date=None, created_at="2024-03-02T08:00:00.123456", published_at="not a date"),
+        ])
+        assert articles[0].date == datetime(2024, 3, 1)
+        assert articles[0].created_at == datetime(2024, 3, 1, 10, 15)
+        assert articles[1].date is None
+        assert articles[1].created_at == datetime(2024, 3, 2, 8, 0, 0, 123456)
+        assert articles[1].published_at is None
+        assert articles[1].status is ArticleStatus.APPROVED
+
+    def test_mixed_offsets_keep_each_offset(self):
+        ist = timezone(timedelta(hours=5, minutes=30))
+        articles = Article.from_records([
+            record(created_at="2024-03-01T10:00:00+05:30"),
+            record(created_at="2024-03-01T10:00:00+00:00"),
+        ])
+        assert articles[0].created_at == datetime(2024, 3, 1, 10, tzinfo=ist)
+        assert articles[0].created_at.utcoffset() == timedelta(hours=5, minutes=30)
+        assert articles[1].created_at.utcoffset() == timedelta(0)
+
+    def test_naive_mixed_with_aware_stays_naive(self):
+        articles = Article.from_records([
+            record(created_at="2024-03-01 10:00:00"),
+            record(created_at="2024-03-01T10:00:00+05:30"),
+        ])
+        assert articles[0].created_at == datetime(2024, 3, 1, 10)
+        assert articles[0].created_at.tzinfo is None
+        assert articles[1].created_at.utcoffset() == timedelta(hours=5, minutes=30)
@@ -0,0 +1,148 @@
+# tests/test_repository.py
+from unittest.mock import patch
+
+from models.base import Article, ArticleStatus
+from repository.repository import ArticleRepository
+
+
+def make_article(title, url, content_hash=None):
+    return Article(
+        id=None, title=title, url=url, source="TestSource", article_body=f"Body of {title}",
+        content_hash=content_hash or f"hash-{title}"
+    )
+
+
+class TestActivityLogs:
+    def test_failed_flush_keeps_batch(self, repository):
+        repository.log_activity("First", "one")
+        repository.log_activity("Second", "two")
+        with patch.object(repository.db, 'execute_many', return_value=None):
+            repository.flush_activity_logs()
+        assert [entry[0] for entry in repository._log_queue] == ["First", "Second"]
+
+        repository.flush_activity_logs()
+        assert repository.count_activity_logs() == 2
+
+    def test_close_stops_flusher_and_flushes(self, repository):
+        repository.log_activity("Closing", "pending entry")
+        repository.close()
+        assert not repository._log_flusher.is_alive()
+        assert not repository._log_queue
+        assert repository.count_activity_logs() == 1
+
+
+class TestSaveArticles:
+    def test_batch_assigns_ids_and_flags_duplicates(self, repository):
+        repository.save_article(make_article("Stored", "https://example.com/stored"))
+        batch = [
+            make_article("New", "https://example.com/new"),
+            make_article("Stored", "https://example.com/other"),
+            make_article("Other", "https://example.com/stored"),
+            make_article("New", "https://example.com/new-again"),
+        ]
+        results = repository.save_articles(batch)
+
+        assert results == [
+            (True, "success"), (False, "duplicate_hash"), (False, "duplicate_url"), (False, "duplicate_hash")
+        ]
+        assert batch[0].id is not None
+        assert batch[0].display_id == f"st-n-{batch[0].id}"
+        assert repository.get_article_by_id(batch[0].id).url == "https://example.com/new"
+
+    def test_rows_written_after_existence_check_are_not_claimed(self, repository):
+        # Another writer stores the same URL, and the same hash under a new URL, after the bulk check
+        repository.save_article(make_article("Theirs", "https://example.com/raced"))
+        repository.save_article(make_article("Same hash", "https://example.com/elsewhere", content_hash="shared"))
+        theirs_id = repository.get_article_by_hash("hash-Theirs").id
+        batch = [
+            make_article("Ours", "https://example.com/raced"),
+            make_article("Ours too", "https://example.com/fresh", content_hash="shared"),
+        ]
+        with patch.object(ArticleRepository, '_existing_values', return_value=set()):
+            results = repository.save_articles(batch)
+
+        assert results == [(False, "duplicate_url"), (False, "duplicate_hash")]
+        assert batch[0].id is None
+        assert repository.get_article_by_id(theirs_id).title == "Theirs"
+
+
+class TestPagination:
+    def test_pages_cover_mixed_created_at_formats_once(self, repository):
+        for i in range(5):
+            repository.save_article(make_article(f"Article {i}", f"https://example.com/{i}"))
+        # Rows stamped by SQLite and rows written from Python isoformat() sit side by side
+        stored = [
+            "2025-06-10 09:00:00", "2025-06-10T09:00:00", "2025-06-10T09:00:00.500000",
+            "2025-06-10 09:00:00", "2025-06-11 08:00:00",
+        ]
+        for article_id, created_at in zip(range(1, 6), stored):
+            repository.db.execute_update("UPDATE articles SET created_at = ? WHERE id = ?", (created_at, article_id))
+
+        seen = []
+        cursor = (None, None)
+        while True:
+            page = repository.get_articles_list(limit=2, cursor_created_at=cursor[0], cursor_id=cursor[1])
+            if not page:
+                break
+            seen.extend(article.id for article in page)
+            cursor = repository.next_page_cursor(page)
+
+        assert seen == [5, 3, 2, 4, 1]
+        assert repository.next_page_cursor([]) is None
+
+    def test_filters_apply_with_cursor(self, repository):
+        for i in range(4):
+            repository.save_article(make_article(f"Article {i}", f"https://example.com/{i}"))
+        repository.update_article_status([1, 3, 4], ArticleStatus.APPROVED)
+
+        first = repository.get_articles_list(status_filter='approved', limit=2)
+        rest = repository.get_articles_list(status_filter='approved', limit=2, cursor_created_at=repository.next_page_cursor(first)[0],
+                                            cursor_id=repository.next_page_cursor(first)[1])
+        assert sorted(article.id for article in first + rest) == [1, 3, 4]
+
+
+class TestSearch:
+    def test_terms_are_quoted_as_prefixes(self):
+        assert ArticleRepository._fts_match_expression('ai  robot') == '"ai"* "robot"*'
+        assert ArticleRepository._fts_match_expression('say "hi" OR (x') == '"say"* """hi"""* "OR"* "(x"*'
+        assert ArticleRepository._fts_match_expression('   ') is None
+
+    def test_search_matches_prefixes_and_tolerates_query_syntax(self, repository):
+        repository.save_article(make_article("Acme Robotics raises funding", "https://example.com/acme"))
+        repository.save_article(make_article("Monsoon session opens", "https://example.com/monsoon"))
+
+        assert repository.db.fts_enabled
+        assert [a.title for a in repository.get_articles_list(search_term="robot")] == ["Acme Robotics raises funding"]
+        assert [a.title for a in repository.get_articles_list(search_term="acme raises")] == ["Acme Robotics raises funding"]
+        for term in ['"unbalanced', 'NEAR(acme', 'acme AND', '*', 'title:acme']:
+            assert repository.get_articles_list(search_term=term) is not None
+
+
+class TestStatsCounters:
+    def test_counters_follow_inserts_status_updates_and_clear(self, repository):
+        for i in range(3):
+            repository.save_article(make_article(f"Article {i}", f"https://example.com/{i}"))
+        stats = repository.get_dashboard_stats()
+        assert stats['total_articles'] == 3
+        assert stats['status_counts'] == {'pulled': 3}
+
+        repository.update_article_status([1, 2], ArticleStatus.APPROVED)
+        repository.update_article_status([2], ArticleStatus.APPROVED)
+        repository.update_article_status([2], ArticleStatus.PUBLISHED)
+        stats = repository.get_dashboard_stats()
+        assert stats['total_articles'] == 3
+        assert stats['status_counts'] == {'pulled': 1, 'approved': 1, 'published': 1}
+        assert stats['published_today'] == 1
+
+        assert repository.clear_all_articles()
+        stats = repository.get_dashboard_stats()
+        assert stats['total_articles'] == 0
+        assert stats['status_counts'] == {}
+
+    def test_counters_match_table_contents(self, repository):
+        repository.save_articles([make_article(f"Batch {i}", f"https://example.com/b{i}") for i in range(5)])
+        repository.update_article_status([2, 4], ArticleStatus.REJECTED)
+        counted = dict(repository.db.execute_query_tuples("SELECT status, COUNT(*) FROM articles GROUP BY status"))
+        stats = repository.get_dashboard_stats()
+        assert stats['total_articles'] == sum(counted.values())
+        assert stats['status_counts'] == counted